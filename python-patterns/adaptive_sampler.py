@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Adaptive Patch Sampler
+Measure only where the fitted tone response is still uncertain
+"""
+
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+from color_difference import delta_e_xyz
+from measurement_store import MeasurementStore
+
+# measure_many(patches) -> XYZ (N, 3), or None when the user aborted
+MeasureMany = Callable[[Sequence], Optional[np.ndarray]]
+
+PRIMARY_PATCHES = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+
+@dataclass
+class SamplerResult:
+    """Readings taken and how well the final curve is pinned down"""
+    store: MeasurementStore
+    levels: np.ndarray
+    estimated_error: float  # worst predicted ΔE2000 between gray samples
+    additivity_error: float  # ΔE2000 of R+G+B against measured white
+    rounds: int
+    history: List[float] = field(default_factory=list)
+
+
+class AdaptiveSampler:
+    """Grow a gray ramp where linear interpolation error is highest"""
+    
+    def __init__(self, measure_many: MeasureMany, error_target: float = 0.5,
+                 max_patches: int = 64, initial_levels: int = 5, batch_size: int = 1):
+        self.measure_many = measure_many
+        self.error_target = error_target
+        self.max_patches = max_patches
+        self.initial_levels = max(initial_levels, 3)
+        # More than one patch per round keeps parallel instruments busy
+        self.batch_size = batch_size
+        
+    @staticmethod
+    def _interval_errors(levels: np.ndarray, xyz: np.ndarray, white: np.ndarray) -> np.ndarray:
+        """Predicted midpoint error of every gap between measured levels"""
+        # Leave-one-out: how badly neighbours predict each interior sample
+        h = np.diff(levels)
+        t = (levels[1:-1] - levels[:-2]) / (levels[2:] - levels[:-2])
+        predicted = xyz[:-2] + t[:, None] * (xyz[2:] - xyz[:-2])
+        loo = delta_e_xyz(xyz[1:-1], predicted, white)
+        
+        # Interpolation error grows with the square of the span; scale the
+        # leave-one-out error (span h_left + h_right) to each gap
+        span = levels[2:] - levels[:-2]
+        left = loo * (h[:-1] / span) ** 2
+        right = loo * (h[1:] / span) ** 2
+        
+        errors = np.zeros(len(h))
+        errors[:-1] = np.maximum(errors[:-1], left)
+        errors[1:] = np.maximum(errors[1:], right)
+        
+        # Gaps a code value wide cannot be refined
+        errors[h <= 1.0] = 0.0
+        return errors
+        
+    def run(self) -> SamplerResult:
+        """Sample the display, returns every reading taken"""
+        store = MeasurementStore()
+        
+        levels = np.round(np.linspace(0, 255, self.initial_levels))
+        patches = [tuple([v] * 3) for v in levels] + PRIMARY_PATCHES
+        xyz = self.measure_many(patches)
+        if xyz is None:
+            return SamplerResult(store, levels, np.inf, np.inf, 0)
+        xyz = np.asarray(xyz, dtype=np.float64)
+        store.extend(patches, xyz)
+        
+        gray = xyz[:len(levels)]
+        white = gray[-1]
+        black = gray[0]
+        
+        # Channel additivity: R + G + B should reproduce white (black counted once)
+        additive = xyz[len(levels):].sum(axis=0) - 2.0 * black
+        additivity_error = float(delta_e_xyz(white, additive, white))
+        
+        history = []
+        rounds = 0
+        errors = self._interval_errors(levels, gray, white)
+        
+        while len(store) < self.max_patches and errors.max() > self.error_target:
+            # Midpoints of the worst gaps this round
+            count = min(self.batch_size, self.max_patches - len(store), int((errors > 0).sum()))
+            worst = np.sort(np.argsort(errors)[::-1][:count])
+            new_levels = np.round((levels[worst] + levels[worst + 1]) / 2.0)
+            
+            new_patches = [tuple([v] * 3) for v in new_levels]
+            new_xyz = self.measure_many(new_patches)
+            if new_xyz is None:
+                break
+            new_xyz = np.asarray(new_xyz, dtype=np.float64)
+            store.extend(new_patches, new_xyz)
+            
+            # Actual residual of the curve before this round, for the record
+            predicted = np.stack([np.interp(new_levels, levels, gray[:, c]) for c in range(3)], axis=-1)
+            history.append(float(delta_e_xyz(new_xyz, predicted, white).max()))
+            
+            order = np.argsort(np.concatenate([levels, new_levels]), kind='stable')
+            levels = np.concatenate([levels, new_levels])[order]
+            gray = np.concatenate([gray, new_xyz])[order]
+            errors = self._interval_errors(levels, gray, white)
+            rounds += 1
+            
+        return SamplerResult(store, levels, float(errors.max()), additivity_error, rounds, history)
+        
+    def add_to_profile(self, profile, result: Optional[SamplerResult] = None) -> SamplerResult:
+        """Sample (unless given a result) and feed readings relative to white into an ICCProfile"""
+        result = result or self.run()
+        
+        rgb = result.store.rgb
+        xyz = result.store.xyz
+        white = xyz[(rgb == 255).all(axis=1)]
+        scale = white[-1, 1] if len(white) else 1.0
+        
+        profile.add_measurements(rgb, xyz / scale)
+        
+        return result
\ No newline at end of file
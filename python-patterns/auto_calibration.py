@@ -5,13 +5,25 @@ Guided calibration workflow with step-by-step instructions
 """
 
 import pygame
+import numpy as np
 import sys
 import time
 import json
+import argparse
+import asyncio
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
 
+from calibration_journal import DEFAULT_JOURNAL, CalibrationJournal, SessionState
+from frame_scheduler import FrameScheduler
+from closed_loop import converge_gamma, converge_white_point, srgb_reference, target_white_xy
+from color_difference import delta_e_stats, delta_e_xyz
+from measurement_device import MeasurementDevice
+from measurement_scheduler import Instrument, MeasurementScheduler, Reading
+from measurement_store import MeasurementStore
+from uniformity import UniformityResult, measurement_plan
+
 # Initialize Pygame
 pygame.init()
 
@@ -34,6 +46,14 @@ class CalibrationSettings:
     target_brightness: int = 120  # cd/m²
     ambient_light: str = "medium"
     use_case: str = "general"  # general, photo, video, gaming
+    gamma_tolerance: float = 0.5  # ΔE2000 at mid-gray
+    white_point_tolerance: float = 0.001  # Δuv
+    accuracy_tolerance: float = 2.0  # mean ΔE2000 over the accuracy patches
+    accuracy_max_tolerance: float = 5.0  # worst patch ΔE2000
+    max_iterations: int = 8
+    uniformity_grid: Tuple[int, int] = (5, 5)  # rows, columns
+    uniformity_levels: Tuple[int, ...] = (128, 255)
+    uniformity_tolerance: float = 10.0  # max % luminance deviation from center
 
 @dataclass
 class TestResult:
@@ -47,12 +67,32 @@ class TestResult:
 class AutoCalibrationSuite:
     """Automated calibration workflow"""
     
-    def __init__(self, resolution=(1920, 1080)):
+    # Color checker pattern
+    ACCURACY_PATCHES = [
+        ((139, 69, 19), "Brown"),
+        ((255, 105, 180), "Pink"),
+        ((255, 165, 0), "Orange"),
+        ((255, 255, 0), "Yellow"),
+        ((0, 128, 0), "Green"),
+        ((0, 191, 255), "Sky Blue"),
+        ((75, 0, 130), "Indigo"),
+        ((238, 130, 238), "Violet"),
+        ((255, 0, 0), "Red"),
+        ((0, 0, 255), "Blue"),
+        ((255, 255, 255), "White"),
+        ((128, 128, 128), "Gray")
+    ]
+    
+    def __init__(self, resolution=(1920, 1080), device: Optional[MeasurementDevice] = None,
+                 journal: Optional[str] = None, screen: Optional[pygame.Surface] = None,
+                 settings: Optional[CalibrationSettings] = None):
         self.width, self.height = resolution
-        self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
+        if screen is None:
+            screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
+        self.screen = screen
         pygame.display.set_caption("NEONpulseTechshop Auto Calibration")
         
-        self.clock = pygame.time.Clock()
+        self.frames = FrameScheduler(60)
         self.font = pygame.font.Font(None, 48)
         self.medium_font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
@@ -66,12 +106,32 @@ class AutoCalibrationSuite:
         
         # Calibration state
         self.current_step = CalibrationStep.WELCOME
-        self.settings = CalibrationSettings()
+        self.settings = settings or CalibrationSettings()
         self.results = []
-        self.step_start_time = time.time()
+        self.session_start = time.time()
+        self.step_start_time = self.session_start
         self.running = True
         self.waiting_for_user = False
         
+        # Optional colorimeter - None keeps the visual, user-driven workflow
+        self.device = device
+        self.settle_time = 0.25
+        self.deadline = None  # time.monotonic() limit for unattended runs
+        self.measurements = MeasurementStore()
+        
+        # Closed-loop results from automatic mode
+        self.gamma_correction = 1.0
+        self.white_gains = (1.0, 1.0, 1.0)
+        self.auto_status = {}
+        self.iterations = {}
+        self.completed_steps = {}
+        self.uniformity = None
+        self.uniformity_surface = None
+        
+        # Step screens are composed once; only the overlay is redrawn
+        self.step_cache = {}
+        self.progress_cache = None
+        
         # Step definitions
         self.steps = {
             CalibrationStep.WELCOME: self.welcome_screen,
@@ -95,6 +155,15 @@ class AutoCalibrationSuite:
             CalibrationStep.COMPLETE
         ]
         
+        # Session journal - picks up an interrupted session where it stopped;
+        # explicit settings are kept rather than replaced by the journal's
+        self.journal = None
+        if journal is not None:
+            self.journal, state = CalibrationJournal.open_session(
+                journal, asdict(self.settings), keep_settings=settings is not None)
+            if state is not None:
+                self.restore_session(state)
+                
     def draw_header(self, title: str, subtitle: str = ""):
         """Draw common header"""
         # Background
@@ -107,7 +176,7 @@ class AutoCalibrationSuite:
             color = tuple(int(c * color_factor) for c in self.NEON_MAGENTA)
             pygame.draw.line(self.screen, color, 
                            (0, 115 + i), (self.width, 115 + i), 1)
-        
+                           
         # Title
         title_text = self.font.render(title, True, self.NEON_MAGENTA)
         title_rect = title_text.get_rect(center=(self.width // 2, 40))
@@ -125,6 +194,12 @@ class AutoCalibrationSuite:
         total_steps = len(self.step_order) - 1  # Don't count welcome
         progress = current_index / total_steps
         
+        # Label only changes with the step
+        if self.progress_cache is None or self.progress_cache[0] != current_index:
+            progress_text = f"Step {current_index + 1} of {total_steps + 1}"
+            self.progress_cache = (current_index,
+                                   self.small_font.render(progress_text, True, self.WHITE))
+                                   
         # Progress bar background
         bar_width = self.width - 200
         bar_height = 20
@@ -133,15 +208,14 @@ class AutoCalibrationSuite:
         
         pygame.draw.rect(self.screen, self.GRAY, 
                         (bar_x, bar_y, bar_width, bar_height))
-        
+                        
         # Progress fill
         fill_width = int(bar_width * progress)
         pygame.draw.rect(self.screen, self.NEON_GREEN,
                         (bar_x, bar_y, fill_width, bar_height))
-        
+                        
         # Progress text
-        progress_text = f"Step {current_index + 1} of {total_steps + 1}"
-        text = self.small_font.render(progress_text, True, self.WHITE)
+        text = self.progress_cache[1]
         text_rect = text.get_rect(center=(self.width // 2, bar_y + bar_height + 20))
         self.screen.blit(text, text_rect)
         
@@ -190,6 +264,19 @@ class AutoCalibrationSuite:
             self.screen.blit(text, text_rect)
             y += 25
             
+    def draw_auto_controls(self, controls: List[str]):
+        """Controls plus automatic mode status when a device is attached"""
+        if self.device is not None:
+            controls.insert(1, "Press A to solve automatically")
+            
+            status = self.auto_status.get(self.current_step)
+            if status:
+                text = self.medium_font.render(status, True, self.NEON_GREEN)
+                text_rect = text.get_rect(center=(self.width // 2, self.height - 190))
+                self.screen.blit(text, text_rect)
+                
+        self.draw_controls(controls)
+        
     def welcome_screen(self):
         """Welcome and setup screen"""
         self.screen.fill(self.BLACK)
@@ -258,7 +345,7 @@ class AutoCalibrationSuite:
         
         self.draw_header("Step 1: Brightness Calibration", 
                         "Adjust display brightness for optimal black levels")
-        
+                        
         # PLUGE pattern for brightness adjustment
         pluge_height = 200
         pluge_y = 200
@@ -299,7 +386,6 @@ class AutoCalibrationSuite:
         self.draw_instructions(instructions, pluge_y + pluge_height + 50)
         
         # Progress and controls
-        self.draw_progress_bar()
         controls = [
             "Adjust monitor BRIGHTNESS control",
             "Press SPACE when adjustment is complete",
@@ -313,7 +399,7 @@ class AutoCalibrationSuite:
         
         self.draw_header("Step 2: Contrast Calibration",
                         "Adjust display contrast for optimal white levels")
-        
+                        
         # White level test pattern
         white_height = 200
         white_y = 200
@@ -346,7 +432,6 @@ class AutoCalibrationSuite:
         
         self.draw_instructions(instructions, white_y + white_height + 50)
         
-        self.draw_progress_bar()
         controls = [
             "Adjust monitor CONTRAST control",
             "Press SPACE when adjustment is complete",
@@ -360,7 +445,7 @@ class AutoCalibrationSuite:
         
         self.draw_header("Step 3: Gamma Calibration",
                         f"Target: {self.settings.target_gamma}")
-        
+                        
         # Gamma test pattern
         gamma_y = 180
         gamma_height = 300
@@ -413,13 +498,12 @@ class AutoCalibrationSuite:
         
         self.draw_instructions(instructions, gamma_y + square_size + 150)
         
-        self.draw_progress_bar()
         controls = [
             "Adjust gamma until pattern matches gray bar",
             "Press SPACE when adjustment is complete",
             "Press B to go back"
         ]
-        self.draw_controls(controls)
+        self.draw_auto_controls(controls)
         
     def white_point_calibration(self):
         """White point calibration step"""
@@ -427,7 +511,7 @@ class AutoCalibrationSuite:
         
         self.draw_header("Step 4: White Point Calibration",
                         f"Target: {self.settings.target_white_point}")
-        
+                        
         # White point comparison
         comparison_height = 200
         comparison_y = 200
@@ -462,13 +546,12 @@ class AutoCalibrationSuite:
         
         self.draw_instructions(instructions, comparison_y + comparison_height + 50)
         
-        self.draw_progress_bar()
         controls = [
             "Adjust monitor COLOR TEMPERATURE",
             "Press SPACE when whites match",
             "Press B to go back"
         ]
-        self.draw_controls(controls)
+        self.draw_auto_controls(controls)
         
     def color_accuracy_test(self):
         """Color accuracy verification"""
@@ -476,22 +559,8 @@ class AutoCalibrationSuite:
         
         self.draw_header("Step 5: Color Accuracy Test",
                         "Verify color reproduction")
-        
-        # Color checker pattern
-        colors = [
-            ((139, 69, 19), "Brown"),
-            ((255, 105, 180), "Pink"),
-            ((255, 165, 0), "Orange"),
-            ((255, 255, 0), "Yellow"),
-            ((0, 128, 0), "Green"),
-            ((0, 191, 255), "Sky Blue"),
-            ((75, 0, 130), "Indigo"),
-            ((238, 130, 238), "Violet"),
-            ((255, 0, 0), "Red"),
-            ((0, 0, 255), "Blue"),
-            ((255, 255, 255), "White"),
-            ((128, 128, 128), "Gray")
-        ]
+                        
+        colors = self.ACCURACY_PATCHES
         
         patch_size = 120
         cols = 4
@@ -526,28 +595,41 @@ class AutoCalibrationSuite:
         
         self.draw_instructions(instructions, start_y + rows * patch_size * 1.1 + 30)
         
-        self.draw_progress_bar()
         controls = [
             "Verify colors appear natural",
             "Press SPACE if colors look good",
             "Press B to go back"
         ]
+        if self.device is not None:
+            controls.insert(1, f"Press M to measure with {self.device.name}")
+            
+            status = self.auto_status.get(self.current_step)
+            if status:
+                text = self.medium_font.render(status, True, self.NEON_GREEN)
+                text_rect = text.get_rect(center=(self.width // 2, self.height - 190))
+                self.screen.blit(text, text_rect)
+                
         self.draw_controls(controls)
         
     def uniformity_test(self):
         """Display uniformity test"""
-        self.screen.fill(self.GRAY)
-        
+        if self.uniformity_surface is not None:
+            # Measured heatmap in place of the gray field
+            self.screen.blit(self.uniformity_surface, (0, 0))
+        else:
+            self.screen.fill(self.GRAY)
+            
         self.draw_header("Step 6: Uniformity Test",
                         "Check for brightness and color uniformity")
-        
+                        
         # Grid overlay for reference
-        grid_spacing = 100
-        for x in range(0, self.width, grid_spacing):
-            pygame.draw.line(self.screen, self.WHITE, (x, 120), (x, self.height - 100), 1)
-        for y in range(120, self.height - 100, grid_spacing):
-            pygame.draw.line(self.screen, self.WHITE, (0, y), (self.width, y), 1)
-            
+        if self.uniformity_surface is None:
+            grid_spacing = 100
+            for x in range(0, self.width, grid_spacing):
+                pygame.draw.line(self.screen, self.WHITE, (x, 120), (x, self.height - 100), 1)
+            for y in range(120, self.height - 100, grid_spacing):
+                pygame.draw.line(self.screen, self.WHITE, (0, y), (self.width, y), 1)
+                
         # Instructions overlay
         instruction_bg = pygame.Rect(50, self.height - 150, self.width - 100, 100)
         pygame.draw.rect(self.screen, self.BLACK, instruction_bg)
@@ -558,7 +640,17 @@ class AutoCalibrationSuite:
             "The gray background should appear uniform throughout.",
             "Some variation is normal, especially near edges."
         ]
-        
+        if self.uniformity is not None:
+            metrics = self.uniformity.zone_metrics()
+            instructions = [
+                f"Uniformity {metrics['uniformity']:.1f}% (min/max), "
+                f"max deviation {metrics['max_deviation']:.1f}% from center",
+                f"Max Δuv {metrics['max_delta_uv']:.4f}, max ΔE2000 {metrics['max_delta_e']:.2f}",
+                "Press M to measure again" if self.device is not None else ""
+            ]
+        elif self.device is not None:
+            instructions[2] = f"Press M to measure a grid with {self.device.name}"
+            
         y = self.height - 140
         for instruction in instructions:
             text = self.small_font.render(instruction, True, self.WHITE)
@@ -566,8 +658,7 @@ class AutoCalibrationSuite:
             self.screen.blit(text, text_rect)
             y += 25
             
-        self.draw_progress_bar()
-        
+            
     def completion_screen(self):
         """Calibration completion screen"""
         self.screen.fill(self.BLACK)
@@ -631,17 +722,264 @@ class AutoCalibrationSuite:
         """Advance to next calibration step"""
         current_index = self.step_order.index(self.current_step)
         if current_index < len(self.step_order) - 1:
-            self.current_step = self.step_order[current_index + 1]
-            self.step_start_time = time.time()
+            self.goto_step(self.step_order[current_index + 1])
             
     def previous_step(self):
         """Go back to previous step"""
         current_index = self.step_order.index(self.current_step)
         if current_index > 0:
-            self.current_step = self.step_order[current_index - 1]
-            self.step_start_time = time.time()
+            self.goto_step(self.step_order[current_index - 1])
+            
+    def goto_step(self, step: CalibrationStep):
+        """Switch to a step and journal the transition"""
+        self.current_step = step
+        self.step_start_time = time.time()
+        self.frames.invalidate()
+        self.log_event('step', sync=True, step=step.value)
+        
+    def invalidate(self, step: Optional[CalibrationStep] = None):
+        """Recompose a step screen (all of them by default) on next draw"""
+        if step is None:
+            self.step_cache.clear()
+        else:
+            self.step_cache.pop(step, None)
+        self.frames.invalidate()
+        
+    def step_surface(self, step: CalibrationStep) -> pygame.Surface:
+        """Screen for a step, composed once and reused while it is unchanged"""
+        if step not in self.step_cache:
+            surface = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            
+            # Step methods draw to self.screen, so point it at the cache
+            screen = self.screen
+            self.screen = surface
+            try:
+                self.steps[step]()
+            finally:
+                self.screen = screen
+                
+            self.step_cache[step] = surface
+            
+        return self.step_cache[step]
+        
+    def draw(self):
+        """Cached step screen plus overlays; returns True if the frame changed"""
+        # Wizard screens are static, so only input or a state change redraws
+        if not self.frames.needs_frame():
+            return False
             
-    def save_calibration_report(self):
+        self.screen.blit(self.step_surface(self.current_step), (0, 0))
+        if self.current_step not in (CalibrationStep.WELCOME, CalibrationStep.COMPLETE):
+            self.draw_progress_bar()
+            
+        return True
+        
+    def log_event(self, event: str, sync: bool = False, **data):
+        """Append to the session journal, if one is open"""
+        if self.journal is not None:
+            self.journal.append(event, sync=sync, **data)
+            
+    def record_result(self, result: TestResult):
+        """Keep a test result and journal it"""
+        self.results.append(result)
+        self.log_event('result', result=asdict(result))
+        
+    def restore_session(self, state: SessionState):
+        """Continue a journaled session: step, settings, results and readings"""
+        self.session_start = state.session_start
+        if state.settings:
+            self.settings = CalibrationSettings(**state.settings)
+        if state.step:
+            self.current_step = CalibrationStep(state.step)
+        self.results = [TestResult(**result) for result in state.results]
+        
+        for record in state.measurements:
+            self.measurements.current_sweep = record['sweep']
+            self.measurements.append(record['rgb'], record['xyz'], record['time'])
+            
+        if 'gamma_correction' in state.corrections:
+            self.gamma_correction = state.corrections['gamma_correction']
+        if 'white_gains' in state.corrections:
+            self.white_gains = tuple(state.corrections['white_gains'])
+        self.completed_steps = dict(state.completed_steps)
+        
+        print(f"Resumed session at {self.current_step.value} "
+              f"({len(self.results)} results, {len(state.measurements)} readings)")
+              
+    def measurement_region(self, size: int = 0) -> Tuple[int, int, int, int]:
+        """Centered patch window the instrument is placed over"""
+        size = size or self.height // 3
+        return ((self.width - size) // 2, (self.height - size) // 2, size, size)
+        
+    def measure_patches(self, patches, instruments: Optional[List[Instrument]] = None) -> List[Reading]:
+        """Show and read patches through the asyncio measurement pipeline"""
+        if instruments is None:
+            if self.device is None:
+                raise RuntimeError("No measurement device attached")
+            instruments = [Instrument(self.device, self.measurement_region())]
+            
+        self.screen.fill(self.BLACK)
+        pygame.display.flip()
+        
+        sweep = self.measurements.new_sweep()
+        
+        def record(reading: Reading):
+            # Kept as each reading arrives, so an interrupted sweep loses none
+            self.measurements.append(reading.rgb, reading.xyz)
+            self.log_event('measurement', rgb=list(reading.rgb),
+                           xyz=reading.xyz.tolist(), sweep=sweep)
+                           
+        scheduler = MeasurementScheduler(self.screen, instruments,
+                                         settle_time=self.settle_time,
+                                         on_reading=record,
+                                         deadline=self.deadline)
+        readings = asyncio.run(scheduler.run(patches))
+        
+        # Patches were drawn straight to the screen
+        self.frames.invalidate()
+        return readings
+        
+    def corrected_patch(self, rgb) -> Tuple[float, float, float]:
+        """Code values with the solved gamma and white point corrections applied"""
+        level = np.asarray(rgb, dtype=np.float64) / 255.0
+        return tuple(255.0 * np.asarray(self.white_gains) * level ** self.gamma_correction)
+        
+    def measure_color_accuracy(self, patches=None) -> Optional[Dict]:
+        """Read patches through the corrections and score them in ΔE2000 against sRGB"""
+        if patches is None:
+            patches = [rgb for rgb, _ in self.ACCURACY_PATCHES]
+            
+        # White comes first; its reading anchors the reference
+        shown = [self.corrected_patch(rgb) for rgb in [(255, 255, 255)] + list(patches)]
+        readings = self.measure_patches(shown)
+        if len(readings) != len(shown):
+            return None
+            
+        xyz = np.array([reading.xyz for reading in readings])
+        white = xyz[0]
+        reference = srgb_reference(patches, white, self.settings.target_gamma)
+        delta = delta_e_xyz(reference, xyz[1:], white)
+        stats = {name: float(value) for name, value in delta_e_stats(delta).items()}
+        
+        passed = (stats['mean'] <= self.settings.accuracy_tolerance
+                  and stats['max'] <= self.settings.accuracy_max_tolerance)
+        self.record_result(TestResult(
+            test_name="Color accuracy",
+            passed=passed,
+            measured_value=stats['mean'],
+            target_value=self.settings.accuracy_tolerance,
+            notes=f"max ΔE2000 {stats['max']:.2f}, p95 {stats['p95']:.2f} over {len(patches)} patches"
+        ))
+        
+        self.auto_status[CalibrationStep.COLOR_ACCURACY] = (
+            f"mean ΔE {stats['mean']:.2f}, max {stats['max']:.2f} - "
+            f"{'passed' if passed else 'failed'}")
+        self.invalidate(CalibrationStep.COLOR_ACCURACY)
+        return {
+            'passed': passed,
+            'reference': reference.tolist(),
+            'measured': xyz[1:].tolist(),
+            'white': white.tolist(),
+            'delta_e': delta.tolist(),
+            'delta_e_stats': stats
+        }
+        
+    def measure_uniformity(self) -> Optional[UniformityResult]:
+        """Read the uniformity grid and export heatmaps and zone metrics"""
+        rows, cols = self.settings.uniformity_grid
+        levels = list(self.settings.uniformity_levels)
+        patches, slots = measurement_plan((0, 0, self.width, self.height), rows, cols, levels)
+        
+        readings = self.measure_patches(patches)
+        if len(readings) != len(patches):
+            return None
+            
+        result = UniformityResult.from_readings((self.width, self.height), levels,
+                                                rows, cols, slots, readings)
+        files = result.export(f"uniformity_{int(time.time())}")
+        
+        metrics = result.zone_metrics()
+        self.record_result(TestResult(
+            test_name="Uniformity",
+            passed=metrics['max_deviation'] <= self.settings.uniformity_tolerance,
+            measured_value=metrics['max_deviation'],
+            target_value=self.settings.uniformity_tolerance,
+            notes=f"{metrics['uniformity']:.1f}% min/max, max Δuv {metrics['max_delta_uv']:.4f}, "
+                  f"{rows}x{cols} zones, {files['json']}"
+        ))
+        
+        self.uniformity = result
+        self.uniformity_surface = result.heatmap_surface()
+        self.invalidate(CalibrationStep.UNIFORMITY)
+        return result
+        
+    def read_patch(self, rgb) -> Optional[np.ndarray]:
+        """Single reading through the pipeline, None if the user cancelled"""
+        readings = self.measure_patches([rgb])
+        return readings[0].xyz if readings else None
+        
+    def auto_gamma(self):
+        """Solve the gamma correction from readings"""
+        target = self.settings.target_gamma
+        correction, iterations = converge_gamma(
+            self.read_patch, target,
+            tolerance=self.settings.gamma_tolerance,
+            max_iterations=self.settings.max_iterations
+        )
+        
+        for it in iterations:
+            self.record_result(TestResult(
+                test_name=f"Gamma iteration {it.step + 1}",
+                passed=it.converged,
+                measured_value=float(it.measured),
+                target_value=target,
+                notes=f"correction {it.parameters[0]:.4f}, ΔE2000 {it.error:.2f}"
+            ))
+            
+        self.iterations[CalibrationStep.GAMMA] = iterations
+        self.invalidate(CalibrationStep.GAMMA)
+        if iterations:
+            self.gamma_correction = correction
+            self.log_event('corrections', corrections={'gamma_correction': correction})
+            last = iterations[-1]
+            state = "converged" if last.converged else "not converged"
+            self.auto_status[CalibrationStep.GAMMA] = (
+                f"γ {last.measured:.2f}, ΔE {last.error:.2f} - {state} "
+                f"after {len(iterations) + 1} readings")
+                
+    def auto_white_point(self):
+        """Solve RGB gains for the target white point from readings"""
+        target = self.settings.target_white_point
+        gains, iterations = converge_white_point(
+            self.read_patch, target_white_xy(target),
+            tolerance=self.settings.white_point_tolerance,
+            max_iterations=self.settings.max_iterations,
+            gamma=self.settings.target_gamma
+        )
+        target_cct = float(target.upper().rstrip('K'))
+        
+        for it in iterations:
+            gains_text = ", ".join(f"{g:.4f}" for g in it.parameters)
+            self.record_result(TestResult(
+                test_name=f"White point iteration {it.step + 1}",
+                passed=it.converged,
+                measured_value=it.measured,
+                target_value=target_cct,
+                notes=f"gains ({gains_text}), Δuv {it.error:.4f}"
+            ))
+            
+        self.iterations[CalibrationStep.WHITE_POINT] = iterations
+        self.invalidate(CalibrationStep.WHITE_POINT)
+        if iterations:
+            self.white_gains = tuple(float(g) for g in gains)
+            self.log_event('corrections', corrections={'white_gains': list(self.white_gains)})
+            last = iterations[-1]
+            state = "converged" if last.converged else "not converged"
+            self.auto_status[CalibrationStep.WHITE_POINT] = (
+                f"{last.measured:.0f}K, Δuv {last.error:.4f} - {state} "
+                f"after {len(iterations)} readings")
+                
+    def save_calibration_report(self, filename: Optional[str] = None) -> str:
         """Save calibration results"""
         report = {
             "calibration_date": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -650,23 +988,32 @@ class AutoCalibrationSuite:
                 "target_white_point": self.settings.target_white_point,
                 "target_brightness": self.settings.target_brightness
             },
+            "corrections": {
+                "gamma_correction": self.gamma_correction,
+                "white_gains": list(self.white_gains)
+            },
             "results": [result.__dict__ for result in self.results],
-            "total_time": time.time() - self.step_start_time
+            "total_time": time.time() - self.session_start
         }
         
-        filename = f"calibration_report_{int(time.time())}.json"
+        filename = filename or f"calibration_report_{int(time.time())}.json"
         with open(filename, 'w') as f:
             json.dump(report, f, indent=2)
             
         print(f"Calibration report saved as: {filename}")
+        self.log_event('session_end', sync=True, report=filename)
+        return filename
         
     def handle_events(self):
         """Handle user input"""
-        for event in pygame.event.get():
+        for event in self.frames.events():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
+                    # Leaving the finished screen closes the session for good
+                    if self.current_step == CalibrationStep.COMPLETE:
+                        self.log_event('session_end', sync=True)
                     self.running = False
                 elif event.key == pygame.K_SPACE:
                     if self.current_step == CalibrationStep.COMPLETE:
@@ -675,17 +1022,28 @@ class AutoCalibrationSuite:
                         self.next_step()
                 elif event.key == pygame.K_b:
                     self.previous_step()
-                    
+                elif event.key == pygame.K_a and self.device is not None:
+                    if self.current_step == CalibrationStep.GAMMA:
+                        self.auto_gamma()
+                    elif self.current_step == CalibrationStep.WHITE_POINT:
+                        self.auto_white_point()
+                elif event.key == pygame.K_m and self.device is not None:
+                    if self.current_step == CalibrationStep.COLOR_ACCURACY:
+                        self.measure_color_accuracy()
+                    elif self.current_step == CalibrationStep.UNIFORMITY:
+                        self.measure_uniformity()
+                        
     def run(self):
         """Main calibration loop"""
         while self.running:
             self.handle_events()
             
-            # Draw current step
-            self.steps[self.current_step]()
-            
-            pygame.display.flip()
-            self.clock.tick(60)
+            # Flip only when the step screen or its overlay changed
+            if self.draw():
+                self.frames.present()
+                
+        if self.journal is not None:
+            self.journal.close()
             
         pygame.quit()
         sys.exit()
@@ -693,7 +1051,12 @@ class AutoCalibrationSuite:
 
 def main():
     """Main entry point"""
-    calibration = AutoCalibrationSuite()
+    parser = argparse.ArgumentParser(description="NEONpulseTechshop auto calibration")
+    parser.add_argument('--resume', nargs='?', const=DEFAULT_JOURNAL, metavar='JOURNAL',
+                        help=f"Journal the session and resume it if unfinished (default {DEFAULT_JOURNAL})")
+    args = parser.parse_args()
+    
+    calibration = AutoCalibrationSuite(journal=args.resume)
     calibration.run()
 
 
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Calibration Journal
+Append-only JSONL session log with batched fsync and resume
+"""
+
+import os
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+DEFAULT_JOURNAL = "calibration_session.jsonl"
+
+
+@dataclass
+class SessionState:
+    """Everything needed to pick a session back up"""
+    session_start: float
+    step: Optional[str] = None
+    settings: Dict = field(default_factory=dict)
+    results: List[Dict] = field(default_factory=list)
+    measurements: List[Dict] = field(default_factory=list)
+    corrections: Dict = field(default_factory=dict)
+    completed_steps: Dict = field(default_factory=dict)  # unattended plan steps
+    finished: bool = False
+
+
+class CalibrationJournal:
+    """One JSON event per line, flushed every write and fsynced in batches"""
+    
+    def __init__(self, filename: str = DEFAULT_JOURNAL, sync_every: int = 16,
+                 sync_interval: float = 2.0, append: bool = True):
+        self.filename = filename
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._file = open(filename, 'a' if append else 'w', encoding='utf-8')
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        
+    def append(self, event: str, sync: bool = False, **data):
+        """Write an event; sync=True forces it to disk immediately"""
+        record = {'event': event, 'time': time.time()}
+        record.update(data)
+        self._file.write(json.dumps(record) + "\n")
+        
+        # Flushing each line survives a process crash; the batched fsync
+        # bounds what a power cut can take
+        self._file.flush()
+        self._unsynced += 1
+        if (sync or self._unsynced >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+            
+    def sync(self):
+        """fsync everything written so far"""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+            
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+            
+    @staticmethod
+    def _load(filename: str):
+        """Complete events and the byte length they occupy"""
+        events = []
+        length = 0
+        with open(filename, 'rb') as f:
+            for line in f:
+                # A torn final line has no newline or doesn't parse
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+                length += len(line)
+        return events, length
+        
+    @classmethod
+    def read(cls, filename: str) -> List[Dict]:
+        """All complete events; a torn final line is dropped"""
+        return cls._load(filename)[0]
+        
+    @staticmethod
+    def replay(events: List[Dict]) -> Optional[SessionState]:
+        """Rebuild the latest session from its events"""
+        state = None
+        for record in events:
+            event = record['event']
+            if event == 'session_start':
+                state = SessionState(record['session_start'], settings=record.get('settings', {}))
+            elif state is None:
+                continue
+            elif event == 'step':
+                state.step = record['step']
+            elif event == 'measurement':
+                state.measurements.append(record)
+            elif event == 'result':
+                state.results.append(record['result'])
+            elif event == 'corrections':
+                state.corrections.update(record['corrections'])
+            elif event == 'plan_step':
+                state.completed_steps[record['name']] = record.get('data', {})
+            elif event == 'session_end':
+                state.finished = True
+        return state
+        
+    @classmethod
+    def open_session(cls, filename: str = DEFAULT_JOURNAL, settings: Optional[Dict] = None,
+                     keep_settings: bool = False, **kwargs):
+        """Resume an unfinished session or start a new one, returns (journal, state or None)"""
+        state = None
+        if os.path.exists(filename):
+            events, length = cls._load(filename)
+            state = cls.replay(events)
+            if state is not None and state.finished:
+                state = None
+                
+        if state is not None:
+            # Settings the caller insists on must be the ones the session ran with
+            if (keep_settings and state.settings
+                    and state.settings != json.loads(json.dumps(settings or {}))):
+                raise ValueError(f"{filename} holds an unfinished session with different "
+                                 f"settings; finish it or use another journal")
+            # Cut a torn tail so new events start on a clean line
+            with open(filename, 'r+b') as f:
+                f.truncate(length)
+            journal = cls(filename, **kwargs)
+            journal.append('resume', sync=True)
+            return journal, state
+            
+        journal = cls(filename, append=False, **kwargs)
+        journal.append('session_start', sync=True,
+                       session_start=time.time(), settings=settings or {})
+        return journal, None
\ No newline at end of file
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Closed-Loop Calibration
+Iterative gamma and white point solvers driven by colorimeter readings
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from color_difference import delta_e_xyz
+from color_temperature import daylight_xy, xy_to_cct_duv, xy_to_uv
+from matrix_shaper import rgb_to_xyz_matrix
+
+# measure(rgb 0-255) -> XYZ, or None when the user aborted
+MeasureFunction = Callable[[Tuple[float, float, float]], Optional[np.ndarray]]
+
+# Nominal display used to seed the white point Jacobian
+SRGB_PRIMARIES = [[0.640, 0.330], [0.300, 0.600], [0.150, 0.060]]
+
+
+@dataclass
+class Iteration:
+    """One reading of a convergence loop"""
+    step: int
+    parameters: Tuple[float, ...]
+    xyz: np.ndarray
+    measured: float  # effective gamma or CCT
+    error: float  # ΔE2000 or Δuv
+    converged: bool
+
+
+def target_white_xy(target: str) -> Tuple[float, float]:
+    """Chromaticity for a '6500K' style setting on the daylight locus"""
+    cct = float(str(target).upper().rstrip('K'))
+    if cct == 6500:
+        return 0.3127, 0.3290
+    if cct == 5000:
+        return 0.3457, 0.3585
+        
+    # Other nominal temperatures use the corrected Planck constant like D65 does
+    x, y = daylight_xy(cct * 1.4388 / 1.4380)
+    return float(x), float(y)
+
+
+def srgb_reference(rgb, white_xyz, gamma: float) -> np.ndarray:
+    """Expected XYZ of code values on an ideal display with the measured white"""
+    white_xy = white_xyz[:2] / white_xyz.sum()
+    matrix = rgb_to_xyz_matrix(SRGB_PRIMARIES, white_xy, white_xyz[1])
+    linear = (np.asarray(rgb, dtype=np.float64) / 255.0) ** gamma
+    return linear @ matrix.T
+
+
+def converge_gamma(measure: MeasureFunction, target_gamma: float = 2.2,
+                   tolerance: float = 0.5, max_iterations: int = 8,
+                   level: float = 0.5) -> Tuple[float, List[Iteration]]:
+    """Secant search for the exponent correction that puts mid-gray on target"""
+    # Shown code value is level ** correction, so the effective gamma
+    # of the chain is roughly correction times the native gamma
+    white = measure((255.0, 255.0, 255.0))
+    if white is None:
+        return 1.0, []
+        
+    target_Y = white[1] * level ** target_gamma
+    iterations = []
+    
+    correction = 1.0
+    previous = None
+    for step in range(max_iterations):
+        value = 255.0 * level ** correction
+        xyz = measure((value, value, value))
+        if xyz is None:
+            break
+            
+        ratio = max(xyz[1] / white[1], 1e-6)
+        gamma = np.log(ratio) / np.log(level)
+        # Lightness error only - the gray's tint is the white point loop's job
+        target_xyz = xyz * target_Y / max(xyz[1], 1e-12)
+        error = float(delta_e_xyz(target_xyz, xyz, white))
+        converged = error <= tolerance
+        iterations.append(Iteration(step, (correction,), xyz, gamma, error, converged))
+        
+        if converged:
+            break
+            
+        # Residual in gamma units; secant once two points exist
+        residual = gamma - target_gamma
+        if (previous is not None and abs(residual - previous[1]) > 1e-9
+                and correction != previous[0]):
+            slope = (residual - previous[1]) / (correction - previous[0])
+            next_correction = correction - residual / slope
+        else:
+            next_correction = correction * target_gamma / gamma
+            
+        previous = (correction, residual)
+        correction = float(np.clip(next_correction, 0.2, 5.0))
+        
+    return correction, iterations
+
+
+def _white_uv(ratios: np.ndarray, matrix: np.ndarray, gamma: float) -> np.ndarray:
+    """Model uv of the white produced by (red, 1, blue) code value ratios"""
+    xyz = matrix @ (np.array([ratios[0], 1.0, ratios[1]]) ** gamma)
+    x, y = xyz[:2] / xyz.sum()
+    return np.array(xy_to_uv(x, y))
+
+
+def converge_white_point(measure: MeasureFunction, target_xy: Tuple[float, float],
+                         tolerance: float = 0.001, max_iterations: int = 8,
+                         primaries=SRGB_PRIMARIES, gamma: float = 2.2
+                         ) -> Tuple[np.ndarray, List[Iteration]]:
+    """Broyden/Newton search for RGB gains that hit the target white in uv"""
+    target_uv = np.array(xy_to_uv(*target_xy))
+    matrix = rgb_to_xyz_matrix(primaries, target_xy)
+    
+    # Unknowns are the red and blue code values relative to green
+    ratios = np.ones(2)
+    
+    # Seed the Jacobian from the nominal model - costs no readings
+    h = 1e-4
+    base = _white_uv(ratios, matrix, gamma)
+    jacobian = np.column_stack([
+        (_white_uv(ratios + h * np.eye(2)[i], matrix, gamma) - base) / h
+        for i in range(2)
+    ])
+    
+    iterations = []
+    gains = np.ones(3)
+    previous = None
+    for step in range(max_iterations):
+        gains = np.array([ratios[0], 1.0, ratios[1]])
+        gains = gains / gains.max()
+        xyz = measure(tuple(255.0 * gains))
+        if xyz is None:
+            break
+            
+        x, y = xyz[:2] / xyz.sum()
+        residual = np.array(xy_to_uv(x, y)) - target_uv
+        error = float(np.hypot(*residual))
+        cct, _ = xy_to_cct_duv(x, y)
+        converged = error <= tolerance
+        iterations.append(Iteration(step, tuple(gains), xyz, float(cct), error, converged))
+        
+        if converged:
+            break
+            
+        # Broyden rank-one update from the last step, skipped when it didn't move
+        if previous is not None:
+            dp = ratios - previous[0]
+            df = residual - previous[1]
+            if dp @ dp > 1e-12:
+                jacobian += np.outer(df - jacobian @ dp, dp) / (dp @ dp)
+                
+        previous = (ratios.copy(), residual)
+        step_ratios = np.clip(ratios - np.linalg.solve(jacobian, residual), 0.05, 20.0)
+        
+        # Target out of reach: the clip holds the gains where they are
+        if np.allclose(step_ratios, ratios, rtol=0.0, atol=1e-9):
+            break
+        ratios = step_ratios
+        
+    return gains, iterations
\ No newline at end of file
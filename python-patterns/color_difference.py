@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Color Difference Module
+Vectorized CIE ΔE76, ΔE94 and CIEDE2000 over whole measurement arrays
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+# Reference whites (XYZ, Y normalized to 1.0)
+D65_WHITE = np.array([0.95047, 1.00000, 1.08883])
+D50_WHITE = np.array([0.96422, 1.00000, 0.82521])
+
+# CIE constants for the Lab transfer function
+LAB_EPSILON = 216.0 / 24389.0
+LAB_KAPPA = 24389.0 / 27.0
+
+
+def xyY_to_xyz(x, y, Y=1.0) -> np.ndarray:
+    """Convert xyY chromaticity (scalars or arrays) to XYZ, shape (..., 3)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    Y = np.broadcast_to(np.asarray(Y, dtype=np.float64), np.broadcast(x, y).shape)
+    
+    # Guard y == 0 (black) - XYZ collapses to zero
+    safe_y = np.where(y == 0, 1.0, y)
+    X = np.where(y == 0, 0.0, x * Y / safe_y)
+    Z = np.where(y == 0, 0.0, (1.0 - x - y) * Y / safe_y)
+    
+    return np.stack([X, Y, Z], axis=-1)
+
+
+def xyz_to_xy(xyz) -> np.ndarray:
+    """Convert XYZ (..., 3) to xy chromaticity (..., 2)"""
+    xyz = np.asarray(xyz, dtype=np.float64)
+    total = xyz.sum(axis=-1, keepdims=True)
+    total = np.where(total == 0, 1.0, total)
+    return xyz[..., :2] / total
+
+
+def xyz_to_lab(xyz, white=D65_WHITE) -> np.ndarray:
+    """Convert XYZ (..., 3) to CIELAB relative to the given white"""
+    xyz = np.asarray(xyz, dtype=np.float64)
+    white = np.asarray(white, dtype=np.float64)
+    
+    ratio = xyz / white
+    f = np.where(ratio > LAB_EPSILON,
+                 np.cbrt(ratio),
+                 (LAB_KAPPA * ratio + 16.0) / 116.0)
+                 
+    L = 116.0 * f[..., 1] - 16.0
+    a = 500.0 * (f[..., 0] - f[..., 1])
+    b = 200.0 * (f[..., 1] - f[..., 2])
+    
+    return np.stack([L, a, b], axis=-1)
+
+
+def delta_e_76(lab1, lab2) -> np.ndarray:
+    """CIE 1976 color difference (Euclidean distance in Lab)"""
+    lab1 = np.asarray(lab1, dtype=np.float64)
+    lab2 = np.asarray(lab2, dtype=np.float64)
+    return np.sqrt(np.sum((lab1 - lab2) ** 2, axis=-1))
+
+
+def delta_e_94(lab1, lab2, textiles: bool = False) -> np.ndarray:
+    """CIE 1994 color difference, lab1 is the reference"""
+    lab1 = np.asarray(lab1, dtype=np.float64)
+    lab2 = np.asarray(lab2, dtype=np.float64)
+    
+    # Graphic arts or textiles weighting
+    kL, K1, K2 = (2.0, 0.048, 0.014) if textiles else (1.0, 0.045, 0.015)
+    
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+    
+    C1 = np.hypot(a1, b1)
+    C2 = np.hypot(a2, b2)
+    
+    dL = L1 - L2
+    dC = C1 - C2
+    # ΔH² can go slightly negative from rounding
+    dH_sq = np.maximum((a1 - a2) ** 2 + (b1 - b2) ** 2 - dC ** 2, 0.0)
+    
+    SL = 1.0
+    SC = 1.0 + K1 * C1
+    SH = 1.0 + K2 * C1
+    
+    return np.sqrt((dL / (kL * SL)) ** 2 + (dC / SC) ** 2 + dH_sq / SH ** 2)
+
+
+def delta_e_2000(lab1, lab2, kL: float = 1.0, kC: float = 1.0,
+                 kH: float = 1.0) -> np.ndarray:
+    """CIEDE2000 color difference (Sharma, Wu & Dalal implementation notes)"""
+    lab1 = np.asarray(lab1, dtype=np.float64)
+    lab2 = np.asarray(lab2, dtype=np.float64)
+    
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+    
+    # Chroma compensation of the a* axis
+    C_bar = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2.0
+    C_bar7 = C_bar ** 7
+    G = 0.5 * (1.0 - np.sqrt(C_bar7 / (C_bar7 + 25.0 ** 7)))
+    
+    a1p = (1.0 + G) * a1
+    a2p = (1.0 + G) * a2
+    C1p = np.hypot(a1p, b1)
+    C2p = np.hypot(a2p, b2)
+    
+    # Hue angles in degrees, 0 for achromatic samples
+    h1p = np.where(C1p == 0, 0.0, np.degrees(np.arctan2(b1, a1p)) % 360.0)
+    h2p = np.where(C2p == 0, 0.0, np.degrees(np.arctan2(b2, a2p)) % 360.0)
+    
+    dLp = L2 - L1
+    dCp = C2p - C1p
+    
+    chroma_product = C1p * C2p
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180.0, dhp - 360.0, dhp)
+    dhp = np.where(dhp < -180.0, dhp + 360.0, dhp)
+    dhp = np.where(chroma_product == 0, 0.0, dhp)
+    dHp = 2.0 * np.sqrt(chroma_product) * np.sin(np.radians(dhp / 2.0))
+    
+    # Weighting function means
+    L_bar_p = (L1 + L2) / 2.0
+    C_bar_p = (C1p + C2p) / 2.0
+    
+    h_sum = h1p + h2p
+    h_bar_p = np.where(np.abs(h1p - h2p) > 180.0,
+                       np.where(h_sum < 360.0, h_sum + 360.0, h_sum - 360.0),
+                       h_sum) / 2.0
+    h_bar_p = np.where(chroma_product == 0, h_sum, h_bar_p)
+    
+    T = (1.0
+         - 0.17 * np.cos(np.radians(h_bar_p - 30.0))
+         + 0.24 * np.cos(np.radians(2.0 * h_bar_p))
+         + 0.32 * np.cos(np.radians(3.0 * h_bar_p + 6.0))
+         - 0.20 * np.cos(np.radians(4.0 * h_bar_p - 63.0)))
+         
+    d_theta = 30.0 * np.exp(-(((h_bar_p - 275.0) / 25.0) ** 2))
+    C_bar_p7 = C_bar_p ** 7
+    RC = 2.0 * np.sqrt(C_bar_p7 / (C_bar_p7 + 25.0 ** 7))
+    
+    L_offset = (L_bar_p - 50.0) ** 2
+    SL = 1.0 + (0.015 * L_offset) / np.sqrt(20.0 + L_offset)
+    SC = 1.0 + 0.045 * C_bar_p
+    SH = 1.0 + 0.015 * C_bar_p * T
+    RT = -np.sin(np.radians(2.0 * d_theta)) * RC
+    
+    term_L = dLp / (kL * SL)
+    term_C = dCp / (kC * SC)
+    term_H = dHp / (kH * SH)
+    
+    return np.sqrt(term_L ** 2 + term_C ** 2 + term_H ** 2 + RT * term_C * term_H)
+
+
+DELTA_E_METHODS = {
+    '76': delta_e_76,
+    '94': delta_e_94,
+    '2000': delta_e_2000
+}
+
+
+def delta_e(lab1, lab2, method: str = '2000') -> np.ndarray:
+    """Color difference between Lab arrays using the named method"""
+    if method not in DELTA_E_METHODS:
+        raise ValueError(f"Unknown ΔE method '{method}', "
+                         f"expected one of {sorted(DELTA_E_METHODS)}")
+    return DELTA_E_METHODS[method](lab1, lab2)
+
+
+def delta_e_xyz(reference_xyz, measured_xyz, white=D65_WHITE,
+                method: str = '2000') -> np.ndarray:
+    """Color difference between XYZ arrays sharing the same white"""
+    return delta_e(xyz_to_lab(reference_xyz, white),
+                   xyz_to_lab(measured_xyz, white),
+                   method)
+
+
+def delta_e_stats(delta: np.ndarray, axis: Optional[int] = -1) -> Dict[str, np.ndarray]:
+    """Aggregate ΔE values: mean, max and 95th percentile along an axis"""
+    delta = np.asarray(delta, dtype=np.float64)
+    return {
+        'mean': np.mean(delta, axis=axis),
+        'max': np.max(delta, axis=axis),
+        'p95': np.percentile(delta, 95, axis=axis)
+    }
\ No newline at end of file
@@ -11,6 +11,15 @@ from typing import Dict, List, Tuple, Optional
 import json
 import os
 
+from adaptive_sampler import AdaptiveSampler
+from color_difference import D65_WHITE, delta_e_xyz, delta_e_stats
+from color_temperature import xy_to_cct_duv
+from matrix_shaper import PCS_WHITE, solve_matrix_shaper
+from measurement_device import DisplayModel, SimulatedColorimeter
+from measurement_store import MeasurementStore
+from report_renderer import ReportRenderer
+from vcgt import generate_ramps, save_cal, save_raw, vcgt_tag
+
 class ICCProfile:
     """ICC Profile generator for display calibration"""
     
@@ -30,7 +39,14 @@ class ICCProfile:
         self.luminance = 100.0  # cd/m²
         
         # Measurement data
-        self.measurements = []
+        self.measurements = MeasurementStore()
+        
+        # Solved matrices, cleared when primaries or white point change
+        self.adaptation_method = 'bradford'
+        self._matrix_shaper = None
+        
+        # Video card gamma table, embedded as vcgt when set
+        self.calibration_ramps = None
         
     def set_gamma(self, gamma: float):
         """Set display gamma value"""
@@ -39,6 +55,7 @@ class ICCProfile:
     def set_white_point(self, x: float, y: float, Y: float = 1.0):
         """Set white point chromaticity"""
         self.white_point = {'x': x, 'y': y, 'Y': Y}
+        self._matrix_shaper = None
         
     def set_black_point(self, Y: float):
         """Set black point luminance"""
@@ -51,6 +68,7 @@ class ICCProfile:
             'green': green,
             'blue': blue
         }
+        self._matrix_shaper = None
         
     def set_luminance(self, luminance: float):
         """Set peak luminance in cd/m²"""
@@ -59,77 +77,97 @@ class ICCProfile:
     def add_measurement(self, rgb_in: Tuple[int, int, int], 
                        xyz_out: Tuple[float, float, float]):
         """Add calibration measurement point"""
-        self.measurements.append({
-            'input': rgb_in,
-            'output': xyz_out
-        })
+        self.measurements.append(rgb_in, xyz_out)
+        
+    def add_measurements(self, rgb_in: np.ndarray, xyz_out: np.ndarray):
+        """Add a block of measurement points, arrays shaped (N, 3)"""
+        self.measurements.extend(rgb_in, xyz_out)
+        
+    @property
+    def matrix_shaper(self) -> Dict[str, np.ndarray]:
+        """RGB to XYZ, chad and D50 colorant matrices, solved once"""
+        if self._matrix_shaper is None:
+            self._matrix_shaper = solve_matrix_shaper(
+                self.primaries, self.white_point, self.adaptation_method
+            )
+        return self._matrix_shaper
         
     def calculate_tone_curve(self) -> List[int]:
         """Calculate tone reproduction curve from measurements"""
         if not self.measurements:
             # Use gamma curve if no measurements
-            curve = []
-            for i in range(256):
-                normalized = i / 255.0
-                output = pow(normalized, self.gamma)
-                curve.append(int(output * 65535))
-            return curve
-            
-        # Interpolate from measurements
-        # Group by channel
-        channels = {'r': [], 'g': [], 'b': []}
-        
-        for measurement in self.measurements:
-            rgb = measurement['input']
-            xyz = measurement['output']
+            curve = np.power(np.arange(256) / 255.0, self.gamma)
+            return (curve * 65535).astype(int).tolist()
             
-            # Simplified - in reality would use proper color math
-            channels['r'].append((rgb[0], xyz[0]))
-            channels['g'].append((rgb[1], xyz[1]))
-            channels['b'].append((rgb[2], xyz[2]))
+        # Interpolate each channel straight from the columns
+        # Simplified - in reality would use proper color math
+        rgb = self.measurements.rgb
+        xyz = self.measurements.xyz
+        
+        # Neutral patches only when the set also holds colors
+        gray = (rgb[:, 0] == rgb[:, 1]) & (rgb[:, 1] == rgb[:, 2])
+        if gray.any():
+            rgb, xyz = rgb[gray], xyz[gray]
             
-        # Build curves
         curves = []
-        for channel in ['r', 'g', 'b']:
-            points = sorted(channels[channel])
-            curve = self._interpolate_curve(points)
+        for channel in range(3):
+            curve = self._interpolate_curve(rgb[:, channel], xyz[:, channel])
             curves.append(curve)
             
         return curves
         
-    def _interpolate_curve(self, points: List[Tuple]) -> List[int]:
+    def _interpolate_curve(self, inputs: np.ndarray, outputs: np.ndarray) -> List[int]:
         """Interpolate tone curve from measurement points"""
-        curve = []
-        
-        for i in range(256):
-            # Find surrounding points
-            value = i
+        # Average repeated readings of the same input (e.g. several sweeps)
+        levels, inverse = np.unique(inputs, return_inverse=True)
+        counts = np.bincount(inverse)
+        means = np.bincount(inverse, weights=outputs) / counts
+        
+        # Linear interpolation, held flat beyond the measured range
+        curve = np.interp(np.arange(256), levels, means)
+        
+        return (curve * 65535).astype(int).tolist()
+        
+    def channel_response(self):
+        """Per-channel linear response of the measured gray ramp"""
+        rgb = self.measurements.rgb
+        xyz = self.measurements.xyz
+        
+        # Gray patches only - equal code values on all channels
+        gray = (rgb[:, 0] == rgb[:, 1]) & (rgb[:, 1] == rgb[:, 2])
+        levels, inverse = np.unique(rgb[gray, 0], return_inverse=True)
+        counts = np.bincount(inverse)
+        mean_xyz = np.stack([np.bincount(inverse, weights=xyz[gray, i]) / counts
+                             for i in range(3)], axis=-1)
+                             
+        # Back to display RGB through the solved matrix
+        xyz_to_rgb = np.linalg.inv(self.matrix_shaper['rgb_to_xyz'])
+        linear = mean_xyz @ xyz_to_rgb.T
+        
+        return levels / 255.0, linear.T
+        
+    def generate_calibration_ramps(self, size: int = 256, gains=None,
+                                   target_gamma: Optional[float] = None) -> np.ndarray:
+        """Compute vcgt correction ramps from the measured gray ramp"""
+        if not self.measurements:
+            raise ValueError("No measurements to build calibration ramps from")
             
-            # Simple linear interpolation
-            lower = None
-            upper = None
+        levels, response = self.channel_response()
+        target = self.gamma if target_gamma is None else target_gamma
+        self.calibration_ramps = generate_ramps(levels, response, target, gains, size)
+        
+        return self.calibration_ramps
+        
+    def export_calibration_ramps(self, filename: str):
+        """Save the calibration ramps as .cal (ArgyllCMS) or raw 16-bit"""
+        if self.calibration_ramps is None:
+            raise ValueError("Calibration ramps have not been generated")
             
-            for x, y in points:
-                if x <= value:
-                    lower = (x, y)
-                if x >= value and upper is None:
-                    upper = (x, y)
-                    
-            if lower and upper and lower[0] != upper[0]:
-                # Interpolate
-                ratio = (value - lower[0]) / (upper[0] - lower[0])
-                output = lower[1] + ratio * (upper[1] - lower[1])
-            elif lower:
-                output = lower[1]
-            elif upper:
-                output = upper[1]
-            else:
-                output = pow(i / 255.0, self.gamma)
-                
-            curve.append(int(output * 65535))
+        if filename.endswith('.cal'):
+            save_cal(filename, self.calibration_ramps, self.display_name)
+        else:
+            save_raw(filename, self.calibration_ramps)
             
-        return curve
-        
     def generate_profile(self) -> bytes:
         """Generate ICC profile binary data"""
         # ICC Profile structure (simplified)
@@ -142,17 +180,20 @@ class ICCProfile:
         tags = self._create_tags()
         profile.extend(self._create_tag_table(tags))
         
-        # Tag data
+        # Tag data, each aligned to 4 bytes as the tag table assumes
         for tag_data in tags.values():
             profile.extend(tag_data)
+            profile.extend(b'\x00' * (-len(profile) % 4))
             
+        # Profile size in the header, readers reject a profile without it
+        struct.pack_into('>I', profile, 0, len(profile))
         return bytes(profile)
         
     def _create_header(self) -> bytes:
         """Create ICC profile header"""
         header = bytearray(128)
         
-        # Profile size (will be updated later)
+        # Profile size, filled in once the tags are assembled
         struct.pack_into('>I', header, 0, 0)
         
         # Preferred CMM type
@@ -188,7 +229,7 @@ class ICCProfile:
         # Rendering intent - perceptual
         struct.pack_into('>I', header, 64, 0)
         
-        # Illuminant (D65)
+        # PCS illuminant (D50)
         struct.pack_into('>I', header, 68, 0x0000F6D6)  # X
         struct.pack_into('>I', header, 72, 0x00010000)  # Y
         struct.pack_into('>I', header, 76, 0x0000D32D)  # Z
@@ -204,15 +245,23 @@ class ICCProfile:
         
         # Required tags for display profiles
         tags['desc'] = self._create_desc_tag()
-        tags['wtpt'] = self._create_xyz_tag(self.white_point)
+        # v4 display profiles carry the PCS white, the native white is in chad
+        matrices = self.matrix_shaper
+        colorants = matrices['colorants']
+        tags['wtpt'] = self._create_xyz_tag(dict(zip('XYZ', PCS_WHITE)))
         tags['bkpt'] = self._create_xyz_tag({'x': 0, 'y': 0, 'Y': self.black_point['Y']})
-        tags['rXYZ'] = self._create_xyz_tag(self.primaries['red'])
-        tags['gXYZ'] = self._create_xyz_tag(self.primaries['green'])
-        tags['bXYZ'] = self._create_xyz_tag(self.primaries['blue'])
+        tags['rXYZ'] = self._create_xyz_tag(dict(zip('XYZ', colorants[:, 0])))
+        tags['gXYZ'] = self._create_xyz_tag(dict(zip('XYZ', colorants[:, 1])))
+        tags['bXYZ'] = self._create_xyz_tag(dict(zip('XYZ', colorants[:, 2])))
+        tags['chad'] = self._create_sf32_tag(matrices['chad'])
         tags['rTRC'] = self._create_curve_tag()
         tags['gTRC'] = self._create_curve_tag()
         tags['bTRC'] = self._create_curve_tag()
         
+        # Video card calibration
+        if self.calibration_ramps is not None:
+            tags['vcgt'] = vcgt_tag(self.calibration_ramps)
+            
         # Optional but recommended
         tags['cprt'] = self._create_text_tag("Copyright 2024 NEONpulseTechshop")
         tags['dmnd'] = self._create_text_tag(self.display_name)
@@ -225,8 +274,7 @@ class ICCProfile:
         table = bytearray()
         
         # Number of tags
-        struct.pack_into('>I', table, 0, len(tags))
-        table.extend(b'\x00' * (4 - len(table) % 4))  # Padding
+        table.extend(struct.pack('>I', len(tags)))
         
         # Calculate offsets
         offset = 128 + 4 + len(tags) * 12  # Header + tag count + tag entries
@@ -236,11 +284,9 @@ class ICCProfile:
             # Signature
             table.extend(signature.encode('ascii')[:4].ljust(4))
             # Offset
-            struct.pack_into('>I', table, len(table), offset)
-            table.extend(b'\x00' * 4)
+            table.extend(struct.pack('>I', offset))
             # Size
-            struct.pack_into('>I', table, len(table), len(data))
-            table.extend(b'\x00' * 4)
+            table.extend(struct.pack('>I', len(data)))
             
             offset += len(data)
             # Align to 4 bytes
@@ -258,22 +304,18 @@ class ICCProfile:
         
         # ASCII description
         desc_ascii = self.display_name.encode('ascii')
-        struct.pack_into('>I', tag, len(tag), len(desc_ascii) + 1)
-        tag.extend(b'\x00' * 4)
+        tag.extend(struct.pack('>I', len(desc_ascii) + 1))
         tag.extend(desc_ascii)
         tag.extend(b'\x00')  # Null terminator
         
         # Unicode code
-        struct.pack_into('>I', tag, len(tag), 0)
-        tag.extend(b'\x00' * 4)
+        tag.extend(struct.pack('>I', 0))
         
         # Unicode count and description
-        struct.pack_into('>I', tag, len(tag), 0)
-        tag.extend(b'\x00' * 4)
+        tag.extend(struct.pack('>I', 0))
         
         # ScriptCode code and count
-        struct.pack_into('>H', tag, len(tag), 0)
-        tag.extend(b'\x00' * 2)
+        tag.extend(struct.pack('>H', 0))
         tag.extend(b'\x00')  # Count
         tag.extend(b'\x00' * 67)  # Macintosh description
         
@@ -319,13 +361,22 @@ class ICCProfile:
             Y = xyz.get('Y', 0)
             Z = xyz.get('Z', 0)
             
-        # Store as s15Fixed16Number (32768 = 1.0)
-        struct.pack_into('>I', tag, len(tag), int(X * 0x10000))
-        tag.extend(b'\x00' * 4)
-        struct.pack_into('>I', tag, len(tag), int(Y * 0x10000))
-        tag.extend(b'\x00' * 4)
-        struct.pack_into('>I', tag, len(tag), int(Z * 0x10000))
-        tag.extend(b'\x00' * 4)
+        # Store as s15Fixed16Number (65536 = 1.0)
+        for value in (X, Y, Z):
+            tag.extend(struct.pack('>i', int(round(value * 0x10000))))
+            
+        return tag
+        
+    def _create_sf32_tag(self, matrix: np.ndarray) -> bytes:
+        """Create s15Fixed16 array tag (row-major 3x3 for chad)"""
+        tag = bytearray()
+        
+        # Type signature
+        tag.extend(b'sf32')
+        tag.extend(b'\x00' * 4)  # Reserved
+        
+        fixed = np.round(np.asarray(matrix, dtype=np.float64).ravel() * 0x10000)
+        tag.extend(fixed.astype('>i4').tobytes())
         
         return tag
         
@@ -341,19 +392,16 @@ class ICCProfile:
         # In production, would use measured data
         if self.gamma == 1.0:
             # Linear - count of 0
-            struct.pack_into('>I', tag, len(tag), 0)
-            tag.extend(b'\x00' * 4)
+            tag.extend(struct.pack('>I', 0))
         else:
             # Gamma curve - 256 points
-            struct.pack_into('>I', tag, len(tag), 256)
-            tag.extend(b'\x00' * 4)
+            tag.extend(struct.pack('>I', 256))
             
             for i in range(256):
                 normalized = i / 255.0
                 output = pow(normalized, self.gamma)
                 value = int(output * 65535)
-                struct.pack_into('>H', tag, len(tag), value)
-                tag.extend(b'\x00' * 2)
+                tag.extend(struct.pack('>H', value))
                 
         return tag
         
@@ -361,11 +409,6 @@ class ICCProfile:
         """Save ICC profile to file"""
         profile_data = self.generate_profile()
         
-        # Update file size in header
-        size = len(profile_data)
-        profile_data = bytearray(profile_data)
-        struct.pack_into('>I', profile_data, 0, size)
-        
         # Calculate and update MD5 checksum (optional)
         # For now, leave as zeros
         
@@ -383,12 +426,23 @@ class ICCProfile:
             'gamma': self.gamma,
             'primaries': self.primaries,
             'luminance': self.luminance,
-            'measurements': self.measurements
+            'measurements': self.measurements.to_columns()
         }
         
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
             
+    def save_measurements(self, filename: str):
+        """Save raw measurements as a compressed .npz archive"""
+        self.measurements.save_npz(filename)
+        
+    def load_measurements(self, filename: str):
+        """Load measurements from an .npz archive or an append-only log"""
+        if filename.endswith('.npz'):
+            self.measurements = MeasurementStore.load_npz(filename)
+        else:
+            self.measurements = MeasurementStore.open_log(filename)
+
 
 class CalibrationReport:
     """Generate calibration reports with before/after comparisons"""
@@ -399,6 +453,7 @@ class CalibrationReport:
         self.before_data = {}
         self.after_data = {}
         self.recommendations = []
+        self.color_accuracy = {}
         
     def add_before_measurement(self, test_name: str, data: Dict):
         """Add pre-calibration measurement"""
@@ -432,9 +487,9 @@ class CalibrationReport:
             before = self.before_data['white_point']
             after = self.after_data['white_point']
             
-            # Calculate color temperature
-            before_temp = self._xy_to_cct(before['x'], before['y'])
-            after_temp = self._xy_to_cct(after['x'], after['y'])
+            # Calculate color temperature and distance from the Planckian locus
+            cct, duv = xy_to_cct_duv([before['x'], after['x']], [before['y'], after['y']])
+            before_temp, after_temp = int(cct[0]), int(cct[1])
             
             self.recommendations.append({
                 'test': 'White Point',
@@ -442,14 +497,59 @@ class CalibrationReport:
                 'after': f"{after_temp}K",
                 'target': '6500K',
                 'improved': abs(6500 - after_temp) < abs(6500 - before_temp),
-                'delta_uv': self._calculate_delta_uv(before, after)
+                'delta_uv': self._calculate_delta_uv(before, after),
+                'duv_before': float(duv[0]),
+                'duv_after': float(duv[1])
             })
             
+    def analyze_color_accuracy(self, method: str = '2000', target: float = 2.0):
+        """Analyze per-patch ΔE of measured color patches against reference"""
+        stages = {'before': self.before_data, 'after': self.after_data}
+        
+        for stage, data in stages.items():
+            patches = data.get('color_patches')
+            if patches is None:
+                continue
+                
+            # Whole patch set in one array operation
+            reference = patches['reference']
+            measured = patches['measured']
+            if isinstance(measured, MeasurementStore):
+                measured = measured.xyz
+            reference = np.asarray(reference, dtype=np.float64)
+            measured = np.asarray(measured, dtype=np.float64)
+            white = patches.get('white', D65_WHITE)
+            
+            deltas = delta_e_xyz(reference, measured, white, method)
+            stats = delta_e_stats(deltas)
+            
+            self.color_accuracy[stage] = {
+                'method': method,
+                'names': patches.get('names'),
+                'delta_e': deltas,
+                'mean': float(stats['mean']),
+                'max': float(stats['max']),
+                'p95': float(stats['p95'])
+            }
+            
+        if 'after' not in self.color_accuracy:
+            return
+            
+        after = self.color_accuracy['after']
+        before = self.color_accuracy.get('before')
+        
+        self.recommendations.append({
+            'test': f"Color Accuracy (ΔE{method})",
+            'before': f"{before['mean']:.2f} avg / {before['max']:.2f} max" if before else "n/a",
+            'after': f"{after['mean']:.2f} avg / {after['max']:.2f} max",
+            'target': f"≤ {target:.1f} avg",
+            'improved': after['mean'] <= target if before is None else after['mean'] < before['mean'],
+            'p95': after['p95']
+        })
+        
     def _xy_to_cct(self, x: float, y: float) -> int:
         """Convert xy chromaticity to color temperature"""
-        # Simplified McCamy's formula
-        n = (x - 0.3320) / (0.1858 - y)
-        cct = 449 * (n ** 3) + 3525 * (n ** 2) + 6823.3 * n + 5520.33
+        cct, _ = xy_to_cct_duv(x, y)
         return int(cct)
         
     def _calculate_delta_uv(self, c1: Dict, c2: Dict) -> float:
@@ -465,123 +565,8 @@ class CalibrationReport:
         
     def generate_html_report(self, filename: str):
         """Generate HTML calibration report"""
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Calibration Report - {self.display_name}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #ff00ff, #00ff41);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-        .section {{
-            background: white;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .metric {{
-            display: flex;
-            justify-content: space-between;
-            padding: 10px 0;
-            border-bottom: 1px solid #eee;
-        }}
-        .improved {{
-            color: #00ff41;
-            font-weight: bold;
-        }}
-        .degraded {{
-            color: #ff00ff;
-            font-weight: bold;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-        }}
-        th, td {{
-            padding: 10px;
-            text-align: left;
-            border-bottom: 1px solid #eee;
-        }}
-        th {{
-            background: #f0f0f0;
-            font-weight: 600;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>NEONpulseTechshop</h1>
-        <h2>Display Calibration Report</h2>
-        <p>{self.display_name}</p>
-        <p>{self.timestamp.strftime('%B %d, %Y at %I:%M %p')}</p>
-    </div>
-    
-    <div class="section">
-        <h3>Calibration Summary</h3>
-        <table>
-            <tr>
-                <th>Test</th>
-                <th>Before</th>
-                <th>After</th>
-                <th>Target</th>
-                <th>Result</th>
-            </tr>
-"""
-        
-        for rec in self.recommendations:
-            status = "improved" if rec['improved'] else "degraded"
-            status_text = "✓ Improved" if rec['improved'] else "✗ Degraded"
-            
-            html += f"""
-            <tr>
-                <td>{rec['test']}</td>
-                <td>{rec['before']}</td>
-                <td>{rec['after']}</td>
-                <td>{rec['target']}</td>
-                <td class="{status}">{status_text}</td>
-            </tr>
-"""
-            
-        html += """
-        </table>
-    </div>
-    
-    <div class="section">
-        <h3>Recommendations</h3>
-        <ul>
-            <li>Continue to monitor display performance monthly</li>
-            <li>Recalibrate if ambient lighting conditions change</li>
-            <li>Consider hardware calibration for critical color work</li>
-            <li>Save this ICC profile for consistent color across applications</li>
-        </ul>
-    </div>
-    
-    <div class="section">
-        <h3>Profile Installation</h3>
-        <p><strong>Windows:</strong> Right-click the .icm file and select "Install Profile"</p>
-        <p><strong>macOS:</strong> Double-click the .icc file to open ColorSync Utility</p>
-        <p><strong>Linux:</strong> Copy to ~/.local/share/icc/ or /usr/share/color/icc/</p>
-    </div>
-</body>
-</html>
-"""
-        
-        with open(filename, 'w') as f:
-            f.write(html)
+        # Streamed section by section from a template compiled once
+        ReportRenderer().render(self, filename)
 
 
 def demo_profile_creation():
@@ -602,24 +587,19 @@ def demo_profile_creation():
         blue={'x': 0.150, 'y': 0.060}
     )
     
-    # Add some sample measurements
-    test_points = [
-        (0, 0, 0),
-        (64, 64, 64),
-        (128, 128, 128),
-        (192, 192, 192),
-        (255, 255, 255)
-    ]
+    # Measure a simulated, slightly mistracking display, adding gray
+    # patches only where the tone curve is still uncertain
+    device = SimulatedColorimeter(
+        DisplayModel(gamma=(2.35, 2.25, 2.15), seed=1),
+        realtime=False
+    )
+    sampler = AdaptiveSampler(device.measure_many, error_target=0.5)
+    sampling = sampler.add_to_profile(profile)
+    
+    # Video card correction ramps from the measured gray ramp
+    profile.generate_calibration_ramps()
+    profile.export_calibration_ramps("neonpulse_calibration.cal")
     
-    for rgb in test_points:
-        # Simulate XYZ measurements
-        xyz = (
-            rgb[0] / 255.0,
-            rgb[1] / 255.0,
-            rgb[2] / 255.0
-        )
-        profile.add_measurement(rgb, xyz)
-        
     # Save profile
     profile.save_profile("neonpulse_calibrated.icc")
     profile.export_json("neonpulse_calibration_data.json")
@@ -634,16 +614,44 @@ def demo_profile_creation():
     report.add_before_measurement('white_point', {'x': 0.300, 'y': 0.315})
     report.add_after_measurement('white_point', {'x': 0.3127, 'y': 0.3290})
     
+    # Color patches (reference XYZ of sRGB red, green, blue, white, 50% gray)
+    reference = np.array([
+        [0.4124, 0.2126, 0.0193],
+        [0.3576, 0.7152, 0.1192],
+        [0.1805, 0.0722, 0.9505],
+        [0.9505, 1.0000, 1.0890],
+        [0.2034, 0.2140, 0.2330]
+    ])
+    report.add_before_measurement('color_patches', {
+        'reference': reference,
+        'measured': reference * np.array([1.04, 0.98, 0.90])
+    })
+    report.add_after_measurement('color_patches', {
+        'reference': reference,
+        'measured': reference * np.array([1.005, 1.0, 0.99])
+    })
+    
+    # Chart data
+    report.add_after_measurement('tone_curves', {
+        'curves': np.asarray(profile.calculate_tone_curve()) / 65535.0,
+        'target': 2.2
+    })
+    report.add_after_measurement('gamut', {'primaries': profile.primaries})
+    
     # Analyze
     report.analyze_gamma()
     report.analyze_white_point()
+    report.analyze_color_accuracy()
     
     # Generate report
     report.generate_html_report("calibration_report.html")
     
     print("✓ ICC Profile created: neonpulse_calibrated.icc")
     print("✓ Calibration data exported: neonpulse_calibration_data.json")
+    print("✓ Calibration ramps exported: neonpulse_calibration.cal")
     print("✓ Calibration report generated: calibration_report.html")
+    print(f"✓ {len(sampling.store)} patches measured "
+          f"(estimated ΔE {sampling.estimated_error:.2f})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Color Temperature Module
+Batch CCT and Duv using Ohno's method against a cached Planckian table
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Tuple
+
+# Krystek's rational fit of the Planckian locus is valid over this range
+CCT_MIN = 1000.0
+CCT_MAX = 15000.0
+
+# Ohno (2013): triangular solution is accurate close to the locus,
+# parabolic solution is used further away
+PARABOLIC_DUV_THRESHOLD = 0.002
+
+# Points processed per block, bounds the (points x table) distance matrix
+CHUNK_SIZE = 4096
+
+# Newton steps polishing the table estimate onto the analytic locus
+REFINE_ITERATIONS = 2
+
+
+def xy_to_uv(x, y) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert xy chromaticity to CIE 1960 uv"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    denom = -2.0 * x + 12.0 * y + 3.0
+    return 4.0 * x / denom, 6.0 * y / denom
+
+
+def uv_to_xy(u, v) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert CIE 1960 uv to xy chromaticity"""
+    u = np.asarray(u, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+    denom = 2.0 * u - 8.0 * v + 4.0
+    return 3.0 * u / denom, 2.0 * v / denom
+
+
+def planckian_uv(cct) -> Tuple[np.ndarray, np.ndarray]:
+    """CIE 1960 uv of a blackbody radiator (Krystek 1985 approximation)"""
+    T = np.asarray(cct, dtype=np.float64)
+    T2 = T * T
+    
+    u = (0.860117757 + 1.54118254e-4 * T + 1.28641212e-7 * T2) / \
+        (1.0 + 8.42420235e-4 * T + 7.08145163e-7 * T2)
+    v = (0.317398726 + 4.22806245e-5 * T + 4.20481691e-8 * T2) / \
+        (1.0 - 2.89741816e-5 * T + 1.61456053e-7 * T2)
+        
+    return u, v
+
+
+@lru_cache(maxsize=8)
+def planckian_table(t_min: float = CCT_MIN, t_max: float = CCT_MAX,
+                    step: float = 1.01) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Geometric Planckian table (T, u, v), built once per parameter set"""
+    count = int(np.ceil(np.log(t_max / t_min) / np.log(step))) + 1
+    T = t_min * step ** np.arange(count)
+    T[-1] = min(T[-1], t_max)
+    u, v = planckian_uv(T)
+    
+    # Shared between callers - keep it immutable
+    for array in (T, u, v):
+        array.setflags(write=False)
+        
+    return T, u, v
+
+
+def _ohno_block(u: np.ndarray, v: np.ndarray, table) -> Tuple[np.ndarray, np.ndarray]:
+    """Ohno's combined triangular/parabolic solution for a block of points"""
+    T_table, u_table, v_table = table
+    
+    # Distance from every point to every table entry
+    d = np.hypot(u[:, None] - u_table[None, :], v[:, None] - v_table[None, :])
+    
+    # Nearest entry with a neighbour on both sides
+    m = np.clip(np.argmin(d, axis=1), 1, len(T_table) - 2)
+    rows = np.arange(len(u))
+    
+    T0, T1, T2 = T_table[m - 1], T_table[m], T_table[m + 1]
+    d0, d1, d2 = d[rows, m - 1], d[rows, m], d[rows, m + 1]
+    
+    # Triangular solution
+    l = np.hypot(u_table[m + 1] - u_table[m - 1], v_table[m + 1] - v_table[m - 1])
+    x = (d0 ** 2 - d2 ** 2 + l ** 2) / (2.0 * l)
+    cct_tri = T0 + (T2 - T0) * (x / l)
+    v_on_locus = v_table[m - 1] + (v_table[m + 1] - v_table[m - 1]) * (x / l)
+    sign = np.where(v - v_on_locus >= 0, 1.0, -1.0)
+    duv_tri = np.sqrt(np.maximum(d0 ** 2 - x ** 2, 0.0)) * sign
+    
+    # Parabolic solution through the three distances
+    X = (T2 - T1) * (T0 - T2) * (T1 - T0)
+    a = (T0 * (d2 - d1) + T1 * (d0 - d2) + T2 * (d1 - d0)) / X
+    b = -(T0 ** 2 * (d2 - d1) + T1 ** 2 * (d0 - d2) + T2 ** 2 * (d1 - d0)) / X
+    c = -(d0 * (T2 - T1) * T1 * T2
+          + d1 * (T0 - T2) * T0 * T2
+          + d2 * (T1 - T0) * T0 * T1) / X
+    cct_par = -b / (2.0 * a)
+    duv_par = (a * cct_par ** 2 + b * cct_par + c) * sign
+    
+    use_parabolic = np.abs(duv_tri) >= PARABOLIC_DUV_THRESHOLD
+    cct = np.where(use_parabolic, cct_par, cct_tri)
+    duv = np.where(use_parabolic, duv_par, duv_tri)
+    
+    return cct, duv
+
+
+def _refine(u: np.ndarray, v: np.ndarray, cct: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Newton steps to the foot of the perpendicular on the locus"""
+    h = 0.5
+    
+    def gradient(T):
+        # Half the derivative of the squared distance to the locus point
+        u_p, v_p = planckian_uv(T)
+        u_hi, v_hi = planckian_uv(T + h)
+        u_lo, v_lo = planckian_uv(T - h)
+        return (u_p - u) * (u_hi - u_lo) + (v_p - v) * (v_hi - v_lo)
+        
+    T = np.clip(cct, CCT_MIN, CCT_MAX)
+    for _ in range(REFINE_ITERATIONS):
+        g = gradient(T)
+        slope = (gradient(T + h) - gradient(T - h)) / (2.0 * h)
+        T = np.clip(T - g / np.where(slope == 0, 1.0, slope), CCT_MIN, CCT_MAX)
+        
+    u_p, v_p = planckian_uv(T)
+    u_hi, v_hi = planckian_uv(T + h)
+    u_lo, v_lo = planckian_uv(T - h)
+    
+    # Signed distance, positive above the locus (u falls as T rises)
+    du = u_hi - u_lo
+    dv = v_hi - v_lo
+    duv = ((u - u_p) * dv - (v - v_p) * du) / np.hypot(du, dv)
+    
+    return T, duv
+
+
+def uv_to_cct_duv(u, v) -> Tuple[np.ndarray, np.ndarray]:
+    """CCT (K) and Duv for arrays of CIE 1960 uv coordinates"""
+    u = np.asarray(u, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+    shape = np.broadcast(u, v).shape
+    
+    u_flat = np.broadcast_to(u, shape).ravel()
+    v_flat = np.broadcast_to(v, shape).ravel()
+    
+    table = planckian_table()
+    cct = np.empty(u_flat.shape)
+    duv = np.empty(u_flat.shape)
+    
+    for start in range(0, len(u_flat), CHUNK_SIZE):
+        block = slice(start, start + CHUNK_SIZE)
+        estimate, _ = _ohno_block(u_flat[block], v_flat[block], table)
+        cct[block], duv[block] = _refine(u_flat[block], v_flat[block], estimate)
+        
+    return cct.reshape(shape), duv.reshape(shape)
+
+
+def xy_to_cct_duv(x, y) -> Tuple[np.ndarray, np.ndarray]:
+    """CCT (K) and Duv for arrays of xy chromaticities"""
+    return uv_to_cct_duv(*xy_to_uv(x, y))
+
+
+def cct_to_uv(cct, duv=0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """uv of a color temperature, offset by Duv along the locus normal"""
+    T = np.asarray(cct, dtype=np.float64)
+    u, v = planckian_uv(T)
+    
+    # Locus tangent by central difference
+    u_hi, v_hi = planckian_uv(T + 0.5)
+    u_lo, v_lo = planckian_uv(T - 0.5)
+    du = u_hi - u_lo
+    dv = v_hi - v_lo
+    length = np.hypot(du, dv)
+    
+    # Positive Duv points above the locus (towards green)
+    return u + duv * dv / length, v - duv * du / length
+
+
+def cct_to_xy(cct, duv=0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """xy chromaticity of a color temperature with optional Duv offset"""
+    return uv_to_xy(*cct_to_uv(cct, duv))
+
+
+def daylight_xy(cct) -> Tuple[np.ndarray, np.ndarray]:
+    """xy of the CIE daylight illuminant (4000K-25000K), e.g. 6504K for D65"""
+    T = np.asarray(cct, dtype=np.float64)
+    
+    x = np.where(
+        T <= 7000.0,
+        -4.6070e9 / T ** 3 + 2.9678e6 / T ** 2 + 0.09911e3 / T + 0.244063,
+        -2.0064e9 / T ** 3 + 1.9018e6 / T ** 2 + 0.24748e3 / T + 0.237040
+    )
+    y = -3.000 * x ** 2 + 2.870 * x - 0.275
+    
+    return x, y
\ No newline at end of file
@@ -9,6 +9,8 @@ import math
 import sys
 import os
 
+from frame_scheduler import FrameScheduler
+
 # Initialize Pygame
 pygame.init()
 
@@ -22,6 +24,7 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 CYAN = (0, 255, 255)
+MAGENTA = (255, 0, 255)
 GRAY = (128, 128, 128)
 
 # Display resolutions by category
@@ -44,7 +47,7 @@ class CRTTestSuite:
         self.width, self.height = resolution
         self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
         pygame.display.set_caption("NEONpulseTechshop CRT Test Suite")
-        self.clock = pygame.time.Clock()
+        self.frames = FrameScheduler(60)
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.current_pattern = 0
@@ -65,6 +68,11 @@ class CRTTestSuite:
             self.resolution_test,
             self.phosphor_persistence_test
         ]
+        self.animated_patterns = {
+            self.refresh_rate_test,
+            self.burn_in_prevention,
+            self.phosphor_persistence_test
+        }
         self.pattern_names = [
             "SMPTE Color Bars",
             "Convergence Grid",
@@ -634,7 +642,7 @@ class CRTTestSuite:
         
     def handle_events(self):
         """Handle keyboard and mouse events"""
-        for event in pygame.event.get():
+        for event in self.frames.events():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -657,9 +665,10 @@ class CRTTestSuite:
         """Main loop"""
         while self.running:
             self.handle_events()
-            self.patterns[self.current_pattern]()
-            pygame.display.flip()
-            self.clock.tick(60)
+            pattern = self.patterns[self.current_pattern]
+            if self.frames.needs_frame(pattern in self.animated_patterns):
+                pattern()
+                self.frames.present()
             
         pygame.quit()
         sys.exit()
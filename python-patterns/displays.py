@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Display Enumeration
+Physical displays from SDL and a fullscreen output window for each
+"""
+
+import pygame
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:  # pygame without the SDL2 video module - primary display only
+    Window = None
+
+# SDL_WINDOWPOS_CENTERED_DISPLAY(index)
+WINDOWPOS_CENTERED_MASK = 0x2FFF0000
+
+
+@dataclass
+class MonitorInfo:
+    """Information about a connected monitor"""
+    index: int
+    name: str
+    resolution: Tuple[int, int]
+    position: Tuple[int, int]
+    is_primary: bool
+    surface: Optional[pygame.Surface] = None
+
+
+class PygameDisplayEnumerator:
+    """Displays as SDL reports them, by display index"""
+    
+    def displays(self) -> List[MonitorInfo]:
+        sizes = pygame.display.get_desktop_sizes()
+        
+        # pygame exposes no display bounds, so the desktop is taken as a
+        # left-to-right row in index order; windows are still placed by index
+        monitors = []
+        x = 0
+        for index, size in enumerate(sizes):
+            monitors.append(MonitorInfo(index, f"Display {index + 1}", tuple(size),
+                                        (x, 0), index == 0))
+            x += size[0]
+        return monitors
+
+
+class FakeDisplayEnumerator:
+    """Fixed display layout for tests and headless runs"""
+    
+    def __init__(self, sizes: Sequence[Tuple[int, int]],
+                 positions: Optional[Sequence[Tuple[int, int]]] = None):
+        self.sizes = [tuple(size) for size in sizes]
+        if positions is None:
+            offsets = [sum(size[0] for size in self.sizes[:i]) for i in range(len(self.sizes))]
+            positions = [(x, 0) for x in offsets]
+        self.positions = [tuple(position) for position in positions]
+        
+    @classmethod
+    def parse(cls, spec: str) -> 'FakeDisplayEnumerator':
+        """Displays from 'WxH[+X+Y],...', e.g. '1920x1080,1280x1024+1920+56'"""
+        sizes, positions = [], []
+        for item in spec.split(','):
+            size, *offset = item.strip().lower().split('+')
+            size = size.split('x')
+            if len(size) != 2 or len(offset) not in (0, 2):
+                raise ValueError(f"Bad fake display '{item}', expected WxH or WxH+X+Y")
+            sizes.append((int(size[0]), int(size[1])))
+            positions.append((int(offset[0]), int(offset[1])) if offset else None)
+            
+        if all(position is None for position in positions):
+            return cls(sizes)
+        if any(position is None for position in positions):
+            raise ValueError("Give a position for every fake display or for none")
+        return cls(sizes, positions)
+        
+    def displays(self) -> List[MonitorInfo]:
+        return [MonitorInfo(index, f"Display {index + 1}", size, position, index == 0)
+                for index, (size, position) in enumerate(zip(self.sizes, self.positions))]
+
+
+class DisplayWindow:
+    """Fullscreen output on one display, presenting only that display's pixels"""
+    
+    def __init__(self, monitor: MonitorInfo, title: str):
+        self.monitor = monitor
+        
+        if monitor.is_primary:
+            # The primary keeps the regular display surface
+            self.window = None
+            self.surface = pygame.display.set_mode(monitor.resolution, pygame.FULLSCREEN,
+                                                   display=monitor.index)
+            pygame.display.set_caption(title)
+            # Fullscreen may land on a different mode than asked for
+            monitor.resolution = self.surface.get_size()
+        else:
+            if Window is None:
+                raise RuntimeError("Secondary displays need pygame's SDL2 video module")
+            position = WINDOWPOS_CENTERED_MASK | monitor.index
+            self.window = Window(title, monitor.resolution, position=(position, position))
+            # Displays SDL doesn't know (fake layouts) stay as plain windows
+            if monitor.index < pygame.display.get_num_displays():
+                self.window.set_fullscreen(desktop=True)
+            self.renderer = Renderer(self.window)
+            self.surface = pygame.Surface(monitor.resolution)
+            self.texture = Texture(self.renderer, monitor.resolution, streaming=True)
+            
+        monitor.surface = self.surface
+        
+    def present(self, regions=None):
+        """Put the surface on screen; regions limit the upload on the primary"""
+        if self.window is None:
+            if regions:
+                pygame.display.update(regions)
+            else:
+                pygame.display.flip()
+            return
+            
+        self.texture.update(self.surface)
+        self.renderer.blit(self.texture)
+        self.renderer.present()
+        
+    def close(self):
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
\ No newline at end of file
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Frame Scheduler
+Full frame rate for animated patterns, zero for static ones until something changes
+"""
+
+import pygame
+from typing import Callable, List, Optional
+
+# Events that never change what is on screen
+IDLE_EVENTS = (pygame.MOUSEMOTION,)
+
+
+class FrameScheduler:
+    """Decide when a suite's main loop needs to draw and flip"""
+    
+    def __init__(self, fps: int = 60, flip: Optional[Callable[[], None]] = None):
+        self.fps = fps
+        # Suites with several output windows present them all here
+        self.flip = flip or pygame.display.flip
+        self.clock = pygame.time.Clock()
+        self.dirty = True
+        self.animated = False
+        
+    def invalidate(self):
+        """Redraw on the next pass, for state changes outside the event loop"""
+        self.dirty = True
+        
+    def events(self) -> List[pygame.event.Event]:
+        """Pending events; blocks for the next one while a static frame is shown"""
+        if self.animated or self.dirty:
+            events = pygame.event.get()
+        else:
+            # Sleeps in SDL until input, expose or a posted event arrives
+            events = [pygame.event.wait()] + pygame.event.get()
+            
+        if any(event.type not in IDLE_EVENTS for event in events):
+            self.dirty = True
+        return events
+        
+    def needs_frame(self, animated: bool = False) -> bool:
+        """Whether the current pattern has to be drawn this pass"""
+        # Each suite keeps a set of animated patterns, drawn every frame at fps;
+        # any other pattern is drawn once and then only after input or invalidate()
+        self.animated = animated
+        return animated or self.dirty
+        
+    def present(self):
+        """Flip the drawn frame, pacing animated patterns to the frame rate"""
+        self.flip()
+        self.dirty = False
+        if self.animated:
+            self.clock.tick(self.fps)
\ No newline at end of file
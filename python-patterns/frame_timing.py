@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Frame Timing
+Present timestamps per display, refresh estimates and timing traces
+"""
+
+import json
+import time
+import numpy as np
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class DisplayTiming:
+    """Effective refresh of one display, fitted to its present timestamps"""
+    display: int
+    name: str
+    frames: int
+    interval_ms: float
+    refresh_hz: float
+    phase_ms: float  # first refresh after the timer started, within one interval
+    jitter_ms: float  # rms distance of presents from the fitted refresh grid
+    present_ms: float  # mean time spent inside present, i.e. waiting for vsync
+    dropped: int  # presents that landed in the same refresh as the one before
+    repeated: int  # extra refreshes a frame stayed on screen
+    offset_ms: float = 0.0  # phase relative to the first display
+
+
+def _refresh_fit(after: np.ndarray, expected: float):
+    """Interval, phase and residuals of a regular refresh grid through the timestamps"""
+    deltas = np.diff(after)
+    interval = float(np.median(deltas)) if len(deltas) else expected
+    if interval <= 0:
+        interval = expected
+        
+    # Count refreshes between presents one gap at a time, so a slightly
+    # wrong first guess can't drift over a long recording
+    for _ in range(2):
+        steps = np.rint(deltas / interval)
+        count = np.concatenate(([0.0], np.cumsum(steps)))
+        if count[-1] <= 0:
+            break
+        interval, start = np.polyfit(count, after, 1)
+        
+    start = after[0] if count[-1] <= 0 else start
+    residuals = after - (start + count * interval)
+    return float(interval), float(start % interval), residuals, steps
+
+
+class FrameTimer:
+    """High resolution timestamps before and after every present, per display"""
+    
+    def __init__(self, names: Sequence[str], expected_hz: float = 60.0,
+                 clock: Callable[[], int] = time.perf_counter_ns):
+        self.names = list(names)
+        self.expected_hz = expected_hz
+        self.clock = clock
+        self.reset()
+        
+    def reset(self):
+        self.origin = self.clock()
+        self.samples = [[] for _ in self.names]  # (before, after) in ns
+        
+    def present(self, display: int, present: Callable[[], None]):
+        """Run one display's present between two timestamps"""
+        before = self.clock()
+        present()
+        self.samples[display].append((before, self.clock()))
+        
+    def _seconds(self, display: int, last: Optional[int] = None) -> np.ndarray:
+        samples = self.samples[display][-last:] if last else self.samples[display]
+        return (np.array(samples, dtype=np.int64).reshape(-1, 2) - self.origin) / 1e9
+        
+    def analyse(self, last: Optional[int] = None) -> List[DisplayTiming]:
+        """Refresh estimate per display, over the last presents if given"""
+        timings = []
+        for display, name in enumerate(self.names):
+            stamps = self._seconds(display, last)
+            if len(stamps) < 3:
+                continue
+            interval, phase, residuals, steps = _refresh_fit(stamps[:, 1], 1.0 / self.expected_hz)
+            timings.append(DisplayTiming(
+                display=display,
+                name=name,
+                frames=len(stamps),
+                interval_ms=interval * 1000.0,
+                refresh_hz=1.0 / interval,
+                phase_ms=phase * 1000.0,
+                jitter_ms=float(np.sqrt(np.mean(residuals ** 2))) * 1000.0,
+                present_ms=float(np.mean(stamps[:, 1] - stamps[:, 0])) * 1000.0,
+                dropped=int((steps == 0).sum()),
+                repeated=int((steps[steps > 1] - 1).sum())
+            ))
+            
+        # Phase difference to the first display, wrapped to half an interval
+        if timings:
+            reference = timings[0]
+            for timing in timings:
+                offset = timing.phase_ms - reference.phase_ms
+                half = reference.interval_ms / 2.0
+                timing.offset_ms = (offset + half) % reference.interval_ms - half
+        return timings
+        
+    def trace(self) -> Dict:
+        """Chrome trace event format, for chrome://tracing or Perfetto"""
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': display,
+                   'args': {'name': name}} for display, name in enumerate(self.names)]
+                   
+        for display in range(len(self.names)):
+            stamps = self._seconds(display) * 1e6  # microseconds
+            for frame, (before, after) in enumerate(stamps):
+                events.append({'name': 'present', 'ph': 'X', 'pid': 1, 'tid': display,
+                               'ts': before, 'dur': after - before, 'args': {'frame': frame}})
+                               
+            # Dropped and repeated frames as markers on the display's track
+            if len(stamps) >= 3:
+                _, _, _, steps = _refresh_fit(stamps[:, 1] / 1e6, 1.0 / self.expected_hz)
+                for frame in np.flatnonzero(steps != 1):
+                    kind = 'dropped' if steps[frame] == 0 else 'repeated'
+                    events.append({'name': kind, 'ph': 'i', 's': 't', 'pid': 1, 'tid': display,
+                                   'ts': stamps[frame + 1, 1],
+                                   'args': {'frame': int(frame) + 1, 'refreshes': int(steps[frame])}})
+                                   
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': {'displays': [asdict(timing) for timing in self.analyse()]}}
+                
+    def save(self, filename: str):
+        # Traces run to thousands of events, keep them compact
+        with open(filename, 'w') as f:
+            json.dump(self.trace(), f)
\ No newline at end of file
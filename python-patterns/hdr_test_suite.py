@@ -10,6 +10,9 @@ import math
 import sys
 import os
 
+from frame_scheduler import FrameScheduler
+from info_overlay import InfoOverlay, PatternLayer
+
 # Initialize Pygame
 pygame.init()
 
@@ -68,12 +71,15 @@ class HDRTestSuite:
             print("Warning: HDR display mode not available, falling back to SDR")
             self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
             
-        self.clock = pygame.time.Clock()
+        self.frames = FrameScheduler(60)
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.current_pattern = 0
         self.peak_nits = 1000
         self.show_info = True
+        self.info = InfoOverlay()
+        # Last static pattern, so toggling the info panel doesn't redraw it
+        self.pattern_layer = PatternLayer()
         
         self.patterns = [
             self.peak_brightness_test,
@@ -87,6 +93,7 @@ class HDRTestSuite:
             self.pq_curve_visualization,
             self.hdr_color_checker
         ]
+        self.animated_patterns = {self.clipping_test}
         
         self.pattern_names = [
             "Peak Brightness Windows",
@@ -166,18 +173,26 @@ class HDRTestSuite:
         self.screen.blit(pulse_text, pulse_rect)
         self.screen.blit(hdr_text, hdr_rect)
         
+    def draw_pattern(self, pattern, animated: bool):
+        """Draw the pattern, or put back the stored one when only the overlay changed"""
+        key = (self.current_pattern, self.peak_nits)
+        if animated or not self.pattern_layer.holds(key):
+            pattern()
+            self.info.drawn = None
+            if animated:
+                self.pattern_layer.clear()
+            else:
+                self.pattern_layer.store(self.screen, key)
+        else:
+            self.info.erase(self.screen, self.pattern_layer)
+            
     def draw_info(self):
         """Draw pattern info and controls"""
         if not self.show_info:
             return
             
-        info_surface = pygame.Surface((500, 250))
-        info_surface.set_alpha(200)
-        info_surface.fill(BLACK)
-        
         # Pattern name
-        name_text = self.small_font.render(self.pattern_names[self.current_pattern], True, WHITE)
-        info_surface.blit(name_text, (10, 10))
+        lines = [(self.pattern_names[self.current_pattern], self.small_font, WHITE, (10, 10))]
         
         # HDR info
         hdr_info = [
@@ -186,12 +201,8 @@ class HDRTestSuite:
             f"Bit Depth: {self.hdr_config['bit_depth']}-bit",
             f"Color Space: {self.hdr_config['color_space'].upper()}"
         ]
-        
-        y = 40
-        for info in hdr_info:
-            info_text = self.small_font.render(info, True, NEON_GREEN)
-            info_surface.blit(info_text, (10, y))
-            y += 25
+        for row, info in enumerate(hdr_info):
+            lines.append((info, self.small_font, NEON_GREEN, (10, 40 + 25 * row)))
             
         # Controls
         controls = [
@@ -200,14 +211,12 @@ class HDRTestSuite:
             "I : Toggle Info",
             "ESC : Exit"
         ]
-        
-        y = 140
-        for control in controls:
-            control_text = self.small_font.render(control, True, WHITE)
-            info_surface.blit(control_text, (10, y))
-            y += 25
+        for row, control in enumerate(controls):
+            lines.append((control, self.small_font, WHITE, (10, 140 + 25 * row)))
             
-        self.screen.blit(info_surface, (10, 10))
+        # The panel surface is only rebuilt when its text changes
+        self.info.update((500, 250), lines)
+        self.info.draw(self.screen)
         
     def peak_brightness_test(self):
         """Test display's peak brightness capabilities"""
@@ -249,7 +258,6 @@ class HDRTestSuite:
             self.screen.blit(nits_text, nits_rect)
             
         self.draw_logo()
-        self.draw_info()
         
     def gradient_ramp_test(self):
         """10-bit gradient test for smooth transitions"""
@@ -283,7 +291,6 @@ class HDRTestSuite:
         self.screen.blit(step_text, (10, gradient_height + step_height + 60))
         
         self.draw_logo()
-        self.draw_info()
         
     def color_volume_test(self):
         """Test color reproduction at different brightness levels"""
@@ -330,7 +337,6 @@ class HDRTestSuite:
             self.screen.blit(nits_text, (self.width - 100, row * cell_height + cell_height // 2))
             
         self.draw_logo()
-        self.draw_info()
         
     def black_level_test(self):
         """Test near-black detail visibility"""
@@ -380,7 +386,6 @@ class HDRTestSuite:
             self.screen.blit(label_text, label_rect)
             
         self.draw_logo()
-        self.draw_info()
         
     def highlight_detail_test(self):
         """Test highlight detail preservation"""
@@ -422,7 +427,6 @@ class HDRTestSuite:
                 pygame.draw.rect(self.screen, color, rect)
                 
         self.draw_logo()
-        self.draw_info()
         
     def color_gamut_test(self):
         """Test Rec.2020 color space coverage"""
@@ -463,7 +467,6 @@ class HDRTestSuite:
         self.screen.blit(rec2020_text, rec2020_rect)
         
         self.draw_logo()
-        self.draw_info()
         
     def tone_mapping_test(self):
         """Test SDR to HDR tone mapping"""
@@ -505,7 +508,6 @@ class HDRTestSuite:
             self.screen.blit(label_text, label_rect)
             
         self.draw_logo()
-        self.draw_info()
         
     def clipping_test(self):
         """Test for highlight and shadow clipping"""
@@ -557,7 +559,6 @@ class HDRTestSuite:
             self.screen.blit(label_rotated, (rect.centerx - 10, rect.bottom - 80))
             
         self.draw_logo()
-        self.draw_info()
         
     def pq_curve_visualization(self):
         """Visualize the PQ transfer function"""
@@ -621,7 +622,6 @@ class HDRTestSuite:
         self.screen.blit(y_surface, (20, self.height // 2 - 50))
         
         self.draw_logo()
-        self.draw_info()
         
     def hdr_color_checker(self):
         """HDR version of color checker pattern"""
@@ -674,7 +674,6 @@ class HDRTestSuite:
             self.screen.blit(label_text, label_rect)
             
         self.draw_logo()
-        self.draw_info()
         
     def hsv_to_rgb(self, h, s, v):
         """Convert HSV to RGB color space"""
@@ -703,7 +702,7 @@ class HDRTestSuite:
         
     def handle_events(self):
         """Handle keyboard and mouse events"""
-        for event in pygame.event.get():
+        for event in self.frames.events():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -724,10 +723,13 @@ class HDRTestSuite:
         """Main loop"""
         while self.running:
             self.handle_events()
-            self.patterns[self.current_pattern]()
-            pygame.display.flip()
-            self.clock.tick(60)
-            
+            pattern = self.patterns[self.current_pattern]
+            animated = pattern in self.animated_patterns
+            if self.frames.needs_frame(animated):
+                self.draw_pattern(pattern, animated)
+                self.draw_info()
+                self.frames.present()
+                
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Headless Calibration Runner
+Execute a calibration plan with no keyboard, on a display or off-screen
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from adaptive_sampler import AdaptiveSampler
+from auto_calibration import AutoCalibrationSuite, CalibrationSettings, CalibrationStep
+from color_profile_export import CalibrationReport, ICCProfile
+from measurement_device import DisplayModel, RemoteColorimeter, SimulatedColorimeter
+
+STEPS = ('gamma', 'white_point', 'profile', 'color_accuracy')
+
+
+@dataclass
+class CalibrationPlan:
+    """Everything an unattended run needs, loadable from JSON"""
+    display_name: str = "NEONpulseTechshop Display"
+    steps: List[str] = field(default_factory=lambda: list(STEPS))
+    settings: Dict = field(default_factory=dict)  # CalibrationSettings fields
+    patch_sets: Dict = field(default_factory=dict)  # step -> [[r, g, b], ...]
+    timeouts: Dict = field(default_factory=lambda: {'default': 600.0})  # seconds per step
+    device: Dict = field(default_factory=lambda: {'type': 'simulated'})
+    resolution: List[int] = field(default_factory=lambda: [1920, 1080])
+    offscreen: bool = True
+    settle_time: float = 0.25
+    sampling: Dict = field(default_factory=lambda: {'error_target': 0.5, 'max_patches': 64})
+    output_dir: str = "calibration_output"
+    
+    @classmethod
+    def load(cls, filename: str) -> 'CalibrationPlan':
+        with open(filename, 'r') as f:
+            data = json.load(f)
+            
+        plan = cls(**data)
+        unknown = [step for step in plan.steps if step not in STEPS]
+        if unknown:
+            raise ValueError(f"Unknown plan steps {unknown}, expected some of {list(STEPS)}")
+        return plan
+        
+    def save(self, filename: str):
+        with open(filename, 'w') as f:
+            json.dump(asdict(self), f, indent=2)
+            
+    def timeout(self, step: str) -> float:
+        return float(self.timeouts.get(step, self.timeouts.get('default', 600.0)))
+
+
+def create_device(spec: Dict):
+    """Measurement backend from the plan's device entry"""
+    kind = spec.get('type', 'simulated')
+    if kind == 'simulated':
+        options = {k: v for k, v in spec.items() if k not in ('type', 'realtime')}
+        if 'gamma' in options:
+            options['gamma'] = tuple(options['gamma'])
+        return SimulatedColorimeter(DisplayModel(**options), realtime=spec.get('realtime', True))
+    if kind == 'remote':
+        return RemoteColorimeter(tuple(spec.get('address', ('127.0.0.1', 5757))))
+
+    raise ValueError(f"Unknown device type '{kind}'")
+
+
+class HeadlessRunner:
+    """Drive AutoCalibrationSuite through a plan and write the deliverables"""
+    
+    def __init__(self, plan: CalibrationPlan, device=None):
+        self.plan = plan
+        os.makedirs(plan.output_dir, exist_ok=True)
+        
+        # SDL reads the video driver when the display starts, so restart it
+        if plan.offscreen:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            pygame.display.quit()
+            pygame.display.init()
+            
+        width, height = plan.resolution
+        if plan.offscreen:
+            screen = pygame.display.set_mode((width, height))
+        else:
+            screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
+            
+        self.device = device or create_device(plan.device)
+        self.suite = AutoCalibrationSuite(
+            (width, height), device=self.device,
+            journal=os.path.join(plan.output_dir, "session.jsonl"),
+            screen=screen, settings=CalibrationSettings(**plan.settings)
+        )
+        self.suite.settle_time = plan.settle_time
+        
+        self.status = {}
+        self.outputs = {}
+        self.step_data = {}
+        
+    def _measure_many(self, patches) -> Optional[np.ndarray]:
+        """Batch reader for the adaptive sampler, None if cut short"""
+        readings = self.suite.measure_patches(patches)
+        if len(readings) != len(patches):
+            return None
+        return np.array([reading.xyz for reading in readings])
+        
+    def run_gamma(self) -> Tuple[bool, Dict]:
+        self.suite.auto_gamma()
+        iterations = self.suite.iterations[CalibrationStep.GAMMA]
+        if not iterations:
+            return False, {}
+        return iterations[-1].converged, {
+            'before': float(iterations[0].measured),
+            'after': float(iterations[-1].measured)
+        }
+        
+    def run_white_point(self) -> Tuple[bool, Dict]:
+        self.suite.auto_white_point()
+        iterations = self.suite.iterations[CalibrationStep.WHITE_POINT]
+        if not iterations:
+            return False, {}
+            
+        def xy(reading):
+            return {'x': float(reading[0] / reading.sum()), 'y': float(reading[1] / reading.sum())}
+            
+        return iterations[-1].converged, {
+            'before': xy(iterations[0].xyz),
+            'after': xy(iterations[-1].xyz)
+        }
+        
+    def run_profile(self) -> Tuple[bool, Dict]:
+        sampler = AdaptiveSampler(self._measure_many, **self.plan.sampling)
+        result = sampler.run()
+        if not np.isfinite(result.estimated_error):
+            return False, {}
+            
+        rgb = result.store.rgb
+        xyz = result.store.xyz
+        white = xyz[(rgb == 255).all(axis=1)][-1]
+        black = xyz[(rgb == 0).all(axis=1)][-1]
+        
+        def xy(reading):
+            return {'x': float(reading[0] / reading.sum()), 'y': float(reading[1] / reading.sum())}
+            
+        # Native primaries with the black level removed
+        primaries = {}
+        for name, patch in zip(('red', 'green', 'blue'), np.eye(3) * 255):
+            primaries[name] = xy(xyz[(rgb == patch).all(axis=1)][-1] - black)
+            
+        settings = self.suite.settings
+        profile = ICCProfile(self.plan.display_name)
+        profile.set_gamma(settings.target_gamma)
+        profile.set_white_point(**xy(white))
+        profile.set_black_point(float(black[1] / white[1]))
+        profile.set_luminance(float(white[1]))
+        profile.set_primaries(**primaries)
+        sampler.add_to_profile(profile, result)
+        
+        # Code value gains from the white point loop, as linear-light scaling
+        gains = np.asarray(self.suite.white_gains) ** settings.target_gamma
+        profile.generate_calibration_ramps(gains=gains, target_gamma=settings.target_gamma)
+        
+        base = os.path.join(self.plan.output_dir, "profile")
+        profile.save_profile(base + ".icc")
+        profile.export_json(base + ".json")
+        profile.export_calibration_ramps(base + ".cal")
+        
+        return result.estimated_error <= sampler.error_target, {
+            'outputs': {'icc': base + ".icc", 'profile_data': base + ".json", 'cal': base + ".cal"},
+            'patches': len(result.store),
+            'estimated_error': result.estimated_error,
+            'additivity_error': result.additivity_error
+        }
+        
+    def run_color_accuracy(self) -> Tuple[bool, Dict]:
+        names = None
+        patches = self.plan.patch_sets.get('color_accuracy')
+        if patches is None:
+            patches = [rgb for rgb, _ in self.suite.ACCURACY_PATCHES]
+            names = [name for _, name in self.suite.ACCURACY_PATCHES]
+            
+        data = self.suite.measure_color_accuracy(patches)
+        if data is None:
+            return False, {}
+        data['names'] = names or [str(tuple(p)) for p in patches]
+        return data.pop('passed'), data
+        
+    def write_report(self):
+        """HTML report from the first and last iteration of each loop"""
+        report = CalibrationReport(self.plan.display_name)
+        target = self.suite.settings.target_gamma
+        
+        gamma = self.step_data.get('gamma')
+        if gamma:
+            report.add_before_measurement('gamma', {'measured': gamma['before'], 'target': target})
+            report.add_after_measurement('gamma', {'measured': gamma['after'], 'target': target})
+            
+        white = self.step_data.get('white_point')
+        if white:
+            report.add_before_measurement('white_point', white['before'])
+            report.add_after_measurement('white_point', white['after'])
+            
+        accuracy = self.step_data.get('color_accuracy')
+        if accuracy:
+            report.add_after_measurement('color_patches', accuracy)
+            
+        report.analyze_gamma()
+        report.analyze_white_point()
+        report.analyze_color_accuracy()
+        
+        filename = os.path.join(self.plan.output_dir, "report.html")
+        report.generate_html_report(filename)
+        self.outputs['html_report'] = filename
+        
+    def run(self) -> bool:
+        """Run every planned step, returns True if all passed"""
+        handlers = {
+            'gamma': (CalibrationStep.GAMMA, self.run_gamma),
+            'white_point': (CalibrationStep.WHITE_POINT, self.run_white_point),
+            'profile': (CalibrationStep.COLOR_ACCURACY, self.run_profile),
+            'color_accuracy': (CalibrationStep.COLOR_ACCURACY, self.run_color_accuracy)
+        }
+        
+        for name in self.plan.steps:
+            # Passed in an interrupted earlier run - keep its readings
+            if name in self.suite.completed_steps:
+                self.step_data[name] = self.suite.completed_steps[name]
+                self.status[name] = {'status': "passed", 'seconds': 0.0, 'resumed': True}
+                print(f"{name}: passed (resumed)")
+                continue
+                
+            step, handler = handlers[name]
+            self.suite.goto_step(step)
+            self.suite.deadline = time.monotonic() + self.plan.timeout(name)
+            
+            started = time.time()
+            try:
+                passed, data = handler()
+                timed_out = time.monotonic() > self.suite.deadline
+                state = "timed out" if timed_out else ("passed" if passed else "failed")
+            except Exception as e:
+                passed, data = False, {}
+                state = f"error: {e}"
+                
+            self.step_data[name] = data
+            if state == "passed":
+                self.suite.log_event('plan_step', sync=True, name=name, data=data)
+                
+            self.status[name] = {'status': state, 'seconds': round(time.time() - started, 2)}
+            print(f"{name}: {state} ({self.status[name]['seconds']}s)")
+            
+        self.suite.deadline = None
+        self.suite.goto_step(CalibrationStep.COMPLETE)
+        
+        profile = self.step_data.get('profile')
+        if profile:
+            self.outputs.update(profile['outputs'])
+        self.write_report()
+        self.outputs['json_report'] = self.suite.save_calibration_report(
+            os.path.join(self.plan.output_dir, "calibration_report.json"))
+            
+        summary = {
+            'display_name': self.plan.display_name,
+            'steps': self.status,
+            'outputs': self.outputs,
+            'readings': len(self.suite.measurements),
+            'total_time': time.time() - self.suite.session_start
+        }
+        with open(os.path.join(self.plan.output_dir, "run_summary.json"), 'w') as f:
+            json.dump(summary, f, indent=2)
+            
+        self.device.close()
+        return all(entry['status'] == "passed" for entry in self.status.values())
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="NEONpulseTechshop headless calibration")
+    parser.add_argument('plan', nargs='?', help="Calibration plan JSON")
+    parser.add_argument('--output', help="Override the plan's output directory")
+    parser.add_argument('--display', action='store_true', help="Render fullscreen on the real display")
+    parser.add_argument('--write-plan', metavar='FILE', help="Write a default plan and exit")
+    args = parser.parse_args()
+    
+    if args.write_plan:
+        CalibrationPlan().save(args.write_plan)
+        print(f"Plan template saved as: {args.write_plan}")
+        return
+        
+    if not args.plan:
+        parser.error("a plan file is required")
+        
+    plan = CalibrationPlan.load(args.plan)
+    if args.output:
+        plan.output_dir = args.output
+    if args.display:
+        plan.offscreen = False
+        
+    try:
+        runner = HeadlessRunner(plan)
+    except ValueError as e:
+        parser.error(str(e))
+    passed = runner.run()
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Info Overlay
+Info panel composited over a cached pattern, rebuilt only when its text changes
+"""
+
+import pygame
+from typing import Hashable, Sequence, Tuple
+
+BLACK = (0, 0, 0)
+
+
+class PatternLayer:
+    """Copy of a static pattern, so what sits on top can change without a re-render"""
+    
+    def __init__(self):
+        self.surface = None
+        self.key = None
+        
+    def holds(self, key: Hashable) -> bool:
+        return self.surface is not None and self.key == key
+        
+    def store(self, screen: pygame.Surface, key: Hashable = None):
+        # One surface in the screen's format, reused while the size holds
+        if self.surface is None or self.surface.get_size() != screen.get_size():
+            self.surface = pygame.Surface(screen.get_size(), 0, screen)
+        self.surface.blit(screen, (0, 0))
+        self.key = key
+        
+    def restore(self, screen: pygame.Surface, rect: pygame.Rect):
+        """Put the pattern back over part of the screen"""
+        if self.surface is not None:
+            screen.blit(self.surface, rect, rect)
+            
+    def clear(self):
+        self.key = None
+
+
+class InfoOverlay:
+    """Translucent info panel kept in one pre-converted surface"""
+    
+    def __init__(self, position: Tuple[int, int] = (10, 10), alpha: int = 200,
+                 background=BLACK):
+        self.position = position
+        self.alpha = alpha
+        self.background = background
+        self.surface = None
+        self.content = None
+        self.drawn = None  # screen rect covered by the last draw
+        
+    def update(self, size: Tuple[int, int], lines: Sequence) -> bool:
+        """Lines of (text, font, color, (x, y)); the panel is only redrawn when they change"""
+        content = (tuple(size), tuple(lines))
+        if content == self.content:
+            return False
+            
+        if self.surface is None or self.surface.get_size() != tuple(size):
+            self.surface = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
+            self.surface.set_alpha(self.alpha)
+            
+        self.surface.fill(self.background)
+        for text, font, color, position in lines:
+            self.surface.blit(font.render(text, True, color), position)
+        self.content = content
+        return True
+        
+    def draw(self, screen: pygame.Surface):
+        self.drawn = screen.blit(self.surface, self.position)
+        
+    def erase(self, screen: pygame.Surface, layer: PatternLayer):
+        """Uncover the pattern under the last drawn panel"""
+        if self.drawn is not None:
+            layer.restore(screen, self.drawn)
+            self.drawn = None
\ No newline at end of file
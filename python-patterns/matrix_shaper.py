@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Matrix-Shaper Solver
+RGB to XYZ matrices from measured primaries with Bradford/CAT02 adaptation
+"""
+
+import numpy as np
+from typing import Dict
+
+from color_difference import xyY_to_xyz
+
+# Cone response matrices for chromatic adaptation transforms
+BRADFORD = np.array([
+    [0.8951, 0.2664, -0.1614],
+    [-0.7502, 1.7135, 0.0367],
+    [0.0389, -0.0685, 1.0296]
+])
+
+CAT02 = np.array([
+    [0.7328, 0.4296, -0.1624],
+    [-0.7036, 1.6975, 0.0061],
+    [0.0030, 0.0136, 0.9834]
+])
+
+CAT_METHODS = {
+    'bradford': BRADFORD,
+    'cat02': CAT02
+}
+
+# ICC PCS illuminant (D50 as encoded in s15Fixed16)
+PCS_WHITE = np.array([0.9642, 1.0000, 0.8249])
+
+
+def rgb_to_xyz_matrix(primaries_xy, white_xy, white_Y: float = 1.0) -> np.ndarray:
+    """RGB to XYZ matrix from primaries (..., 3, 2) and white (..., 2) xy"""
+    # Leading axes batch several displays into one solve
+    primaries_xy = np.asarray(primaries_xy, dtype=np.float64)
+    white_xy = np.asarray(white_xy, dtype=np.float64)
+    
+    # Primary XYZ at unit luminance, one column per channel
+    columns = xyY_to_xyz(primaries_xy[..., 0], primaries_xy[..., 1])
+    P = np.swapaxes(columns, -1, -2)
+    
+    # Scale each column so R = G = B = 1 reproduces the white point
+    white_xyz = xyY_to_xyz(white_xy[..., 0], white_xy[..., 1], white_Y)
+    scale = np.linalg.solve(P, white_xyz[..., None])[..., 0]
+    
+    return P * scale[..., None, :]
+
+
+def chromatic_adaptation_matrix(source_white, destination_white=PCS_WHITE,
+                                method: str = 'bradford') -> np.ndarray:
+    """von Kries style adaptation matrix between two XYZ whites"""
+    if method not in CAT_METHODS:
+        raise ValueError(f"Unknown adaptation '{method}', expected one of {sorted(CAT_METHODS)}")
+        
+    cone = CAT_METHODS[method]
+    source = np.asarray(source_white, dtype=np.float64)
+    destination = np.asarray(destination_white, dtype=np.float64)
+    
+    # Cone responses of both whites
+    rho_s = source @ cone.T
+    rho_d = destination @ cone.T
+    
+    gain = rho_d / rho_s
+    scaled = gain[..., :, None] * cone
+    return np.linalg.inv(cone) @ scaled
+
+
+def solve_matrix_shaper(primaries: Dict, white_point: Dict,
+                        method: str = 'bradford') -> Dict[str, np.ndarray]:
+    """Solve the profile matrices from ICCProfile-style xy dictionaries"""
+    primaries_xy = np.array([[primaries[c]['x'], primaries[c]['y']]
+                             for c in ('red', 'green', 'blue')])
+    white_xy = np.array([white_point['x'], white_point['y']])
+    
+    rgb_to_xyz = rgb_to_xyz_matrix(primaries_xy, white_xy)
+    white_xyz = rgb_to_xyz.sum(axis=-1)
+    chad = chromatic_adaptation_matrix(white_xyz, PCS_WHITE, method)
+    
+    return {
+        'rgb_to_xyz': rgb_to_xyz,
+        'chad': chad,
+        # Colorant columns (rXYZ, gXYZ, bXYZ) relative to the D50 PCS
+        'colorants': chad @ rgb_to_xyz,
+        'white_xyz': white_xyz
+    }
\ No newline at end of file
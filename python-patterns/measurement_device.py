@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Measurement Devices
+Pluggable colorimeter interface with a simulated colorimeter service
+"""
+
+import sys
+import time
+import argparse
+import multiprocessing
+import numpy as np
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Listener
+from typing import Dict, Optional, Tuple
+
+from matrix_shaper import rgb_to_xyz_matrix
+
+DEFAULT_ADDRESS = ('127.0.0.1', 5757)
+DEFAULT_AUTHKEY = b'neonpulse'
+
+
+class MeasurementDevice(ABC):
+    """Colorimeter or spectro that reads XYZ (cd/m²) of the displayed patch"""
+    
+    name = "Measurement Device"
+    
+    @abstractmethod
+    def measure(self, rgb: Tuple[float, float, float]) -> np.ndarray:
+        """Read the patch currently showing rgb (0-255), returns XYZ"""
+        
+    def move_to(self, x: float, y: float):
+        """Aim the probe at a normalized screen position (0-1); fixed probes ignore it"""
+        
+    def measure_many(self, patches) -> np.ndarray:
+        """Read a sequence of patches, returns XYZ shaped (N, 3)"""
+        return np.array([self.measure(rgb) for rgb in patches])
+        
+    def close(self):
+        """Release the device"""
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass
+class DisplayModel:
+    """Simulated display and instrument characteristics"""
+    primaries: Dict = field(default_factory=lambda: {
+        'red': {'x': 0.640, 'y': 0.330},
+        'green': {'x': 0.300, 'y': 0.600},
+        'blue': {'x': 0.150, 'y': 0.060}
+    })
+    white_point: Dict = field(default_factory=lambda: {'x': 0.3127, 'y': 0.3290})
+    gamma: Tuple[float, float, float] = (2.2, 2.2, 2.2)
+    peak_luminance: float = 120.0  # cd/m²
+    black_luminance: float = 0.12  # cd/m²
+    noise: float = 0.002  # relative reading noise
+    noise_floor: float = 0.001  # absolute noise, cd/m²
+    integration_time: float = 0.5  # seconds per reading at full white
+    low_light_factor: float = 4.0  # extra integration in the dark
+    falloff: float = 0.0  # relative luminance lost in the corners
+    edge_tint: float = 0.0  # relative blue gain in the corners
+    seed: Optional[int] = None
+    
+    def rgb_to_xyz_matrix(self) -> np.ndarray:
+        """Native RGB to XYZ matrix scaled to peak luminance"""
+        primaries_xy = [[self.primaries[c]['x'], self.primaries[c]['y']]
+                        for c in ('red', 'green', 'blue')]
+        white_xy = [self.white_point['x'], self.white_point['y']]
+        return rgb_to_xyz_matrix(primaries_xy, white_xy, self.peak_luminance)
+        
+    def xyz(self, rgb, position=(0.5, 0.5)) -> np.ndarray:
+        """Noise-free XYZ for rgb (..., 3) in 0-255 at a normalized screen position"""
+        linear = np.power(np.clip(np.asarray(rgb, dtype=np.float64) / 255.0, 0.0, 1.0),
+                          np.asarray(self.gamma))
+        black = self.black_luminance / self.peak_luminance
+        # Flare adds the black level on top of every patch
+        xyz = (linear + black) @ self.rgb_to_xyz_matrix().T / (1.0 + black)
+        
+        # Radial non-uniformity, zero at the center and full in the corners
+        r2 = 2.0 * ((position[0] - 0.5) ** 2 + (position[1] - 0.5) ** 2)
+        xyz = xyz * (1.0 - self.falloff * r2)
+        xyz[..., 2] *= 1.0 + self.edge_tint * r2
+        return xyz
+        
+    def integration(self, luminance: float) -> float:
+        """Seconds a reading of this luminance takes"""
+        darkness = 1.0 - min(luminance / self.peak_luminance, 1.0)
+        return self.integration_time * (1.0 + self.low_light_factor * darkness ** 4)
+
+
+class SimulatedColorimeter(MeasurementDevice):
+    """In-process simulated colorimeter"""
+    
+    name = "Simulated Colorimeter"
+    
+    def __init__(self, model: Optional[DisplayModel] = None, realtime: bool = True):
+        self.model = model or DisplayModel()
+        self.realtime = realtime
+        self.rng = np.random.default_rng(self.model.seed)
+        self.readings = 0
+        self.position = (0.5, 0.5)
+        
+    def move_to(self, x: float, y: float):
+        self.position = (x, y)
+        
+    def measure(self, rgb) -> np.ndarray:
+        true_xyz = self.model.xyz(rgb, self.position)
+        
+        # Integrate like the real instrument would
+        if self.realtime:
+            time.sleep(self.model.integration(true_xyz[1]))
+            
+        noisy = true_xyz * (1.0 + self.rng.normal(0.0, self.model.noise, 3))
+        noisy += self.rng.normal(0.0, self.model.noise_floor, 3)
+        self.readings += 1
+        
+        return np.maximum(noisy, 0.0)
+
+
+def serve(model: DisplayModel, address=DEFAULT_ADDRESS, authkey: bytes = DEFAULT_AUTHKEY,
+          ready=None):
+    """Answer measurement requests on a local socket until told to stop"""
+    device = SimulatedColorimeter(model)
+    
+    with Listener(address, authkey=authkey) as listener:
+        if ready is not None:
+            ready.send(listener.address)
+            
+        running = True
+        while running:
+            with listener.accept() as conn:
+                while True:
+                    try:
+                        request = conn.recv()
+                    except EOFError:
+                        break
+                        
+                    command = request.get('cmd')
+                    if command == 'measure':
+                        conn.send({'xyz': device.measure(request['rgb']).tolist()})
+                    elif command == 'move':
+                        device.move_to(request['x'], request['y'])
+                        conn.send({'ok': True})
+                    elif command == 'info':
+                        conn.send({'name': device.name, 'readings': device.readings})
+                    elif command == 'shutdown':
+                        conn.send({'ok': True})
+                        running = False
+                        break
+                    else:
+                        conn.send({'error': f"Unknown command '{command}'"})
+
+
+def start_simulator(model: Optional[DisplayModel] = None, address=('127.0.0.1', 0),
+                    authkey: bytes = DEFAULT_AUTHKEY):
+    """Launch the simulated colorimeter in its own process"""
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=serve,
+        args=(model or DisplayModel(), address, authkey, child),
+        daemon=True
+    )
+    process.start()
+    
+    # Port 0 picks a free port - the child reports the real address
+    if not parent.poll(10.0):
+        process.terminate()
+        raise RuntimeError("Simulated colorimeter failed to start")
+        
+    return process, parent.recv()
+
+
+class RemoteColorimeter(MeasurementDevice):
+    """Client for a colorimeter service on a local socket"""
+    
+    name = "Remote Colorimeter"
+    
+    def __init__(self, address=DEFAULT_ADDRESS, authkey: bytes = DEFAULT_AUTHKEY):
+        self.address = address
+        self.conn = Client(address, authkey=authkey)
+        
+    def _request(self, **request) -> Dict:
+        self.conn.send(request)
+        reply = self.conn.recv()
+        if 'error' in reply:
+            raise RuntimeError(reply['error'])
+        return reply
+        
+    def measure(self, rgb) -> np.ndarray:
+        reply = self._request(cmd='measure', rgb=[float(v) for v in rgb])
+        return np.array(reply['xyz'])
+        
+    def move_to(self, x: float, y: float):
+        self._request(cmd='move', x=float(x), y=float(y))
+        
+    def info(self) -> Dict:
+        return self._request(cmd='info')
+        
+    def shutdown(self):
+        """Stop the service process"""
+        self._request(cmd='shutdown')
+        self.close()
+        
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def benchmark(readings: int, integration_time: float):
+    """Time readings through a freshly started simulator process"""
+    model = DisplayModel(integration_time=integration_time, seed=1)
+    process, address = start_simulator(model)
+    
+    device = RemoteColorimeter(address)
+    patches = np.linspace(0, 255, readings)[:, None].repeat(3, axis=1)
+    
+    start = time.perf_counter()
+    device.measure_many(patches)
+    elapsed = time.perf_counter() - start
+    
+    device.shutdown()
+    process.join()
+    
+    print(f"{readings} readings in {elapsed:.2f}s ({readings / elapsed:.1f} readings/s)")
+
+
+def main():
+    """Run the simulated colorimeter service"""
+    parser = argparse.ArgumentParser(description="NEONpulseTechshop simulated colorimeter")
+    parser.add_argument('--port', type=int, default=DEFAULT_ADDRESS[1])
+    parser.add_argument('--gamma', type=float, default=2.2)
+    parser.add_argument('--luminance', type=float, default=120.0)
+    parser.add_argument('--integration', type=float, default=0.5)
+    parser.add_argument('--benchmark', type=int, metavar='READINGS',
+                        help="Time this many readings against a local simulator and exit")
+    args = parser.parse_args()
+    
+    if args.benchmark:
+        benchmark(args.benchmark, args.integration)
+        return
+        
+    model = DisplayModel(gamma=(args.gamma,) * 3,
+                         peak_luminance=args.luminance,
+                         integration_time=args.integration)
+                         
+    print(f"Simulated colorimeter listening on {DEFAULT_ADDRESS[0]}:{args.port}")
+    try:
+        serve(model, (DEFAULT_ADDRESS[0], args.port))
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Measurement Scheduler
+Asyncio pipeline overlapping patch display, settling and colorimeter readings
+"""
+
+import time
+import asyncio
+import pygame
+import numpy as np
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from measurement_device import MeasurementDevice
+
+
+@dataclass
+class Instrument:
+    """A measurement device aimed at one region of the screen"""
+    device: MeasurementDevice
+    region: Tuple[int, int, int, int]  # x, y, width, height
+    name: str = ""
+    settle_time: Optional[float] = None  # overrides the scheduler default
+
+
+@dataclass
+class Patch:
+    """A patch shown at its own screen region instead of the instrument's"""
+    rgb: Tuple[float, float, float]
+    region: Tuple[int, int, int, int]
+
+
+@dataclass
+class Reading:
+    """One completed measurement"""
+    index: int
+    rgb: Tuple[float, float, float]
+    xyz: np.ndarray
+    instrument: str
+    presented: float
+    measured: float
+    region: Optional[Tuple[int, int, int, int]] = None
+
+
+def solid_patch(rgb, size: Tuple[int, int]) -> pygame.Surface:
+    """Default patch renderer - a flat field of the requested color"""
+    surface = pygame.Surface(size)
+    surface.fill(tuple(int(round(v)) for v in rgb))
+    return surface
+
+
+class MeasurementScheduler:
+    """Drive several instruments at once while pygame keeps pumping events"""
+    
+    def __init__(self, screen: pygame.Surface, instruments: Sequence[Instrument],
+                 settle_time: float = 0.25, fps: int = 60,
+                 render_patch: Callable = solid_patch,
+                 on_reading: Optional[Callable[[Reading], None]] = None,
+                 deadline: Optional[float] = None,
+                 update: Optional[Callable] = None):
+        self.screen = screen
+        self.instruments = list(instruments)
+        self.settle_time = settle_time
+        self.fps = fps
+        self.render_patch = render_patch
+        self.on_reading = on_reading
+        # time.monotonic() after which no new patch is started
+        self.deadline = deadline
+        # Puts changed regions on screen, for screens that aren't the display surface
+        self.update = update or pygame.display.update
+        
+        self.frame = 0
+        self.cancelled = False
+        self._pending = []
+        self._presented = None
+        self._patches = deque()
+        self._done = False
+        
+    async def pump(self):
+        """Handle events and present queued patches once per frame"""
+        interval = 1.0 / self.fps
+        
+        while not self._done:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    # Stop measuring and hand the quit back to the caller's loop
+                    self.cancelled = True
+                    pygame.event.post(event)
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    self.cancelled = True
+                    
+            if self._pending:
+                regions = []
+                for region, surface in self._pending:
+                    regions.append(self.screen.blit(surface, region))
+                self._pending.clear()
+                self.update(regions)
+                
+                # Wake everything waiting on this frame
+                self.frame += 1
+                self._presented.set()
+                self._presented = asyncio.Event()
+                
+            await asyncio.sleep(interval)
+            
+    async def show(self, region, surface: pygame.Surface) -> float:
+        """Queue a patch and wait until it is on screen"""
+        presented = self._presented
+        self._pending.append((region[:2], surface))
+        await presented.wait()
+        return time.perf_counter()
+        
+    def _take(self):
+        """Next (index, rgb or Patch) for whichever instrument asks first"""
+        if self.cancelled or not self._patches:
+            return None
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.cancelled = True
+            return None
+        return self._patches.popleft()
+        
+    async def _run_instrument(self, instrument: Instrument, readings: List[Reading]):
+        """Present, settle and read patches for one instrument"""
+        settle = self.settle_time if instrument.settle_time is None else instrument.settle_time
+        name = instrument.name or instrument.device.name
+        width, height = self.screen.get_size()
+        
+        def prepare(patch):
+            """rgb, region and rendered surface of a queued patch"""
+            if patch is None:
+                return None
+            index, item = patch
+            if isinstance(item, Patch):
+                rgb, region = item.rgb, item.region
+            else:
+                rgb, region = item, instrument.region
+            return index, rgb, region, self.render_patch(rgb, tuple(region[2:]))
+            
+        current = prepare(self._take())
+        
+        while current is not None:
+            index, rgb, region, surface = current
+            
+            # Move the probe (robot stage) while the patch goes up
+            x, y, w, h = region
+            move = asyncio.ensure_future(asyncio.to_thread(
+                instrument.device.move_to, (x + w / 2) / width, (y + h / 2) / height))
+            presented = await self.show(region, surface)
+            await move
+            await asyncio.sleep(settle)
+            
+            # Integrate in a worker thread and render the next patch meanwhile
+            reading = asyncio.ensure_future(asyncio.to_thread(instrument.device.measure, rgb))
+            current = prepare(self._take())
+            xyz = await reading
+            
+            result = Reading(index, tuple(rgb), np.asarray(xyz), name,
+                             presented, time.perf_counter(), tuple(region))
+            readings.append(result)
+            if self.on_reading is not None:
+                self.on_reading(result)
+                
+    async def run(self, patches) -> List[Reading]:
+        """Measure every patch, returns readings in patch order"""
+        self._patches = deque(enumerate(patches))
+        self._presented = asyncio.Event()
+        self._done = False
+        self.cancelled = False
+        
+        readings = []
+        pump = asyncio.ensure_future(self.pump())
+        try:
+            await asyncio.gather(*(self._run_instrument(instrument, readings)
+                                   for instrument in self.instruments))
+        finally:
+            self._done = True
+            await pump
+            
+        return sorted(readings, key=lambda reading: reading.index)
+        
+    def measure(self, patches) -> List[Reading]:
+        """Blocking wrapper around run()"""
+        return asyncio.run(self.run(patches))
\ No newline at end of file
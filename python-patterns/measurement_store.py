@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Measurement Store
+Columnar storage for colorimeter readings with .npz and append-only log persistence
+"""
+
+import os
+import time
+import struct
+import numpy as np
+from typing import Optional
+
+# One record per reading - input code values and measured XYZ; little-endian
+# so logs written on one machine read back on any other
+MEASUREMENT_DTYPE = np.dtype([
+    ('rgb', '<f4', (3,)),
+    ('xyz', '<f8', (3,)),
+    ('sweep', '<u4'),
+    ('timestamp', '<f8')
+])
+
+# Log file layout: 8-byte magic, version, record size, then raw records
+LOG_MAGIC = b'NEONMEAS'
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct('>8sII')
+
+
+class MeasurementStore:
+    """Growable structured array of measurements"""
+    
+    def __init__(self, capacity: int = 256):
+        self._data = np.zeros(max(capacity, 1), dtype=MEASUREMENT_DTYPE)
+        self._size = 0
+        self.current_sweep = 0
+        self._log = None
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def _reserve(self, count: int):
+        """Make room for count more records, doubling capacity as needed"""
+        needed = self._size + count
+        if needed <= len(self._data) and self._data.flags.writeable:
+            return
+            
+        capacity = max(len(self._data), 1)
+        while capacity < needed:
+            capacity *= 2
+            
+        # Also detaches a read-only memory map on first write
+        grown = np.zeros(capacity, dtype=MEASUREMENT_DTYPE)
+        grown[:self._size] = self._data[:self._size]
+        self._data = grown
+        
+    def append(self, rgb, xyz, timestamp: Optional[float] = None):
+        """Add a single reading"""
+        self.extend(np.asarray(rgb)[None, :], np.asarray(xyz)[None, :], timestamp)
+        
+    def extend(self, rgb, xyz, timestamp=None):
+        """Add a block of readings, rgb and xyz shaped (N, 3)"""
+        rgb = np.asarray(rgb, dtype=np.float32).reshape(-1, 3)
+        xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+        if len(rgb) != len(xyz):
+            raise ValueError(f"Got {len(rgb)} inputs for {len(xyz)} readings")
+            
+        count = len(rgb)
+        self._reserve(count)
+        
+        block = self._data[self._size:self._size + count]
+        block['rgb'] = rgb
+        block['xyz'] = xyz
+        block['sweep'] = self.current_sweep
+        block['timestamp'] = time.time() if timestamp is None else timestamp
+        self._size += count
+        
+        if self._log is not None:
+            block.tofile(self._log)
+            
+    def new_sweep(self) -> int:
+        """Start a new sweep, e.g. a repeated ramp later in time"""
+        if self._size:
+            self.current_sweep = int(self.sweep.max()) + 1
+        return self.current_sweep
+        
+    # Column views - no per-record access
+    @property
+    def records(self) -> np.ndarray:
+        return self._data[:self._size]
+        
+    @property
+    def rgb(self) -> np.ndarray:
+        return self._data['rgb'][:self._size]
+        
+    @property
+    def xyz(self) -> np.ndarray:
+        return self._data['xyz'][:self._size]
+        
+    @property
+    def sweep(self) -> np.ndarray:
+        return self._data['sweep'][:self._size]
+        
+    @property
+    def timestamp(self) -> np.ndarray:
+        return self._data['timestamp'][:self._size]
+        
+    def select_sweep(self, sweep: int) -> np.ndarray:
+        """Records belonging to one sweep"""
+        return self.records[self.sweep == sweep]
+        
+    def to_columns(self) -> dict:
+        """Plain-list columns for JSON export"""
+        return {
+            'input': self.rgb.tolist(),
+            'output': self.xyz.tolist(),
+            'sweep': self.sweep.tolist(),
+            'timestamp': self.timestamp.tolist()
+        }
+        
+    def save_npz(self, filename: str):
+        """Save all columns as a compressed .npz archive"""
+        np.savez_compressed(filename,
+                            rgb=self.rgb, xyz=self.xyz,
+                            sweep=self.sweep, timestamp=self.timestamp)
+                            
+    @classmethod
+    def load_npz(cls, filename: str) -> 'MeasurementStore':
+        """Load a store saved with save_npz"""
+        with np.load(filename) as archive:
+            store = cls(capacity=len(archive['rgb']))
+            count = len(archive['rgb'])
+            store._data['rgb'][:count] = archive['rgb']
+            store._data['xyz'][:count] = archive['xyz']
+            store._data['sweep'][:count] = archive['sweep']
+            store._data['timestamp'][:count] = archive['timestamp']
+            store._size = count
+            
+        store.current_sweep = int(store.sweep.max()) if count else 0
+        return store
+        
+    def attach_log(self, filename: str):
+        """Append every new record to an on-disk log as it arrives"""
+        self.close_log()
+        
+        is_new = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        if not is_new:
+            # Only ever append to a log with our layout
+            self._check_log(filename)
+            
+        self._log = open(filename, 'ab')
+        if is_new:
+            self._log.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, MEASUREMENT_DTYPE.itemsize))
+        else:
+            # Drop a torn final record so new records stay aligned
+            body = os.path.getsize(filename) - LOG_HEADER.size
+            self._log.truncate(LOG_HEADER.size + body - body % MEASUREMENT_DTYPE.itemsize)
+            
+    def flush_log(self):
+        """Push buffered log records to disk"""
+        if self._log is not None:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            
+    def close_log(self):
+        """Flush and detach the on-disk log"""
+        if self._log is not None:
+            self.flush_log()
+            self._log.close()
+            self._log = None
+            
+    @staticmethod
+    def _check_log(filename: str) -> int:
+        """Validate a log header, returns the record size"""
+        with open(filename, 'rb') as f:
+            header = f.read(LOG_HEADER.size)
+            
+        if len(header) == LOG_HEADER.size:
+            magic, version, itemsize = LOG_HEADER.unpack(header)
+            if (magic == LOG_MAGIC and version == LOG_VERSION
+                    and itemsize == MEASUREMENT_DTYPE.itemsize):
+                return itemsize
+        raise ValueError(f"{filename} is not a version {LOG_VERSION} measurement log")
+        
+    @classmethod
+    def open_log(cls, filename: str, mmap: bool = True) -> 'MeasurementStore':
+        """Open an append-only log, memory-mapped read-only by default"""
+        itemsize = cls._check_log(filename)
+        
+        # A torn final record (crash mid-write) is ignored
+        count = (os.path.getsize(filename) - LOG_HEADER.size) // itemsize
+        
+        store = cls(capacity=1)
+        if count:
+            if mmap:
+                store._data = np.memmap(filename, dtype=MEASUREMENT_DTYPE, mode='r',
+                                        offset=LOG_HEADER.size, shape=(count,))
+            else:
+                store._data = np.fromfile(filename, dtype=MEASUREMENT_DTYPE,
+                                          count=count, offset=LOG_HEADER.size)
+            store._size = count
+            store.current_sweep = int(store.sweep.max())
+            
+        return store
\ No newline at end of file
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Monitor Pattern Kernels
+Multi-monitor patterns drawn into (height, width, 3) uint8 arrays
+"""
+
+import numpy as np
+from typing import List, Tuple
+
+# Colors
+NEON_GREEN = (0, 255, 65)
+NEON_MAGENTA = (255, 0, 255)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+# Color matching patches, row-major in a 4x2 block
+COLOR_PATCHES = [
+    ('Red', (255, 0, 0)),
+    ('Green', (0, 255, 0)),
+    ('Blue', (0, 0, 255)),
+    ('White', (255, 255, 255)),
+    ('Gray', (128, 128, 128)),
+    ('Yellow', (255, 255, 0)),
+    ('Magenta', (255, 0, 255)),
+    ('Cyan', (0, 255, 255))
+]
+
+GAMMA_VALUES = [1.0, 1.8, 2.2, 2.8]
+GAMMA_SQUARE = 100
+
+
+def _clear(out: np.ndarray, color):
+    """Fill the whole frame; neutral colors go through a plain memset"""
+    if color[0] == color[1] == color[2]:
+        out.fill(color[0])
+    else:
+        out[:] = color
+
+
+def _fill_rect(out: np.ndarray, x: int, y: int, w: int, h: int, color):
+    """Clipped solid rectangle"""
+    height, width = out.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, width), min(y + h, height)
+    if x1 > x0 and y1 > y0:
+        out[y0:y1, x0:x1] = color
+
+
+def _frame_rect(out: np.ndarray, x: int, y: int, w: int, h: int, color, border: int):
+    """Rectangle outline drawn inside its bounds"""
+    _fill_rect(out, x, y, w, border, color)
+    _fill_rect(out, x, y + h - border, w, border, color)
+    _fill_rect(out, x, y, border, h, color)
+    _fill_rect(out, x + w - border, y, border, h, color)
+
+
+def _rings(out: np.ndarray, cx: int, cy: int, radii: range, thickness: int, color):
+    """Evenly spaced circle outlines in one distance pass over their bounding box"""
+    if len(radii) == 0:
+        return
+    height, width = out.shape[:2]
+    outer = radii[-1]
+    x0, x1 = max(cx - outer, 0), min(cx + outer + 1, width)
+    y0, y1 = max(cy - outer, 0), min(cy + outer + 1, height)
+    
+    dx = (np.arange(x0, x1, dtype=np.float32) - cx) ** 2
+    dy = (np.arange(y0, y1, dtype=np.float32) - cy) ** 2
+    # Distance past the first radius, in place to keep big frames cheap
+    distance = np.sqrt(dy[:, None] + dx[None, :])
+    distance -= radii.start
+    
+    # Gap up to the next radius; within the thickness means on a ring.
+    # ceil instead of a float modulo, which is several times slower
+    gap = np.ceil(distance / radii.step)
+    gap *= radii.step
+    gap -= distance
+    mask = (gap < thickness) & (distance > -thickness) & (distance <= outer - radii.start)
+    out[y0:y1, x0:x1][mask] = color
+
+
+def _tile_rows(out: np.ndarray, mask: np.ndarray, color):
+    """Paint a (period, width) mask and repeat it down the frame"""
+    height = out.shape[0]
+    count = min(len(mask), height)
+    block = out[:count]
+    block.fill(0)
+    block[mask[:count]] = color
+    
+    # Double the painted rows each copy - contiguous memcpys only
+    while count < height:
+        step = min(count, height - count)
+        out[count:count + step] = out[:step]
+        count += step
+
+
+def _neighbours(viewports, index: int) -> Tuple[bool, bool, bool, bool]:
+    """Whether another viewport lies left, above, right and below this one"""
+    x, y, w, h = viewports[index]
+    left = top = right = bottom = False
+    for i, (ox, oy, ow, oh) in enumerate(viewports):
+        if i == index:
+            continue
+        if oy < y + h and y < oy + oh:
+            left |= ox + ow <= x
+            right |= ox >= x + w
+        if ox < x + w and x < ox + ow:
+            top |= oy + oh <= y
+            bottom |= oy >= y + h
+    return left, top, right, bottom
+
+
+def color_patch_rects(width: int, height: int) -> List[Tuple[int, int, int, int]]:
+    """Rectangles of the color matching patches"""
+    patch_size = min(width, height) // 4
+    start_x = (width - patch_size * 4) // 2
+    start_y = (height - patch_size * 2) // 2
+    return [(start_x + col * patch_size, start_y + row * patch_size,
+             patch_size - 4, patch_size - 4)
+            for row in range(2) for col in range(4)]
+
+
+def gamma_square_rects(width: int, height: int) -> List[Tuple[int, int, int, int]]:
+    """Rectangles of the gamma reference squares"""
+    y_pos = height // 2 - GAMMA_SQUARE // 2
+    return [(j * (width // 4) + (width // 8) - GAMMA_SQUARE // 2, y_pos,
+             GAMMA_SQUARE, GAMMA_SQUARE) for j in range(len(GAMMA_VALUES))]
+
+
+def alignment_grid(out: np.ndarray, grid_size: int = 50):
+    """Grid, center crosshair and corner markers"""
+    height, width = out.shape[:2]
+    _clear(out, BLACK)
+    out[:, ::grid_size] = WHITE
+    out[::grid_size, :] = WHITE
+    
+    # Center crosshairs
+    cx, cy = width // 2, height // 2
+    _fill_rect(out, cx - 100, cy - 1, 201, 3, NEON_GREEN)
+    _fill_rect(out, cx - 1, cy - 100, 3, 201, NEON_GREEN)
+    
+    # Corner markers
+    marker = 50
+    for x, y in ((0, 0), (width - marker, 0), (0, height - 2), (width - marker, height - 2)):
+        _fill_rect(out, x, y, marker, 2, NEON_MAGENTA)
+    for x, y in ((0, 0), (width - 2, 0), (0, height - marker), (width - 2, height - marker)):
+        _fill_rect(out, x, y, 2, marker, NEON_MAGENTA)
+
+
+def bezel_compensation(out: np.ndarray, viewports=(), origin=(0, 0), desktop=None):
+    """Lines, diagonals and circles that should run straight on behind the bezels"""
+    # Drawn on the physical canvas - the pixels behind a bezel are never shown
+    height, width = out.shape[:2]
+    ox, oy = origin
+    desktop_w, desktop_h = desktop or (width, height)
+    
+    # 45 degree diagonals only depend on (x + y) mod 200, so 200 rows repeat
+    y, x = np.ogrid[oy:oy + 200, ox:ox + width]
+    _tile_rows(out, (x + y) % 200 < 2, NEON_MAGENTA)
+    
+    # Grid every 100 px of canvas
+    out[:, -ox % 100::100] = WHITE
+    out[-oy % 100::100, :] = WHITE
+    
+    _rings(out, desktop_w // 2 - ox, desktop_h // 2 - oy,
+           range(100, max(desktop_w, desktop_h), 100), 2, NEON_GREEN)
+           
+    # Ticks along every panel edge facing a neighbour
+    for i, (x, y, w, h) in enumerate(viewports):
+        left, _, right, _ = _neighbours(viewports, i)
+        x, y = x - ox, y - oy
+        ticks = np.arange(y, y + h, 20)
+        ticks = ticks[(ticks >= 0) & (ticks < height)]
+        if left:
+            out[ticks, max(x, 0):max(x + 21, 0)] = NEON_GREEN
+        if right:
+            out[ticks, max(x + w - 21, 0):max(x + w, 0)] = NEON_GREEN
+
+
+def color_matching(out: np.ndarray):
+    """Primary, secondary and neutral patches"""
+    height, width = out.shape[:2]
+    _clear(out, BLACK)
+    for (x, y, w, h), (_, color) in zip(color_patch_rects(width, height), COLOR_PATCHES):
+        _fill_rect(out, x, y, w, h, color)
+
+
+def individual_pattern(out: np.ndarray, kind: str = 'grid'):
+    """Grid, circles, diagonals or checkerboard"""
+    height, width = out.shape[:2]
+    _clear(out, BLACK)
+    
+    if kind == 'grid':
+        out[:, ::30] = WHITE
+        out[::30, :] = WHITE
+    elif kind == 'circles':
+        _rings(out, width // 2, height // 2, range(20, min(width, height) // 2, 30), 2, WHITE)
+    elif kind == 'diagonals':
+        # Two families of 45 degree lines, from the top-left and bottom-right
+        # corners; both only depend on (x + y) mod 40, so 40 rows repeat
+        y, x = np.ogrid[:40, :width]
+        diagonal = x + y
+        lines = (diagonal % 40 < 2) | ((width + height - diagonal) % 40 < 2)
+        _tile_rows(out, lines, WHITE)
+    elif kind == 'checkerboard':
+        # Two alternating bands of 60 rows
+        y, x = np.ogrid[:120, :width]
+        squares = (x // 60 + y // 60) % 2 == 0
+        _tile_rows(out, squares, WHITE)
+    else:
+        raise ValueError(f"Unknown pattern '{kind}'")
+
+
+def span_desktop(out: np.ndarray, viewports=(), origin=(0, 0), desktop=None):
+    """Sine wave, rulers and monitor edge markers across the whole virtual desktop"""
+    # out may be one tile of the desktop, placed at origin in desktop pixels
+    height, width = out.shape[:2]
+    ox, oy = origin
+    desktop_w, desktop_h = desktop or (width, height)
+    _clear(out, BLACK)
+    wave_height = desktop_h // 4
+    wave_center = desktop_h // 2
+    
+    # Rulers through the middle, a tick every 50 px and a long one every 250
+    row, col = wave_center - oy, desktop_w // 2 - ox
+    _fill_rect(out, 0, row, width, 1, WHITE)
+    _fill_rect(out, col, 0, 1, height, WHITE)
+    for spacing, length in ((50, 8), (250, 20)):
+        if -length <= row < height + length:
+            out[max(row - length, 0):max(row + length + 1, 0), -ox % spacing::spacing] = WHITE
+        if -length <= col < width + length:
+            out[-oy % spacing::spacing, max(col - length, 0):max(col + length + 1, 0)] = WHITE
+            
+    # One 5x5 dot per column, all stamped at once; dots centred just
+    # outside a tile still reach into it
+    xs = np.arange(-2, width + 2)
+    ys = wave_center + np.trunc(wave_height * np.sin(2 * np.pi * (xs + ox) / desktop_w * 3)).astype(int) - oy
+    offsets = np.arange(-2, 3)
+    dot_x = (xs[:, None, None] + offsets[None, None, :]).repeat(5, axis=1)
+    dot_y = (ys[:, None, None] + offsets[None, :, None]).repeat(5, axis=2)
+    inside = (dot_x >= 0) & (dot_x < width) & (dot_y >= 0) & (dot_y < height)
+    out[dot_y[inside], dot_x[inside]] = NEON_GREEN
+    
+    # Continuity markers on every monitor edge that meets another monitor
+    for i, (x, y, w, h) in enumerate(viewports):
+        left, top, right, bottom = _neighbours(viewports, i)
+        x, y = x - ox, y - oy
+        if left:
+            _fill_rect(out, x, y, 2, h, NEON_MAGENTA)
+        if top:
+            _fill_rect(out, x, y, w, 2, NEON_MAGENTA)
+        if right:
+            _fill_rect(out, x + w - 2, y, 2, h, NEON_MAGENTA)
+        if bottom:
+            _fill_rect(out, x, y + h - 2, w, 2, NEON_MAGENTA)
+
+
+def sync_bar(out: np.ndarray, time_ms: int = 0, origin=(0, 0), desktop=None):
+    """Vertical bar sweeping across the monitor, or the desktop out is a tile of"""
+    height, width = out.shape[:2]
+    span = (desktop or (width, height))[0]
+    _clear(out, BLACK)
+    bar_x = int((time_ms * 0.5) % (span + 100)) - 50 - origin[0]  # 0.5 pixels per ms
+    _fill_rect(out, bar_x, 0, 50, height, WHITE)
+
+
+def uniformity_field(out: np.ndarray, level: int = 128, grid_size: int = 100):
+    """Flat gray with a reference grid"""
+    out.fill(level)
+    out[:, ::grid_size] = WHITE
+    out[::grid_size, :] = WHITE
+
+
+def gamma_ramp(out: np.ndarray, gamma: float = 2.2):
+    """Gamma encoded horizontal ramp with 50% reference squares"""
+    height, width = out.shape[:2]
+    ramp = ((np.arange(width) / width) ** gamma * 255).astype(np.uint8)
+    out[:] = np.repeat(ramp[:, None], 3, axis=1)
+    
+    for (x, y, w, h), gamma_val in zip(gamma_square_rects(width, height), GAMMA_VALUES):
+        gray = int(0.5 ** gamma_val * 255)  # 50% input
+        _fill_rect(out, x, y, w, h, (gray, gray, gray))
+        _frame_rect(out, x, y, w, h, WHITE, 2)
\ No newline at end of file
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Monitor Scheduler
+Each display on its own pattern and frame rate, or all of them on one shared timeline
+"""
+
+import time
+import pygame
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from frame_scheduler import IDLE_EVENTS
+
+# Frame rates a display can be stepped through
+FPS_STEPS = [1, 5, 15, 24, 30, 60, 120]
+
+
+@dataclass
+class MonitorSchedule:
+    """What one display shows and when its next frame is due"""
+    pattern: int = 0
+    params: Dict = field(default_factory=dict)
+    fps: float = 60.0
+    origin: float = 0.0  # start of this display's timeline, shared while synced
+    due: float = 0.0  # next frame time, for animated patterns
+    frame_time: float = 0.0  # timeline position of the frame being drawn
+    dirty: bool = True
+    stale: bool = False  # shown again as drawn, without a re-render
+
+
+class MonitorScheduler:
+    """Decide which displays need a frame; static ones wait until something changes"""
+    
+    def __init__(self, count: int, fps: float = 60.0, animated: Iterable[int] = (),
+                 clock: Callable[[], float] = time.perf_counter):
+        self.fps = fps
+        self.clock = clock
+        # Pattern indices that change every frame
+        self.animated = set(animated)
+        self.synced = True
+        self.origin = clock()
+        self.monitors = [MonitorSchedule(fps=fps, origin=self.origin, due=self.origin)
+                         for _ in range(count)]
+                         
+    def pattern(self, index: int) -> int:
+        return self.monitors[index].pattern
+        
+    def params(self, index: int) -> Dict:
+        return self.monitors[index].params
+        
+    def interval(self, index: int) -> float:
+        fps = self.fps if self.synced else self.monitors[index].fps
+        return 1.0 / fps
+        
+    def set_pattern(self, pattern: int, index: Optional[int] = None):
+        """Pattern for one display, or every display while synced"""
+        targets = self.monitors if self.synced or index is None else [self.monitors[index]]
+        now = self.clock()
+        for monitor in targets:
+            if monitor.pattern != pattern:
+                monitor.pattern = pattern
+                monitor.due = now
+                # An independent display starts the new pattern at time zero
+                if not self.synced:
+                    monitor.origin = now
+            monitor.dirty = True
+            
+    def set_params(self, index: int, **params):
+        self.monitors[index].params.update(params)
+        self.monitors[index].dirty = True
+        
+    def set_fps(self, index: int, fps: float):
+        """Frame rate of one display, used while it runs independently"""
+        monitor = self.monitors[index]
+        monitor.fps = fps
+        monitor.due = self.clock()
+        # Its frame grid restarts here rather than on the shared timeline
+        if not self.synced:
+            monitor.origin = monitor.due
+            
+    def step_fps(self, index: int, step: int):
+        """Next frame rate up or down the usual steps"""
+        fps = self.monitors[index].fps
+        above = [i for i, value in enumerate(FPS_STEPS) if value >= fps]
+        position = above[0] if above else len(FPS_STEPS) - 1
+        self.set_fps(index, FPS_STEPS[max(0, min(position + step, len(FPS_STEPS) - 1))])
+        
+    def set_synced(self, synced: bool, leader: int = 0):
+        """Sync snaps every display to the leader's pattern on the shared timeline"""
+        self.synced = synced
+        if synced:
+            pattern = self.monitors[leader].pattern
+            now = self.clock()
+            # Next tick of the shared timeline, the same for every display
+            interval = 1.0 / self.fps
+            due = self.origin + (int((now - self.origin) / interval) + 1) * interval
+            for monitor in self.monitors:
+                monitor.pattern = pattern
+                monitor.origin = self.origin
+                monitor.due = due
+        self.invalidate()
+        
+    def invalidate(self, index: Optional[int] = None):
+        """Redraw one display, or all of them, on the next pass"""
+        for monitor in self.monitors if index is None else [self.monitors[index]]:
+            monitor.dirty = True
+            
+    def refresh(self, index: Optional[int] = None):
+        """Present one display, or all of them, again without redrawing the pattern"""
+        for monitor in self.monitors if index is None else [self.monitors[index]]:
+            monitor.stale = True
+            
+    def stale(self) -> List[int]:
+        """Displays to present again as they are"""
+        return [index for index, monitor in enumerate(self.monitors)
+                if monitor.stale and not monitor.dirty and monitor.pattern not in self.animated]
+                
+    def due(self) -> Dict[int, List[int]]:
+        """Displays needing a frame now, grouped by pattern"""
+        now = self.clock()
+        groups = {}
+        for index, monitor in enumerate(self.monitors):
+            animated = monitor.pattern in self.animated
+            # An animated display has no frame worth keeping, it just draws the next one
+            if monitor.dirty or (animated and (monitor.due <= now or monitor.stale)):
+                # Animated frames sit on the timeline grid, so synced displays
+                # drawing the same frame draw the same moment
+                monitor.frame_time = min(monitor.due, now) if animated else now
+                groups.setdefault(monitor.pattern, []).append(index)
+        return groups
+        
+    def time_ms(self, index: int) -> float:
+        """Timeline position of the frame being drawn on a display"""
+        monitor = self.monitors[index]
+        return (monitor.frame_time - monitor.origin) * 1000.0
+        
+    def presented(self, indices: Iterable[int]):
+        """Mark frames shown and book each animated display's next one"""
+        now = self.clock()
+        for index in indices:
+            monitor = self.monitors[index]
+            monitor.dirty = False
+            monitor.stale = False
+            if monitor.pattern in self.animated:
+                # Skip frames that were missed rather than queue them up
+                interval = self.interval(index)
+                ticks = max(int((now - monitor.origin) / interval) + 1, 1)
+                monitor.due = monitor.origin + ticks * interval
+                
+    def timeout(self) -> Optional[float]:
+        """Seconds until a display is due, None while every display is static"""
+        now = self.clock()
+        waits = [0.0 if monitor.dirty or monitor.stale else monitor.due - now
+                 for monitor in self.monitors
+                 if monitor.dirty or monitor.stale or monitor.pattern in self.animated]
+        return max(min(waits), 0.0) if waits else None
+        
+    def events(self) -> List[pygame.event.Event]:
+        """Pending events; sleeps until input or the next due display"""
+        timeout = self.timeout()
+        if timeout is None:
+            events = [pygame.event.wait()] + pygame.event.get()
+        elif timeout >= 0.001:
+            event = pygame.event.wait(int(timeout * 1000))
+            events = ([] if event.type == pygame.NOEVENT else [event]) + pygame.event.get()
+        else:
+            events = pygame.event.get()
+            
+        # Input changes what is drawn over a pattern, not the pattern itself;
+        # whatever changes the pattern invalidates it explicitly
+        if any(event.type not in IDLE_EVENTS for event in events):
+            self.refresh()
+        return events
\ No newline at end of file
@@ -6,38 +6,50 @@ Synchronized patterns across multiple displays
 
 import pygame
 import sys
+import argparse
 import os
-import threading
 import json
-import math
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
 import time
 
+from displays import DisplayWindow, FakeDisplayEnumerator, MonitorInfo, PygameDisplayEnumerator
+from frame_timing import FrameTimer
+from info_overlay import InfoOverlay, PatternLayer
+import monitor_patterns
+from measurement_device import MeasurementDevice
+from measurement_scheduler import Instrument, MeasurementScheduler
+from monitor_scheduler import MonitorScheduler
+from render_workers import FrameCache, RenderJob, RenderScheduler
+from uniformity import UniformityResult, measurement_plan
+from wall_layout import WallLayout
+
 # Initialize Pygame
 pygame.init()
 
-@dataclass
-class MonitorInfo:
-    """Information about a connected monitor"""
-    index: int
-    name: str
-    resolution: Tuple[int, int]
-    position: Tuple[int, int]
-    is_primary: bool
-    surface: Optional[pygame.Surface] = None
-
-
 class MultiMonitorTestSuite:
     """Test suite for multiple monitors"""
     
-    def __init__(self):
+    def __init__(self, device: Optional[MeasurementDevice] = None, enumerator=None,
+                 layout: Optional[WallLayout] = None):
         self.monitors = []
+        self.outputs = []
         self.running = True
-        self.current_pattern = 0
-        self.sync_patterns = True
         self.master_surface = None
         self.show_info = True
+        self.info = InfoOverlay()
+        self.pattern_layer = PatternLayer()
+        
+        # Where displays come from; a FakeDisplayEnumerator stands in for tests
+        self.enumerator = enumerator or PygameDisplayEnumerator()
+        
+        # Physical panel geometry for spanning patterns; pixel positions without one
+        self.wall_layout = layout
+        self.layout = None
+        
+        # Optional colorimeter for measured uniformity
+        self.device = device
+        self.uniformity_grid = (5, 5)
+        self.uniformity = {}
         
         # Font setup
         self.font = pygame.font.Font(None, 36)
@@ -49,6 +61,10 @@ class MultiMonitorTestSuite:
         self.WHITE = (255, 255, 255)
         self.BLACK = (0, 0, 0)
         
+        # Gray levels for uniformity testing
+        self.UNIFORMITY_LEVELS = [64, 128, 192]
+        self.INDIVIDUAL_KINDS = ['grid', 'circles', 'diagonals', 'checkerboard']
+        
         # Pattern functions
         self.patterns = [
             self.alignment_grid,
@@ -60,6 +76,20 @@ class MultiMonitorTestSuite:
             self.uniformity_test,
             self.multi_gamma_test
         ]
+        self.animated_patterns = {self.refresh_sync_test}
+        
+        # Pattern, parameters and frame rate per display, set up once the
+        # displays are open; the keyboard drives the focused one when unsynced
+        self.schedule = None
+        self.focus = 0
+        
+        # Present timestamps, recorded while the refresh sync test runs
+        self.frame_timer = None
+        
+        # Monitors render in parallel, identical ones only once; labels are
+        # drawn on top afterwards
+        self.renderer = RenderScheduler()
+        self.frame_cache = FrameCache(self.renderer)
         
         self.pattern_names = [
             "Monitor Alignment Grid",
@@ -73,44 +103,9 @@ class MultiMonitorTestSuite:
         ]
         
     def detect_monitors(self) -> List[MonitorInfo]:
-        """Detect connected monitors (simplified)"""
-        monitors = []
-        
-        # For simplicity, we'll simulate multiple monitors
-        # In a real implementation, you'd use platform-specific APIs
-        
-        # Get primary display info
-        info = pygame.display.Info()
-        primary_width = info.current_w
-        primary_height = info.current_h
-        
-        # Simulate multiple monitors based on screen width
-        if primary_width >= 3840:  # Assume dual 1920x1080 or single 4K
-            monitors.append(MonitorInfo(
-                index=0,
-                name="Monitor 1",
-                resolution=(1920, 1080),
-                position=(0, 0),
-                is_primary=True
-            ))
-            monitors.append(MonitorInfo(
-                index=1,
-                name="Monitor 2", 
-                resolution=(1920, 1080),
-                position=(1920, 0),
-                is_primary=False
-            ))
-        else:
-            # Single monitor
-            monitors.append(MonitorInfo(
-                index=0,
-                name="Primary Monitor",
-                resolution=(primary_width, primary_height),
-                position=(0, 0),
-                is_primary=True
-            ))
-            
-        return monitors
+        """Displays from the enumerator, primary first"""
+        monitors = self.enumerator.displays()
+        return sorted(monitors, key=lambda m: not m.is_primary)
         
     def initialize(self):
         """Initialize multi-monitor setup"""
@@ -130,91 +125,92 @@ class MultiMonitorTestSuite:
         return True
         
     def _create_monitor_surfaces(self):
-        """Create pygame surfaces for each monitor"""
-        if len(self.monitors) == 1:
-            # Single monitor
-            monitor = self.monitors[0]
-            self.master_surface = pygame.display.set_mode(
-                monitor.resolution, 
-                pygame.FULLSCREEN
-            )
-            monitor.surface = self.master_surface
-        else:
-            # Multiple monitors - create a spanning surface
-            total_width = sum(m.resolution[0] for m in self.monitors)
-            max_height = max(m.resolution[1] for m in self.monitors)
-            
+        """Open a fullscreen window on each display"""
+        title = "NEONpulseTechshop Multi-Monitor Test Suite"
+        self.outputs = []
+        for monitor in self.monitors:
             try:
-                self.master_surface = pygame.display.set_mode(
-                    (total_width, max_height),
-                    pygame.FULLSCREEN | pygame.NOFRAME
-                )
-                
-                # Create subsurfaces for each monitor
-                for monitor in self.monitors:
-                    x_offset = monitor.position[0]
-                    y_offset = monitor.position[1]
-                    width, height = monitor.resolution
-                    
-                    monitor.surface = self.master_surface.subsurface(
-                        (x_offset, y_offset, width, height)
-                    )
-                    
+                self.outputs.append(DisplayWindow(monitor, title))
             except Exception as e:
-                print(f"Could not create spanning surface: {e}")
-                # Fallback to primary monitor only
-                primary = self.monitors[0]
-                self.master_surface = pygame.display.set_mode(
-                    primary.resolution,
-                    pygame.FULLSCREEN
-                )
-                primary.surface = self.master_surface
-                self.monitors = [primary]
+                if monitor.is_primary:
+                    raise
+                print(f"Could not open a window on {monitor.name}: {e}")
+                monitor.surface = None
+                
+        # Only displays with a window take part
+        self.monitors = [output.monitor for output in self.outputs]
+        self.master_surface = self.outputs[0].surface
+        self.layout = self.resolve_layout()
+        self.schedule = MonitorScheduler(len(self.monitors), 60,
+                                         [i for i, pattern in enumerate(self.patterns)
+                                          if pattern in self.animated_patterns])
+                                          
+    def resolve_layout(self) -> WallLayout:
+        """The wall layout matched to the open displays"""
+        if self.wall_layout is not None:
+            try:
+                return self.wall_layout.for_displays(self.monitors)
+            except ValueError as e:
+                print(f"{e} - spanning patterns use the desktop layout")
+        return WallLayout.from_monitors(self.monitors)
+        
+    def present(self, indices=None):
+        """Send each display, or just the given ones, its own surface"""
+        for i, output in enumerate(self.outputs):
+            if indices is not None and i not in indices:
+                continue
+            if self.frame_timer is not None:
+                self.frame_timer.present(i, output.present)
+            else:
+                output.present()
                 
-        pygame.display.set_caption("NEONpulseTechshop Multi-Monitor Test Suite")
+    def cached(self, index: int) -> bool:
+        """Animated frames never repeat, keeping them would only push out static ones"""
+        return self.schedule.pattern(index) not in self.schedule.animated
         
-    def alignment_grid(self):
+    def render_monitors(self, kernel, targets, params=None):
+        """Render a kernel for the target monitors in parallel and composite the frames"""
+        # params(i, monitor) gives each monitor's kernel arguments, None skips it
+        monitors, jobs = [], []
+        for i in targets:
+            monitor = self.monitors[i]
+            kwargs = params(i, monitor) if params else {}
+            if monitor.surface is None or kwargs is None:
+                continue
+            monitors.append(monitor)
+            jobs.append(RenderJob(kernel, monitor.resolution, kwargs, self.cached(i)))
+            
+        for monitor, surface in zip(monitors, self.frame_cache.surfaces(jobs)):
+            monitor.surface.blit(surface, (0, 0))
+            
+    def render_desktop(self, kernel, targets, params=None):
+        """Render a wall canvas pattern, each target monitor drawing only the canvas behind it"""
+        # Bezels and gaps between mixed-size monitors are never allocated or drawn
+        params = dict(params or {}, viewports=self.layout.viewports)
+        panel_kernels = self.layout.panel_kernels(kernel)
+        monitors, jobs = [], []
+        for i in targets:
+            monitor, panel_kernel = self.monitors[i], panel_kernels[i]
+            if monitor.surface is None:
+                continue
+            monitors.append(monitor)
+            jobs.append(RenderJob(panel_kernel, monitor.resolution, params, self.cached(i)))
+            
+        for monitor, surface in zip(monitors, self.frame_cache.surfaces(jobs)):
+            monitor.surface.blit(surface, (0, 0))
+            
+    def alignment_grid(self, targets):
         """Display alignment grids on all monitors"""
-        for i, monitor in enumerate(self.monitors):
+        self.render_monitors(monitor_patterns.alignment_grid, targets)
+        
+        for i in targets:
+            monitor = self.monitors[i]
             if monitor.surface is None:
                 continue
                 
             surface = monitor.surface
-            surface.fill(self.BLACK)
-            
-            # Draw grid
-            grid_size = 50
             width, height = monitor.resolution
-            
-            # Vertical lines
-            for x in range(0, width, grid_size):
-                pygame.draw.line(surface, self.WHITE, (x, 0), (x, height), 1)
-                
-            # Horizontal lines
-            for y in range(0, height, grid_size):
-                pygame.draw.line(surface, self.WHITE, (0, y), (width, y), 1)
-                
-            # Center crosshairs
             center_x = width // 2
-            center_y = height // 2
-            pygame.draw.line(surface, self.NEON_GREEN, 
-                           (center_x - 100, center_y), (center_x + 100, center_y), 3)
-            pygame.draw.line(surface, self.NEON_GREEN,
-                           (center_x, center_y - 100), (center_x, center_y + 100), 3)
-                           
-            # Corner markers
-            marker_size = 50
-            pygame.draw.line(surface, self.NEON_MAGENTA, (0, 0), (marker_size, 0), 3)
-            pygame.draw.line(surface, self.NEON_MAGENTA, (0, 0), (0, marker_size), 3)
-            
-            pygame.draw.line(surface, self.NEON_MAGENTA, (width - marker_size, 0), (width, 0), 3)
-            pygame.draw.line(surface, self.NEON_MAGENTA, (width, 0), (width, marker_size), 3)
-            
-            pygame.draw.line(surface, self.NEON_MAGENTA, (0, height - marker_size), (0, height), 3)
-            pygame.draw.line(surface, self.NEON_MAGENTA, (0, height), (marker_size, height), 3)
-            
-            pygame.draw.line(surface, self.NEON_MAGENTA, (width - marker_size, height), (width, height), 3)
-            pygame.draw.line(surface, self.NEON_MAGENTA, (width, height - marker_size), (width, height), 3)
             
             # Monitor label
             label = f"Monitor {i + 1}"
@@ -228,285 +224,207 @@ class MultiMonitorTestSuite:
             res_rect = res_label.get_rect(center=(center_x, 80))
             surface.blit(res_label, res_rect)
             
-    def bezel_compensation(self):
+    def bezel_compensation(self, targets):
         """Test bezel compensation across monitors"""
-        for i, monitor in enumerate(self.monitors):
-            if monitor.surface is None:
-                continue
-                
-            surface = monitor.surface
-            surface.fill(self.BLACK)
-            width, height = monitor.resolution
-            
-            # Draw lines that should continue across bezels
-            line_spacing = 100
-            
-            # Horizontal lines
-            for y in range(line_spacing, height, line_spacing):
-                pygame.draw.line(surface, self.WHITE, (0, y), (width, y), 2)
-                
-            # Vertical continuation lines at edges
-            if i > 0:  # Not the leftmost monitor
-                for y in range(0, height, 20):
-                    pygame.draw.line(surface, self.NEON_GREEN, (0, y), (20, y), 1)
-                    
-            if i < len(self.monitors) - 1:  # Not the rightmost monitor
-                for y in range(0, height, 20):
-                    pygame.draw.line(surface, self.NEON_GREEN, (width - 20, y), (width, y), 1)
-                    
-            # Center pattern
-            center_x = width // 2
-            center_y = height // 2
-            
-            # Draw circles from center
-            for radius in range(50, min(width, height) // 2, 50):
-                pygame.draw.circle(surface, self.WHITE, (center_x, center_y), radius, 1)
-                
-    def color_matching(self):
+        # Geometry continues behind the bezels, so lines line up across the gaps
+        self.render_desktop(monitor_patterns.bezel_compensation, targets)
+        
+    def color_matching(self, targets):
         """Test color matching across monitors"""
         # Color patches that should match across monitors
-        colors = [
-            (255, 0, 0),    # Red
-            (0, 255, 0),    # Green
-            (0, 0, 255),    # Blue
-            (255, 255, 255), # White
-            (128, 128, 128), # Gray
-            (255, 255, 0),   # Yellow
-            (255, 0, 255),   # Magenta
-            (0, 255, 255)    # Cyan
-        ]
+        self.render_monitors(monitor_patterns.color_matching, targets)
         
-        for i, monitor in enumerate(self.monitors):
+        for i in targets:
+            monitor = self.monitors[i]
             if monitor.surface is None:
                 continue
                 
             surface = monitor.surface
-            surface.fill(self.BLACK)
             width, height = monitor.resolution
             
-            # Draw color patches
-            patch_size = min(width, height) // 4
-            start_x = (width - patch_size * 4) // 2
-            start_y = (height - patch_size * 2) // 2
-            
-            for row in range(2):
-                for col in range(4):
-                    color_index = row * 4 + col
-                    if color_index < len(colors):
-                        color = colors[color_index]
-                        rect = pygame.Rect(
-                            start_x + col * patch_size,
-                            start_y + row * patch_size,
-                            patch_size - 4,
-                            patch_size - 4
-                        )
-                        pygame.draw.rect(surface, color, rect)
-                        
-                        # Color label
-                        color_names = ['Red', 'Green', 'Blue', 'White', 'Gray', 'Yellow', 'Magenta', 'Cyan']
-                        if color_index < len(color_names):
-                            label_color = self.BLACK if sum(color) > 400 else self.WHITE
-                            label = self.small_font.render(color_names[color_index], True, label_color)
-                            label_rect = label.get_rect(center=rect.center)
-                            surface.blit(label, label_rect)
-                            
+            # Color labels
+            rects = monitor_patterns.color_patch_rects(width, height)
+            for rect, (name, color) in zip(rects, monitor_patterns.COLOR_PATCHES):
+                label_color = self.BLACK if sum(color) > 400 else self.WHITE
+                label = self.small_font.render(name, True, label_color)
+                label_rect = label.get_rect(center=pygame.Rect(rect).center)
+                surface.blit(label, label_rect)
+                
             # Monitor info
             monitor_text = f"Monitor {i + 1} - Color Matching"
             text = self.small_font.render(monitor_text, True, self.NEON_GREEN)
             surface.blit(text, (10, 10))
             
-    def individual_patterns(self):
+    def individual_patterns(self, targets):
         """Display different patterns on each monitor"""
-        for i, monitor in enumerate(self.monitors):
+        # Different pattern on each monitor unless its parameters pick one
+        kind = self.individual_kind
+        self.render_monitors(monitor_patterns.individual_pattern, targets,
+                             lambda i, monitor: {'kind': kind(i)})
+                             
+        for i in targets:
+            monitor = self.monitors[i]
             if monitor.surface is None:
                 continue
                 
-            surface = monitor.surface
-            surface.fill(self.BLACK)
-            width, height = monitor.resolution
-            
-            # Draw different pattern on each monitor
-            pattern_type = i % 4
-            
-            if pattern_type == 0:
-                self._draw_grid_pattern(surface, width, height)
-                pattern_name = "Grid"
-            elif pattern_type == 1:
-                self._draw_circle_pattern(surface, width, height)
-                pattern_name = "Circles"
-            elif pattern_type == 2:
-                self._draw_diagonal_pattern(surface, width, height)
-                pattern_name = "Diagonals"
-            else:
-                self._draw_checkerboard_pattern(surface, width, height)
-                pattern_name = "Checkerboard"
-            
             # Label
-            label = f"Monitor {i + 1}: {pattern_name}"
+            width = monitor.resolution[0]
+            label = f"Monitor {i + 1}: {kind(i).capitalize()}"
             text = self.font.render(label, True, self.NEON_GREEN)
             text_rect = text.get_rect(center=(width // 2, 50))
-            surface.blit(text, text_rect)
-            
-    def _draw_grid_pattern(self, surface, width, height):
-        """Draw grid pattern"""
-        for x in range(0, width, 30):
-            pygame.draw.line(surface, self.WHITE, (x, 0), (x, height), 1)
-        for y in range(0, height, 30):
-            pygame.draw.line(surface, self.WHITE, (0, y), (width, y), 1)
-            
-    def _draw_circle_pattern(self, surface, width, height):
-        """Draw concentric circles"""
-        center_x = width // 2
-        center_y = height // 2
-        for radius in range(20, min(width, height) // 2, 30):
-            pygame.draw.circle(surface, self.WHITE, (center_x, center_y), radius, 2)
-            
-    def _draw_diagonal_pattern(self, surface, width, height):
-        """Draw diagonal lines"""
-        for i in range(0, width + height, 40):
-            pygame.draw.line(surface, self.WHITE, (0, i), (i, 0), 2)
-            pygame.draw.line(surface, self.WHITE, (width - i, height), (width, height - i), 2)
+            monitor.surface.blit(text, text_rect)
             
-    def _draw_checkerboard_pattern(self, surface, width, height):
-        """Draw checkerboard pattern"""
-        size = 60
-        for row in range(0, height // size + 1):
-            for col in range(0, width // size + 1):
-                if (row + col) % 2 == 0:
-                    rect = pygame.Rect(col * size, row * size, size, size)
-                    pygame.draw.rect(surface, self.WHITE, rect)
-                    
-    def span_test(self):
+    def span_test(self, targets):
         """Test pattern spanning across multiple monitors"""
         if len(self.monitors) < 2:
             # Single monitor fallback
-            self.alignment_grid()
+            self.alignment_grid(targets)
             return
             
-        # Draw a continuous pattern across all monitors
-        total_width = sum(m.resolution[0] for m in self.monitors)
+        # Continuous sine wave and rulers drawn once in desktop coordinates
+        self.render_desktop(monitor_patterns.span_desktop, targets)
         
-        for i, monitor in enumerate(self.monitors):
+        for i in targets:
+            monitor = self.monitors[i]
             if monitor.surface is None:
                 continue
                 
-            surface = monitor.surface
-            surface.fill(self.BLACK)
-            width, height = monitor.resolution
-            
-            # Calculate offset for this monitor
-            x_offset = sum(self.monitors[j].resolution[0] for j in range(i))
-            
-            # Draw continuous sine wave across all monitors
-            wave_height = height // 4
-            wave_center = height // 2
-            
-            for x in range(width):
-                global_x = x_offset + x
-                y = wave_center + int(wave_height * math.sin(2 * math.pi * global_x / total_width * 3))
-                if 0 <= y < height:
-                    pygame.draw.circle(surface, self.NEON_GREEN, (x, y), 3)
-                    
-            # Draw vertical reference line at monitor boundary
-            if i > 0:
-                pygame.draw.line(surface, self.NEON_MAGENTA, (0, 0), (0, height), 3)
-                
             # Monitor label
             label = f"Monitor {i + 1} - Span Test"
             text = self.small_font.render(label, True, self.WHITE)
-            surface.blit(text, (10, 10))
+            monitor.surface.blit(text, (10, 10))
             
-    def refresh_sync_test(self):
+    def refresh_sync_test(self, targets):
         """Test refresh rate synchronization"""
-        # Moving bars to test for tearing across monitors
-        time_ms = pygame.time.get_ticks()
+        # Moving bars to test for tearing across monitors; synced monitors
+        # share one timeline, so their bars should line up
+        self.render_monitors(monitor_patterns.sync_bar, targets,
+                             lambda i, monitor: {'time_ms': self.schedule.time_ms(i)})
+                             
+        # Every present is timed while the test is up; T saves the trace
+        if self.frame_timer is None:
+            self.frame_timer = FrameTimer([m.name for m in self.monitors], self.schedule.fps)
+        timings = {t.display: t for t in self.frame_timer.analyse(last=300)}
         
-        for i, monitor in enumerate(self.monitors):
+        for i in targets:
+            monitor = self.monitors[i]
             if monitor.surface is None:
                 continue
                 
-            surface = monitor.surface
-            surface.fill(self.BLACK)
-            width, height = monitor.resolution
-            
-            # Moving vertical bar
-            bar_speed = 0.5  # pixels per ms
-            bar_x = int((time_ms * bar_speed) % (width + 100)) - 50
-            bar_width = 50
-            
-            if bar_x < width and bar_x + bar_width > 0:
-                rect = pygame.Rect(max(0, bar_x), 0, min(bar_width, width - bar_x), height)
-                pygame.draw.rect(surface, self.WHITE, rect)
-                
             # Refresh rate info
             label = f"Monitor {i + 1} - Sync Test"
             text = self.small_font.render(label, True, self.NEON_GREEN)
-            surface.blit(text, (10, 10))
-            
-    def uniformity_test(self):
+            monitor.surface.blit(text, (10, 10))
+            
+            timing = timings.get(i)
+            if timing is not None:
+                stats = (f"{timing.refresh_hz:.2f} Hz  offset {timing.offset_ms:+.2f} ms  "
+                         f"jitter {timing.jitter_ms:.2f} ms  "
+                         f"dropped {timing.dropped}  repeated {timing.repeated}")
+                text = self.small_font.render(stats, True, self.WHITE)
+                monitor.surface.blit(text, (10, 35))
+                
+    def save_timing_trace(self, filename: Optional[str] = None):
+        """Write the refresh sync test's present timestamps as a trace file"""
+        if self.frame_timer is None:
+            return
+        filename = filename or f"frame_timing_{int(time.time())}.json"
+        self.frame_timer.save(filename)
+        print(f"Timing trace saved as: {filename}")
+        for timing in self.frame_timer.analyse():
+            print(f"  {timing.name}: {timing.refresh_hz:.3f} Hz, offset {timing.offset_ms:+.3f} ms, "
+                  f"jitter {timing.jitter_ms:.3f} ms, {timing.dropped} dropped, "
+                  f"{timing.repeated} repeated of {timing.frames} frames")
+                  
+    def uniformity_test(self, targets):
         """Test brightness uniformity across monitors"""
-        # Gray levels for uniformity testing
-        gray_levels = [64, 128, 192]
-        
-        for i, monitor in enumerate(self.monitors):
+        # Different gray level for each monitor not yet measured
+        self.render_monitors(monitor_patterns.uniformity_field, targets,
+                             lambda i, monitor: None if i in self.uniformity
+                             else {'level': self.uniformity_level(i)})
+                             
+        for i in targets:
+            monitor = self.monitors[i]
             if monitor.surface is None:
                 continue
                 
             surface = monitor.surface
             width, height = monitor.resolution
             
-            # Use different gray level for each monitor
-            gray_value = gray_levels[i % len(gray_levels)]
-            surface.fill((gray_value, gray_value, gray_value))
-            
-            # Grid for uniformity reference
-            for x in range(0, width, 100):
-                pygame.draw.line(surface, self.WHITE, (x, 0), (x, height), 1)
-            for y in range(0, height, 100):
-                pygame.draw.line(surface, self.WHITE, (0, y), (width, y), 1)
+            # Measured heatmap once this monitor has been read
+            if i in self.uniformity:
+                heatmap, metrics = self.uniformity[i]
+                surface.blit(heatmap, (0, 0))
+                label = (f"Monitor {i + 1} - {metrics['uniformity']:.1f}% uniformity, "
+                         f"max Δuv {metrics['max_delta_uv']:.4f}")
+                text = self.font.render(label, True, self.BLACK)
+                surface.blit(text, text.get_rect(center=(width // 2, height - 40)))
+                continue
                 
             # Label
+            gray_value = self.uniformity_level(i)
             label = f"Monitor {i + 1} - Gray {gray_value}"
             text_color = self.BLACK if gray_value > 128 else self.WHITE
             text = self.font.render(label, True, text_color)
             text_rect = text.get_rect(center=(width // 2, height // 2))
             surface.blit(text, text_rect)
             
-    def multi_gamma_test(self):
+    def individual_kind(self, i: int) -> str:
+        """Pattern monitor i shows in the individual patterns test"""
+        default = self.INDIVIDUAL_KINDS[i % len(self.INDIVIDUAL_KINDS)]
+        return self.schedule.params(i).get('kind', default)
+        
+    def uniformity_level(self, i: int) -> int:
+        """Gray level monitor i is tested at"""
+        default = self.UNIFORMITY_LEVELS[i % len(self.UNIFORMITY_LEVELS)]
+        return self.schedule.params(i).get('level', default)
+        
+    def measure_uniformity(self):
+        """Read a grid on every monitor at its gray level and export the maps"""
+        rows, cols = self.uniformity_grid
+        stamp = int(time.time())
+        
+        for output in self.outputs:
+            output.surface.fill(self.BLACK)
+        self.present()
+        
+        for i, (monitor, output) in enumerate(zip(self.monitors, self.outputs)):
+            level = self.uniformity_level(i)
+            patches, slots = measurement_plan((0, 0) + monitor.resolution, rows, cols, [level])
+            
+            # Patches carry their own regions, the instrument region is unused
+            scheduler = MeasurementScheduler(monitor.surface,
+                                             [Instrument(self.device, (0, 0, 1, 1))],
+                                             update=output.present)
+            readings = scheduler.measure(patches)
+            if len(readings) != len(patches):
+                return
+                
+            result = UniformityResult.from_readings(monitor.resolution, [level], rows, cols,
+                                                    slots, readings)
+            files = result.export(f"uniformity_monitor{i + 1}_{stamp}")
+            self.uniformity[i] = (result.heatmap_surface(), result.zone_metrics())
+            print(f"{monitor.name} uniformity saved as: {files['json']}")
+            
+    def multi_gamma_test(self, targets):
         """Test gamma across multiple monitors"""
-        for i, monitor in enumerate(self.monitors):
+        # Gamma gradient and reference squares
+        self.render_monitors(monitor_patterns.gamma_ramp, targets)
+        
+        for i in targets:
+            monitor = self.monitors[i]
             if monitor.surface is None:
                 continue
                 
             surface = monitor.surface
-            surface.fill(self.BLACK)
             width, height = monitor.resolution
             
-            # Gamma gradient
-            for x in range(width):
-                brightness = x / width
-                gamma_corrected = pow(brightness, 2.2)
-                gray_value = int(gamma_corrected * 255)
-                color = (gray_value, gray_value, gray_value)
-                pygame.draw.line(surface, color, (x, 0), (x, height), 1)
-                
-            # Gamma reference squares
-            square_size = 100
-            y_pos = height // 2 - square_size // 2
-            
-            for j, gamma_val in enumerate([1.0, 1.8, 2.2, 2.8]):
-                x_pos = j * (width // 4) + (width // 8) - square_size // 2
-                corrected = pow(0.5, gamma_val)  # 50% input
-                gray = int(corrected * 255)
-                
-                rect = pygame.Rect(x_pos, y_pos, square_size, square_size)
-                pygame.draw.rect(surface, (gray, gray, gray), rect)
-                pygame.draw.rect(surface, self.WHITE, rect, 2)
-                
+            rects = monitor_patterns.gamma_square_rects(width, height)
+            for (x_pos, y_pos, size, _), gamma_val in zip(rects, monitor_patterns.GAMMA_VALUES):
                 # Label
                 label = f"γ{gamma_val}"
                 text = self.small_font.render(label, True, self.NEON_GREEN)
-                text_rect = text.get_rect(center=(x_pos + square_size // 2, y_pos - 20))
+                text_rect = text.get_rect(center=(x_pos + size // 2, y_pos - 20))
                 surface.blit(text, text_rect)
                 
             # Monitor label
@@ -514,29 +432,21 @@ class MultiMonitorTestSuite:
             text = self.small_font.render(monitor_label, True, self.NEON_GREEN)
             surface.blit(text, (10, 10))
             
-    def draw_info(self):
-        """Draw info overlay on primary monitor"""
-        primary = next((m for m in self.monitors if m.is_primary), self.monitors[0])
-        if primary.surface is None:
+    def draw_info(self, index: int, rendered: bool):
+        """Composite the info overlay onto the primary monitor"""
+        surface = self.monitors[index].surface
+        if surface is None:
+            return
+            
+        # A fresh render already covered the old panel, otherwise put the
+        # pattern back from the layer instead of drawing it again
+        if rendered:
+            self.info.drawn = None
+        else:
+            self.info.erase(surface, self.pattern_layer)
+        if not self.show_info:
             return
             
-        # Info background
-        info_width = 400
-        info_height = 200
-        info_surface = pygame.Surface((info_width, info_height))
-        info_surface.set_alpha(200)
-        info_surface.fill(self.BLACK)
-        
-        # Pattern name
-        pattern_name = self.pattern_names[self.current_pattern]
-        name_text = self.font.render(pattern_name, True, self.NEON_GREEN)
-        info_surface.blit(name_text, (10, 10))
-        
-        # Monitor count
-        count_text = f"Monitors: {len(self.monitors)}"
-        count_label = self.small_font.render(count_text, True, self.WHITE)
-        info_surface.blit(count_label, (10, 45))
-        
         # Controls
         controls = [
             "← → : Change Pattern",
@@ -544,59 +454,221 @@ class MultiMonitorTestSuite:
             "I : Toggle Info",
             "ESC : Exit"
         ]
+        if not self.schedule.synced:
+            controls[1:1] = ["TAB : Select Monitor", "- + : Monitor Frame Rate"]
+        if self.patterns[self.schedule.pattern(self.focus)] in (self.individual_patterns,
+                                                                self.uniformity_test):
+            controls.insert(1, "↑ ↓ : Monitor Pattern Variant")
+        if self.device is not None:
+            controls.insert(-1, "M : Measure Uniformity")
+        if self.frame_timer is not None:
+            controls.insert(-1, "T : Save Timing Trace")
+            
+        # Pattern name
+        pattern_name = self.pattern_names[self.schedule.pattern(index)]
+        lines = [(pattern_name, self.font, self.NEON_GREEN, (10, 10))]
+        
+        # Monitor count and sync state
+        if self.schedule.synced:
+            count_text = f"Monitors: {len(self.monitors)} - Synced"
+        else:
+            focus = self.schedule.monitors[self.focus]
+            count_text = (f"Monitors: {len(self.monitors)} - Independent, "
+                          f"Monitor {self.focus + 1} at {focus.fps:g} fps")
+        lines.append((count_text, self.small_font, self.WHITE, (10, 45)))
         
-        y = 75
-        for control in controls:
-            control_text = self.small_font.render(control, True, self.WHITE)
-            info_surface.blit(control_text, (10, y))
-            y += 25
+        for row, control in enumerate(controls):
+            lines.append((control, self.small_font, self.WHITE, (10, 75 + 25 * row)))
             
-        primary.surface.blit(info_surface, (10, 10))
+        # The panel surface is only rebuilt when its text changes
+        self.info.update((400, max(200, 85 + 25 * len(controls))), lines)
+        self.info.draw(surface)
+        
+    def step_params(self, step: int):
+        """Next pattern kind or gray level on the focused monitor"""
+        index = self.focus
+        pattern = self.patterns[self.schedule.pattern(index)]
+        if pattern == self.individual_patterns:
+            kinds = self.INDIVIDUAL_KINDS
+            position = kinds.index(self.individual_kind(index))
+            self.schedule.set_params(index, kind=kinds[(position + step) % len(kinds)])
+        elif pattern == self.uniformity_test:
+            levels = self.UNIFORMITY_LEVELS
+            position = levels.index(self.uniformity_level(index))
+            self.schedule.set_params(index, level=levels[(position + step) % len(levels)])
+            # Back to the gray field, the old heatmap was another level
+            self.uniformity.pop(index, None)
+            
+    def change_pattern(self, step: int):
+        """Next or previous pattern on every monitor, or the focused one when unsynced"""
+        pattern = (self.schedule.pattern(self.focus) + step) % len(self.patterns)
+        self.schedule.set_pattern(pattern, self.focus)
+        self.frame_timer = None
         
     def handle_events(self):
         """Handle keyboard events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in self.schedule.events():
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 elif event.key == pygame.K_RIGHT:
-                    self.current_pattern = (self.current_pattern + 1) % len(self.patterns)
+                    self.change_pattern(1)
                 elif event.key == pygame.K_LEFT:
-                    self.current_pattern = (self.current_pattern - 1) % len(self.patterns)
+                    self.change_pattern(-1)
+                elif event.key == pygame.K_UP:
+                    self.step_params(1)
+                elif event.key == pygame.K_DOWN:
+                    self.step_params(-1)
+                elif event.key == pygame.K_t:
+                    self.save_timing_trace()
                 elif event.key == pygame.K_s:
-                    self.sync_patterns = not self.sync_patterns
+                    # Back in sync everything follows the focused monitor
+                    self.schedule.set_synced(not self.schedule.synced, self.focus)
+                    self.frame_timer = None
+                elif event.key == pygame.K_TAB:
+                    self.focus = (self.focus + 1) % len(self.monitors)
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    self.schedule.step_fps(self.focus, -1)
+                elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                    self.schedule.step_fps(self.focus, 1)
                 elif event.key == pygame.K_i:
                     self.show_info = not self.show_info
-                    
+                elif event.key == pygame.K_m and self.device is not None:
+                    if self.patterns[self.schedule.pattern(self.focus)] == self.uniformity_test:
+                        self.measure_uniformity()
+                        self.schedule.invalidate()
+                        
+    def draw(self) -> List[int]:
+        """Draw every monitor that is due, returns their indices"""
+        due = self.schedule.due()
+        for pattern, targets in due.items():
+            self.patterns[pattern](targets)
+        rendered = sorted(i for targets in due.values() for i in targets)
+        
+        # Keep the primary's static pattern, so the overlay on it can change
+        # without a re-render
+        primary = next((i for i, m in enumerate(self.monitors) if m.is_primary), 0)
+        surface = self.monitors[primary].surface
+        if primary in rendered and surface is not None:
+            if self.schedule.pattern(primary) in self.schedule.animated:
+                self.pattern_layer.clear()
+            else:
+                self.pattern_layer.store(surface)
+                
+        # Monitors shown again as they are, after input or an exposed window
+        drawn = sorted(set(rendered) | set(self.schedule.stale()))
+        if primary in drawn:
+            self.draw_info(primary, primary in rendered)
+        return drawn
+        
     def run(self):
         """Main loop"""
         if not self.initialize():
             return
             
-        clock = pygame.time.Clock()
-        
         while self.running:
             self.handle_events()
             
-            # Draw current pattern
-            self.patterns[self.current_pattern]()
-            
-            # Draw info overlay
-            if self.show_info:
-                self.draw_info()
+            # Static monitors are skipped until something changes on them
+            drawn = self.draw()
+            if drawn:
+                self.present(drawn)
+                self.schedule.presented(drawn)
                 
-            pygame.display.flip()
-            clock.tick(60)
-            
+        self.close()
         pygame.quit()
         sys.exit()
+        
+    def self_test(self, seconds: float = 1.0) -> bool:
+        """Open every display, draw every pattern and run two displays at their own pace"""
+        if not self.initialize():
+            return False
+            
+        failures = []
+        def check(ok: bool, message: str):
+            if not ok:
+                failures.append(message)
+                print(f"FAIL {message}")
+                
+        # One window and one layout panel per display, at its resolution
+        expected = len(self.enumerator.displays())
+        check(len(self.outputs) == expected, f"{len(self.outputs)} windows for {expected} displays")
+        check(all(m.surface is not None and m.surface.get_size() == m.resolution
+                  for m in self.monitors), "a display surface doesn't match its resolution")
+        check([panel.resolution for panel in self.layout.panels] ==
+              [m.resolution for m in self.monitors], "layout panels don't match the displays")
+              
+        # Every pattern on every display, synced
+        everyone = list(range(len(self.monitors)))
+        for index, name in enumerate(self.pattern_names):
+            self.schedule.set_pattern(index)
+            drawn = self.draw()
+            check(drawn == everyone, f"{name} drew {drawn}, expected {everyone}")
+            self.present(drawn)
+            self.schedule.presented(drawn)
+            
+        # Unsynced: the animated sync test on the first display at 30 fps,
+        # a static pattern on the rest, which should draw exactly once
+        fps = 30
+        self.schedule.set_synced(False)
+        self.schedule.set_pattern(self.patterns.index(self.individual_patterns))
+        for i in everyone[1:]:
+            self.schedule.set_pattern(self.patterns.index(self.individual_patterns), i)
+        self.schedule.set_pattern(self.patterns.index(self.refresh_sync_test), 0)
+        self.schedule.set_fps(0, fps)
+        
+        counts = [0] * len(everyone)
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            time.sleep(self.schedule.timeout() or 0.0)
+            drawn = self.draw()
+            for i in drawn:
+                counts[i] += 1
+            self.present(drawn)
+            self.schedule.presented(drawn)
+            
+        check(fps * seconds * 0.5 <= counts[0] <= fps * seconds + 1,
+              f"animated display drew {counts[0]} frames in {seconds:g}s at {fps} fps")
+        check(all(count == 1 for count in counts[1:]),
+              f"static displays drew {counts[1:]} frames, expected one each")
+              
+        self.close()
+        if not failures:
+            print(f"Self-test passed: {len(self.monitors)} displays, {len(self.patterns)} patterns")
+        return not failures
+        
+    def close(self):
+        for output in self.outputs:
+            output.close()
+        self.renderer.close()
 
 
 def main():
     """Main entry point"""
-    suite = MultiMonitorTestSuite()
+    parser = argparse.ArgumentParser(description="NEONpulseTechshop multi-monitor test suite")
+    parser.add_argument('--layout', help="Wall layout JSON with panel sizes and bezels")
+    parser.add_argument('--write-layout', metavar='FILE',
+                        help="Write the detected displays as a layout to edit and exit")
+    parser.add_argument('--fake-displays', metavar='WxH[+X+Y],...',
+                        help="Use made-up displays instead of the real ones, e.g. 800x600,640x480")
+    parser.add_argument('--self-test', action='store_true',
+                        help="Draw every pattern once, check windows, layout and scheduling, and exit")
+    args = parser.parse_args()
+    
+    if args.write_layout:
+        WallLayout.from_monitors(PygameDisplayEnumerator().displays()).save(args.write_layout)
+        print(f"Layout template saved as: {args.write_layout}")
+        return
+        
+    layout = WallLayout.load(args.layout) if args.layout else None
+    enumerator = FakeDisplayEnumerator.parse(args.fake_displays) if args.fake_displays else None
+    suite = MultiMonitorTestSuite(enumerator=enumerator, layout=layout)
+    if args.self_test:
+        passed = suite.self_test()
+        pygame.quit()
+        sys.exit(0 if passed else 1)
     suite.run()
 
 
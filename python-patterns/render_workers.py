@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Render Workers
+Per-monitor frames rendered in parallel on threads
+"""
+
+import os
+import pygame
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class RenderJob:
+    """One monitor's frame: kernel(out, **params) into a (height, width, 3) array"""
+    kernel: Callable
+    size: Tuple[int, int]
+    params: Dict = field(default_factory=dict)
+    cache: bool = True  # False for frames that never repeat, e.g. animation
+    
+    @property
+    def key(self):
+        """Jobs with equal keys produce identical pixels"""
+        return self.kernel, tuple(self.size), tuple(sorted(self.params.items()))
+
+
+def frame_surface(frame: np.ndarray) -> pygame.Surface:
+    """Surface sharing the frame's memory, no copy"""
+    height, width = frame.shape[:2]
+    return pygame.image.frombuffer(frame, (width, height), 'RGB')
+
+
+class RenderScheduler:
+    """Render a frame per monitor at once and hand them back together"""
+    
+    def __init__(self, threads: Optional[int] = None):
+        # The kernels are numpy and release the GIL in their heavy loops
+        self.threads = ThreadPoolExecutor(threads or os.cpu_count())
+        
+    def render(self, jobs: Sequence[RenderJob]) -> List[np.ndarray]:
+        """Frames in job order"""
+        frames = [np.empty((job.size[1], job.size[0], 3), dtype=np.uint8) for job in jobs]
+        
+        # A lone job is cheaper inline than through the pool
+        if len(jobs) == 1:
+            jobs[0].kernel(frames[0], **jobs[0].params)
+            return frames
+            
+        futures = [self.threads.submit(job.kernel, frame, **job.params)
+                   for job, frame in zip(jobs, frames)]
+        for future in futures:
+            future.result()
+        return frames
+        
+    def close(self):
+        self.threads.shutdown()
+
+
+class FrameCache:
+    """Rendered frames keyed by (pattern, resolution, parameters), least recently used out"""
+    
+    def __init__(self, scheduler: RenderScheduler, max_pixels: int = 64_000_000):
+        self.scheduler = scheduler
+        # About 256 MB of 32-bit surfaces
+        self.max_pixels = max_pixels
+        self._surfaces = OrderedDict()
+        self._sizes = {}  # key -> pixels held
+        self._pixels = 0
+        
+    def surfaces(self, jobs: Sequence[RenderJob]) -> List[pygame.Surface]:
+        """A surface per job; identical jobs share one render and one surface"""
+        keys = [job.key for job in jobs]
+        
+        # Render each missing frame once, however many monitors show it;
+        # uncached frames are shown straight from the render buffers
+        missing, fresh = {}, {}
+        for key, job in zip(keys, jobs):
+            if not job.cache:
+                fresh.setdefault(key, job)
+            elif key not in self._surfaces and key not in missing:
+                missing[key] = job
+                
+        if missing or fresh:
+            frames = self.scheduler.render(list(missing.values()) + list(fresh.values()))
+            for key, frame in zip(missing, frames):
+                self._store(key, _own_surface(frame), frame.shape[0] * frame.shape[1])
+            fresh = {key: frame_surface(frame) for key, frame in zip(fresh, frames[len(missing):])}
+            
+        self._evict([key for key, job in zip(keys, jobs) if job.cache])
+        return [self._surfaces[key] if job.cache else fresh[key] for key, job in zip(keys, jobs)]
+        
+    def _store(self, key, surfaces, pixels: int):
+        self._surfaces[key] = surfaces
+        self._sizes[key] = pixels
+        self._pixels += pixels
+        
+    def _evict(self, keys):
+        """Drop the least recently shown, never anything on screen this frame"""
+        for key in keys:
+            self._surfaces.move_to_end(key)
+        while self._pixels > self.max_pixels and len(self._surfaces) > len(set(keys)):
+            key, _ = self._surfaces.popitem(last=False)
+            self._pixels -= self._sizes.pop(key)
+            
+    def clear(self):
+        self._surfaces.clear()
+        self._sizes.clear()
+        self._pixels = 0
+
+
+def _own_surface(frame: np.ndarray) -> pygame.Surface:
+    """Own copy in the display's pixel format, for frames that are kept"""
+    surface = frame_surface(frame)
+    return surface.convert() if pygame.display.get_surface() else surface.copy()
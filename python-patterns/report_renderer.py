@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Report Renderer
+Streams HTML calibration reports with compact inline SVG charts
+"""
+
+import re
+import html
+import numpy as np
+from functools import lru_cache
+from string import Template
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from color_difference import xyz_to_xy
+
+# Rows buffered before each write to the report file
+CHUNK_ROWS = 256
+
+# Polylines are downsampled to at most this many points
+MAX_CURVE_POINTS = 128
+
+# CIE 1931 spectral locus (xy), 380-700nm, closed by the line of purples
+SPECTRAL_LOCUS = np.array([
+    (0.1741, 0.0050), (0.1714, 0.0051), (0.1644, 0.0109), (0.1566, 0.0177),
+    (0.1440, 0.0297), (0.1241, 0.0578), (0.0913, 0.1327), (0.0454, 0.2950),
+    (0.0082, 0.5384), (0.0139, 0.7502), (0.0743, 0.8338), (0.1547, 0.8059),
+    (0.2296, 0.7543), (0.3016, 0.6923), (0.3731, 0.6245), (0.4441, 0.5547),
+    (0.5125, 0.4866), (0.5752, 0.4242), (0.6270, 0.3725), (0.6658, 0.3340),
+    (0.6915, 0.3083), (0.7079, 0.2920), (0.7190, 0.2809), (0.7347, 0.2653)
+])
+
+SRGB_PRIMARIES = np.array([(0.640, 0.330), (0.300, 0.600), (0.150, 0.060)])
+
+CHANNEL_COLORS = ['#ff0040', '#00ff41', '#0080ff']
+
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Calibration Report - $display_name</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #ff00ff, #00ff41);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            text-align: center;
+            margin-bottom: 30px;
+        }
+        .section {
+            background: white;
+            padding: 20px;
+            border-radius: 10px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .metric {
+            display: flex;
+            justify-content: space-between;
+            padding: 10px 0;
+            border-bottom: 1px solid #eee;
+        }
+        .improved {
+            color: #00ff41;
+            font-weight: bold;
+        }
+        .degraded {
+            color: #ff00ff;
+            font-weight: bold;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        th, td {
+            padding: 10px;
+            text-align: left;
+            border-bottom: 1px solid #eee;
+        }
+        th {
+            background: #f0f0f0;
+            font-weight: 600;
+        }
+        .patches td {
+            padding: 2px 10px;
+            font-size: 12px;
+        }
+        svg {
+            width: 100%;
+            height: auto;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>NEONpulseTechshop</h1>
+        <h2>Display Calibration Report</h2>
+        <p>$display_name</p>
+        <p>$timestamp</p>
+    </div>
+
+    <div class="section">
+        <h3>Calibration Summary</h3>
+        <table>
+            <tr>
+                <th>Test</th>
+                <th>Before</th>
+                <th>After</th>
+                <th>Target</th>
+                <th>Result</th>
+            </tr>
+<!-- @section summary_row -->
+            <tr>
+                <td>$test</td>
+                <td>$before</td>
+                <td>$after</td>
+                <td>$target</td>
+                <td class="$status">$status_text</td>
+            </tr>
+<!-- @section summary_end -->
+        </table>
+    </div>
+<!-- @section chart -->
+    <div class="section">
+        <h3>$title</h3>
+<!-- @section chart_end -->
+    </div>
+<!-- @section patches_start -->
+    <div class="section">
+        <h3>Per-Patch Color Accuracy (ΔE$method)</h3>
+        <p>Mean $mean &middot; 95th percentile $p95 &middot; Max $max</p>
+        <table class="patches">
+            <tr>
+                <th>#</th>
+                <th>Patch</th>
+                <th>Measured x</th>
+                <th>Measured y</th>
+                <th>ΔE</th>
+            </tr>
+<!-- @section patch_row -->
+            <tr><td>$index</td><td>$name</td><td>$x</td><td>$y</td><td>$delta_e</td></tr>
+<!-- @section patches_end -->
+        </table>
+    </div>
+<!-- @section footer -->
+    <div class="section">
+        <h3>Recommendations</h3>
+        <ul>
+            <li>Continue to monitor display performance monthly</li>
+            <li>Recalibrate if ambient lighting conditions change</li>
+            <li>Consider hardware calibration for critical color work</li>
+            <li>Save this ICC profile for consistent color across applications</li>
+        </ul>
+    </div>
+
+    <div class="section">
+        <h3>Profile Installation</h3>
+        <p><strong>Windows:</strong> Right-click the .icm file and select "Install Profile"</p>
+        <p><strong>macOS:</strong> Double-click the .icc file to open ColorSync Utility</p>
+        <p><strong>Linux:</strong> Copy to ~/.local/share/icc/ or /usr/share/color/icc/</p>
+    </div>
+</body>
+</html>
+"""
+
+
+@lru_cache(maxsize=None)
+def compile_template(source: str = REPORT_TEMPLATE) -> Dict[str, Template]:
+    """Split the report template into named sections, compiled once"""
+    parts = re.split(r'<!-- @section (\w+) -->\n', source)
+    
+    # First chunk is the document head, then alternating name/body pairs
+    sections = {'head': Template(parts[0])}
+    for name, body in zip(parts[1::2], parts[2::2]):
+        sections[name] = Template(body)
+        
+    return sections
+
+
+def _downsample(points: np.ndarray, limit: int = MAX_CURVE_POINTS) -> np.ndarray:
+    """Evenly thin a point array so charts stay compact"""
+    if len(points) <= limit:
+        return points
+    index = np.linspace(0, len(points) - 1, limit).round().astype(int)
+    return points[index]
+
+
+def _path_data(points: np.ndarray, closed: bool = False) -> str:
+    """SVG path data with coordinates rounded to one decimal"""
+    coords = ' '.join(f"{x:.1f},{y:.1f}" for x, y in points)
+    return f"M{coords}{'Z' if closed else ''}"
+
+
+def svg_tone_curves(curves, width: int = 400, height: int = 300,
+                    gamma: Optional[float] = None) -> Iterator[str]:
+    """Tone response curves, one polyline per channel (values 0-1)"""
+    curves = np.atleast_2d(np.asarray(curves, dtype=np.float64))
+    margin = 30
+    plot_w = width - 2 * margin
+    plot_h = height - 2 * margin
+    
+    yield f'<svg viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">'
+    yield (f'<rect x="{margin}" y="{margin}" width="{plot_w}" height="{plot_h}" '
+           f'fill="none" stroke="#ccc"/>')
+           
+    if gamma is not None:
+        x = np.linspace(0.0, 1.0, MAX_CURVE_POINTS)
+        ref = np.column_stack([margin + x * plot_w, margin + (1.0 - x ** gamma) * plot_h])
+        yield (f'<path d="{_path_data(ref)}" fill="none" stroke="#999" '
+               f'stroke-dasharray="4 3"/>')
+               
+    for channel, curve in enumerate(curves):
+        x = np.linspace(0.0, 1.0, len(curve))
+        points = np.column_stack([margin + x * plot_w,
+                                  margin + (1.0 - np.clip(curve, 0.0, 1.0)) * plot_h])
+        color = CHANNEL_COLORS[channel % len(CHANNEL_COLORS)]
+        yield (f'<path d="{_path_data(_downsample(points))}" fill="none" '
+               f'stroke="{color}" stroke-width="1.5"/>')
+               
+    yield (f'<text x="{width // 2}" y="{height - 8}" font-size="11" '
+           f'text-anchor="middle">Input</text>')
+    yield '</svg>'
+
+
+def svg_delta_e_bars(deltas, width: int = 760, height: int = 200,
+                     thresholds: Tuple[float, ...] = (1.0, 2.0, 3.0)) -> Iterator[str]:
+    """Per-patch ΔE bar chart, drawn as one path per severity band"""
+    deltas = np.asarray(deltas, dtype=np.float64).ravel()
+    margin = 20
+    plot_w = width - 2 * margin
+    plot_h = height - 2 * margin
+    top = max(float(deltas.max()) if len(deltas) else 0.0, thresholds[-1])
+    
+    yield f'<svg viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">'
+    
+    # Threshold guides
+    for limit in thresholds:
+        y = margin + plot_h * (1.0 - limit / top)
+        yield (f'<line x1="{margin}" y1="{y:.1f}" x2="{width - margin}" y2="{y:.1f}" '
+               f'stroke="#ddd"/><text x="0" y="{y + 4:.1f}" font-size="10">{limit:g}</text>')
+               
+    # More patches than pixels - keep the worst patch of each column
+    if len(deltas) > plot_w:
+        starts = np.linspace(0, len(deltas), plot_w, endpoint=False).astype(int)
+        deltas = np.maximum.reduceat(deltas, starts)
+        
+    if len(deltas):
+        bar_w = plot_w / len(deltas)
+        x = margin + np.arange(len(deltas)) * bar_w
+        heights = plot_h * deltas / top
+        band = np.digitize(deltas, thresholds[1:])
+        colors = ['#00ff41', '#ffaa00', '#ff00ff']
+        
+        # One path per band keeps 1000+ bars to a few elements
+        for level, color in enumerate(colors):
+            mask = band == level
+            if not mask.any():
+                continue
+            commands = ''.join(f"M{bx:.1f} {margin + plot_h:.1f}v-{bh:.1f}h{max(bar_w * 0.8, 0.3):.2f}v{bh:.1f}z"
+                               for bx, bh in zip(x[mask], heights[mask]))
+            yield f'<path d="{commands}" fill="{color}"/>'
+            
+    yield '</svg>'
+
+
+def svg_gamut_plot(primaries=None, white=None, points=None,
+                   size: int = 360) -> Iterator[str]:
+    """CIE 1931 xy plot with spectral locus, sRGB reference and measured gamut"""
+    margin = 20
+    scale = size - 2 * margin
+    
+    def to_svg(xy):
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        # x in 0-0.8, y in 0-0.9 mapped into the square plot
+        return np.column_stack([margin + xy[:, 0] / 0.8 * scale,
+                                margin + (1.0 - xy[:, 1] / 0.9) * scale])
+                                
+    yield f'<svg viewBox="0 0 {size} {size}" xmlns="http://www.w3.org/2000/svg">'
+    yield f'<path d="{_path_data(to_svg(SPECTRAL_LOCUS), closed=True)}" fill="#fafafa" stroke="#888"/>'
+    yield (f'<path d="{_path_data(to_svg(SRGB_PRIMARIES), closed=True)}" fill="none" '
+           f'stroke="#999" stroke-dasharray="4 3"/>')
+           
+    if primaries is not None:
+        yield (f'<path d="{_path_data(to_svg(primaries), closed=True)}" fill="none" '
+               f'stroke="#ff00ff" stroke-width="1.5"/>')
+               
+    if points is not None and len(points):
+        # Zero-length round-capped segments draw each patch as a dot
+        dots = ''.join(f"M{x:.1f} {y:.1f}h0" for x, y in to_svg(points))
+        yield f'<path d="{dots}" stroke="#00aa30" stroke-width="4" stroke-linecap="round"/>'
+        
+    if white is not None:
+        (wx, wy), = to_svg(white)
+        yield f'<circle cx="{wx:.1f}" cy="{wy:.1f}" r="4" fill="none" stroke="#000"/>'
+        
+    yield '</svg>'
+
+
+class ReportRenderer:
+    """Writes a CalibrationReport to HTML section by section"""
+    
+    def __init__(self, chunk_rows: int = CHUNK_ROWS):
+        self.chunk_rows = chunk_rows
+        self.sections = compile_template()
+        
+    def render(self, report, filename: str):
+        """Stream the report to filename"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            for chunk in self._chunks(report):
+                f.write(chunk)
+                
+    def _chunks(self, report) -> Iterator[str]:
+        """Yield the document in write-sized pieces"""
+        sections = self.sections
+        
+        yield sections['head'].substitute(
+            display_name=html.escape(report.display_name),
+            timestamp=report.timestamp.strftime('%B %d, %Y at %I:%M %p')
+        )
+        
+        for rec in report.recommendations:
+            yield sections['summary_row'].substitute(
+                test=html.escape(str(rec['test'])),
+                before=html.escape(str(rec['before'])),
+                after=html.escape(str(rec['after'])),
+                target=html.escape(str(rec['target'])),
+                status="improved" if rec['improved'] else "degraded",
+                status_text="✓ Improved" if rec['improved'] else "✗ Degraded"
+            )
+        yield sections['summary_end'].substitute()
+        
+        yield from self._charts(report)
+        yield from self._patch_table(report)
+        
+        yield sections['footer'].substitute()
+        
+    def _chart(self, title: str, svg: Iterator[str]) -> Iterator[str]:
+        """Wrap an SVG generator in a report section"""
+        yield self.sections['chart'].substitute(title=html.escape(title))
+        yield ''.join(svg)
+        yield self.sections['chart_end'].substitute()
+        
+    def _charts(self, report) -> Iterator[str]:
+        """Charts for whichever data the report carries"""
+        tone = report.after_data.get('tone_curves')
+        if tone is not None:
+            yield from self._chart("Tone Response",
+                                   svg_tone_curves(tone['curves'], gamma=tone.get('target')))
+                                   
+        accuracy = report.color_accuracy.get('after')
+        if accuracy is not None:
+            yield from self._chart(f"ΔE{accuracy['method']} per Patch",
+                                   svg_delta_e_bars(accuracy['delta_e']))
+                                   
+        gamut = report.after_data.get('gamut')
+        measured_xy = self._measured_xy(report)
+        if gamut is not None or measured_xy is not None:
+            gamut = gamut or {}
+            primaries = gamut.get('primaries')
+            if isinstance(primaries, dict):
+                primaries = [(primaries[c]['x'], primaries[c]['y'])
+                             for c in ('red', 'green', 'blue')]
+            white = report.after_data.get('white_point')
+            white_xy = (white['x'], white['y']) if white else None
+            yield from self._chart("CIE 1931 xy Gamut",
+                                   svg_gamut_plot(primaries, white_xy, measured_xy))
+                                   
+    def _measured_xy(self, report) -> Optional[np.ndarray]:
+        """Chromaticities of the measured patches, read as one column"""
+        patches = report.after_data.get('color_patches')
+        if patches is None:
+            return None
+        measured = patches['measured']
+        measured = getattr(measured, 'xyz', measured)
+        return xyz_to_xy(measured)
+        
+    def _patch_table(self, report) -> Iterator[str]:
+        """Per-patch rows, written in chunks of chunk_rows"""
+        accuracy = report.color_accuracy.get('after')
+        if accuracy is None:
+            return
+            
+        yield self.sections['patches_start'].substitute(
+            method=accuracy['method'],
+            mean=f"{accuracy['mean']:.2f}",
+            p95=f"{accuracy['p95']:.2f}",
+            max=f"{accuracy['max']:.2f}"
+        )
+        
+        deltas = accuracy['delta_e']
+        names = accuracy.get('names')
+        xy = self._measured_xy(report)
+        row = self.sections['patch_row']
+        
+        for start in range(0, len(deltas), self.chunk_rows):
+            stop = min(start + self.chunk_rows, len(deltas))
+            rows: List[str] = []
+            for i in range(start, stop):
+                name = names[i] if names is not None else f"Patch {i + 1}"
+                rows.append(row.substitute(
+                    index=i + 1,
+                    name=html.escape(str(name)),
+                    x=f"{xy[i, 0]:.4f}",
+                    y=f"{xy[i, 1]:.4f}",
+                    delta_e=f"{deltas[i]:.2f}"
+                ))
+            yield ''.join(rows)
+            
+        yield self.sections['patches_end'].substitute()
\ No newline at end of file
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Uniformity Measurement
+Grid readings interpolated to full-resolution luminance and Δuv maps
+"""
+
+import csv
+import json
+import pygame
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from color_difference import delta_e_xyz
+from color_temperature import xy_to_uv
+from measurement_scheduler import Patch
+
+# Heatmap gradient: low readings dark magenta through to neon green
+HEATMAP_STOPS = np.array([
+    [40, 0, 60],
+    [255, 0, 255],
+    [255, 255, 255],
+    [0, 255, 65]
+], dtype=np.float64)
+
+
+def grid_regions(rect: Tuple[int, int, int, int], rows: int, cols: int,
+                 patch_fraction: float = 0.5) -> np.ndarray:
+    """Patch rectangles (rows, cols, 4) centered in each grid cell of rect"""
+    x0, y0, width, height = rect
+    cell_w = width / cols
+    cell_h = height / rows
+    size_w = max(int(cell_w * patch_fraction), 1)
+    size_h = max(int(cell_h * patch_fraction), 1)
+    
+    cx = x0 + (np.arange(cols) + 0.5) * cell_w
+    cy = y0 + (np.arange(rows) + 0.5) * cell_h
+    regions = np.zeros((rows, cols, 4), dtype=int)
+    regions[..., 0] = np.round(cx - size_w / 2)[None, :]
+    regions[..., 1] = np.round(cy - size_h / 2)[:, None]
+    regions[..., 2] = size_w
+    regions[..., 3] = size_h
+    return regions
+
+
+def serpentine_order(rows: int, cols: int, reverse: bool = False) -> List[Tuple[int, int]]:
+    """Boustrophedon cell order so each patch is next to the previous one"""
+    order = []
+    for row in range(rows):
+        columns = range(cols) if row % 2 == 0 else range(cols - 1, -1, -1)
+        order.extend((row, col) for col in columns)
+    return order[::-1] if reverse else order
+
+
+def measurement_plan(rect, rows: int, cols: int, levels: Sequence[int],
+                     patch_fraction: float = 0.5):
+    """Patches in settle-friendly order plus their (level, row, col) slots"""
+    # Level-major so the panel only changes luminance once per pass, levels
+    # ascending, and each pass starts where the last one finished
+    regions = grid_regions(rect, rows, cols, patch_fraction)
+    patches, slots = [], []
+    for i, level in enumerate(sorted(levels)):
+        for row, col in serpentine_order(rows, cols, reverse=i % 2 == 1):
+            patches.append(Patch((level, level, level), tuple(int(v) for v in regions[row, col])))
+            slots.append((i, row, col))
+    return patches, slots
+
+
+def bicubic_weights(count: int, samples: int) -> np.ndarray:
+    """Dense (count, samples) Keys bicubic weights from cell centers to pixels"""
+    # Pixel centers in grid units, held flat beyond the outermost centers
+    t = np.clip((np.arange(count) + 0.5) * samples / count - 0.5, 0.0, samples - 1)
+    base = np.floor(t).astype(int)
+    frac = t - base
+    
+    weights = np.zeros((count, samples))
+    rows = np.arange(count)
+    for offset in (-1, 0, 1, 2):
+        d = np.abs(frac - offset)
+        w = np.where(d <= 1.0,
+                     1.5 * d ** 3 - 2.5 * d ** 2 + 1.0,
+                     -0.5 * d ** 3 + 2.5 * d ** 2 - 4.0 * d + 2.0)
+        w = np.where(d < 2.0, w, 0.0)
+        # Clamped indices replicate the edge samples
+        np.add.at(weights, (rows, np.clip(base + offset, 0, samples - 1)), w)
+    return weights
+
+
+def interpolate_grid(grid: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Separable bicubic upsample of a (rows, cols) grid to (height, width)"""
+    wy = bicubic_weights(height, grid.shape[0]).astype(np.float32)
+    wx = bicubic_weights(width, grid.shape[1]).astype(np.float32)
+    return wy @ grid.astype(np.float32) @ wx.T
+
+
+def colorize(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Map values onto the heatmap gradient, returns uint8 (..., 3)"""
+    # high below low runs the gradient backwards
+    span = high - low if abs(high - low) > 1e-12 else 1e-12
+    t = np.clip((values - low) / span, 0.0, 1.0)
+    position = t * (len(HEATMAP_STOPS) - 1)
+    index = np.minimum(position.astype(int), len(HEATMAP_STOPS) - 2)
+    frac = (position - index)[..., None]
+    rgb = HEATMAP_STOPS[index] * (1.0 - frac) + HEATMAP_STOPS[index + 1] * frac
+    return rgb.astype(np.uint8)
+
+
+@dataclass
+class UniformityResult:
+    """Grid readings for each gray level"""
+    resolution: Tuple[int, int]
+    levels: List[int]
+    xyz: np.ndarray  # (levels, rows, cols, 3)
+    
+    @classmethod
+    def from_readings(cls, resolution, levels, rows: int, cols: int, slots, readings):
+        """Place scheduler readings back onto the grid"""
+        xyz = np.full((len(levels), rows, cols, 3), np.nan)
+        for reading in readings:
+            level, row, col = slots[reading.index]
+            xyz[level, row, col] = reading.xyz
+        return cls(tuple(resolution), sorted(levels), xyz)
+        
+    @property
+    def center(self) -> Tuple[int, int]:
+        rows, cols = self.xyz.shape[1:3]
+        return rows // 2, cols // 2
+        
+    def _uv(self, level: int) -> np.ndarray:
+        grid = self.xyz[level]
+        total = grid.sum(axis=-1)
+        return np.stack(xy_to_uv(grid[..., 0] / total, grid[..., 1] / total), axis=-1)
+        
+    def luminance_map(self, level: int = -1, size=None) -> np.ndarray:
+        """Full-resolution luminance (cd/m²), float32 (height, width)"""
+        return interpolate_grid(self.xyz[level, ..., 1], *(size or self.resolution))
+        
+    def delta_uv_map(self, level: int = -1, size=None) -> np.ndarray:
+        """Full-resolution Δuv from the center cell, float32 (height, width)"""
+        uv = self._uv(level)
+        reference = uv[self.center]
+        u = interpolate_grid(uv[..., 0], *(size or self.resolution))
+        v = interpolate_grid(uv[..., 1], *(size or self.resolution))
+        return np.hypot(u - reference[0], v - reference[1])
+        
+    def zone_metrics(self, level: int = -1) -> Dict:
+        """Center-referenced zone deviations (ICDM/ISO 14861 style)"""
+        grid = self.xyz[level]
+        center = grid[self.center]
+        Y = grid[..., 1]
+        
+        deviation = (Y - center[1]) / center[1] * 100.0
+        uv = self._uv(level)
+        delta_uv = np.hypot(*(uv - uv[self.center]).transpose(2, 0, 1))
+        delta_e = delta_e_xyz(np.broadcast_to(center, grid.shape), grid, center)
+        
+        return {
+            'level': self.levels[level],
+            'center_luminance': float(center[1]),
+            'min_luminance': float(Y.min()),
+            'max_luminance': float(Y.max()),
+            'uniformity': float(Y.min() / Y.max() * 100.0),  # min/max, %
+            'nonuniformity': float((Y.max() - Y.min()) / Y.max() * 100.0),
+            'max_deviation': float(np.abs(deviation).max()),  # % from center
+            'max_delta_uv': float(delta_uv.max()),
+            'max_delta_e': float(delta_e.max()),
+            'zone_deviation': np.round(deviation, 2).tolist(),
+            'zone_delta_uv': np.round(delta_uv, 5).tolist(),
+            'zone_delta_e': np.round(delta_e, 2).tolist()
+        }
+        
+    def heatmap_surface(self, kind: str = 'luminance', level: int = -1,
+                        size=None, labels: bool = True) -> pygame.Surface:
+        """Heatmap of the interpolated map with each zone's number on top"""
+        width, height = size or self.resolution
+        if kind == 'luminance':
+            grid = self.xyz[level, ..., 1]
+            values = self.luminance_map(level, (width, height))
+            low, high = float(grid.min()), float(grid.max())
+            zone_text = [f"{v:.1f}" for v in grid.ravel()]
+        elif kind == 'delta_uv':
+            zones = np.array(self.zone_metrics(level)['zone_delta_uv'])
+            values = self.delta_uv_map(level, (width, height))
+            # Low Δuv is good, so run the gradient backwards
+            low, high = float(zones.max()), 0.0
+            zone_text = [f"{v:.4f}" for v in zones.ravel()]
+        else:
+            raise ValueError(f"Unknown heatmap '{kind}', expected 'luminance' or 'delta_uv'")
+            
+        surface = pygame.surfarray.make_surface(colorize(values, low, high).swapaxes(0, 1))
+        
+        if labels:
+            rows, cols = self.xyz.shape[1:3]
+            font = pygame.font.Font(None, max(height // (rows * 4), 14))
+            for i, text in enumerate(zone_text):
+                row, col = divmod(i, cols)
+                center = ((col + 0.5) * width / cols, (row + 0.5) * height / rows)
+                label = font.render(text, True, (0, 0, 0))
+                surface.blit(label, label.get_rect(center=center))
+                
+        return surface
+        
+    def export(self, basename: str) -> Dict[str, str]:
+        """Heatmap PNGs, per-zone CSV and metrics JSON for every level"""
+        files = {}
+        metrics = []
+        for i, level in enumerate(self.levels):
+            for kind in ('luminance', 'delta_uv'):
+                filename = f"{basename}_{level}_{kind}.png"
+                pygame.image.save(self.heatmap_surface(kind, i), filename)
+                files[f"{level}_{kind}"] = filename
+            metrics.append(self.zone_metrics(i))
+            
+        csv_name = basename + ".csv"
+        rows, cols = self.xyz.shape[1:3]
+        with open(csv_name, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['level', 'row', 'col', 'X', 'Y', 'Z'])
+            for i, level in enumerate(self.levels):
+                for row in range(rows):
+                    for col in range(cols):
+                        writer.writerow([level, row, col] + [f"{v:.4f}" for v in self.xyz[i, row, col]])
+        files['csv'] = csv_name
+        
+        json_name = basename + ".json"
+        with open(json_name, 'w') as f:
+            json.dump({'resolution': list(self.resolution), 'zones': [rows, cols],
+                       'levels': metrics}, f, indent=2)
+        files['json'] = json_name
+        
+        return files
\ No newline at end of file
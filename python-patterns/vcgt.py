@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Video Card Gamma Tables
+Correction ramps from measured tone curves, vcgt tags and standalone ramp files
+"""
+
+import struct
+import datetime
+import numpy as np
+from typing import Optional
+
+RAMP_SIZES = (256, 1024, 4096)
+
+
+def _batched_interp(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """np.interp along the last axis for stacked curves in one call"""
+    xp, fp = np.broadcast_arrays(xp, fp)
+    batch_shape = np.broadcast_shapes(x.shape[:-1], xp.shape[:-1])
+    x = np.broadcast_to(x, batch_shape + x.shape[-1:])
+    xp = np.broadcast_to(xp, batch_shape + xp.shape[-1:])
+    fp = np.broadcast_to(fp, batch_shape + fp.shape[-1:])
+    
+    # Keep each query inside its own curve's domain
+    x = np.clip(x, xp[..., :1], xp[..., -1:])
+    
+    # Offset every curve onto its own stretch of the number line so a
+    # single interpolation over the flattened arrays serves all of them
+    span = (xp[..., -1:] - xp[..., :1]).max() + 1.0
+    rows = np.arange(int(np.prod(batch_shape))).reshape(batch_shape + (1,)) * span
+    result = np.interp((x + rows).ravel(), (xp + rows).ravel(), fp.ravel())
+    
+    return result.reshape(x.shape)
+
+
+def generate_ramps(levels, response, target_gamma: float = 2.2,
+                   gains=None, size: int = 256) -> np.ndarray:
+    """Per-channel 16-bit correction ramps (..., 3, size) from measured curves"""
+    # levels: input code values (0-1) measured, response: linear light per
+    # channel (..., 3, N), gains: per-channel white point scaling (..., 3)
+    if size not in RAMP_SIZES:
+        raise ValueError(f"Ramp size must be one of {RAMP_SIZES}, got {size}")
+        
+    levels = np.asarray(levels, dtype=np.float64)
+    response = np.asarray(response, dtype=np.float64)
+    
+    # Normalize each channel from its black to its peak, so targets in the
+    # shadows don't all clip to input 0, and force it monotonic
+    levels = np.broadcast_to(levels, response.shape)
+    black = np.where(levels[..., :1] <= 0.0, response[..., :1], 0.0)
+    response = (response - black) / np.maximum(response[..., -1:] - black, 1e-12)
+    response = np.maximum.accumulate(np.clip(response, 0.0, None), axis=-1)
+    
+    # Invert in the gamma encoded domain, where a display already on target
+    # is a straight line and interpolating between sparse levels is exact
+    encoded = response ** (1.0 / target_gamma)
+    encoded = encoded + np.linspace(0.0, 1e-9, response.shape[-1])
+    
+    # Target for every ramp entry, encoded the same way
+    target = np.linspace(0.0, 1.0, size)
+    if gains is not None:
+        target = target * np.asarray(gains, dtype=np.float64)[..., None] ** (1.0 / target_gamma)
+    else:
+        target = np.broadcast_to(target, response.shape[:-1] + (size,))
+        
+    # Invert the measured curve: which input yields the target output
+    ramps = _batched_interp(target, encoded, levels)
+    
+    return np.round(np.clip(ramps, 0.0, 1.0) * 65535).astype(np.uint16)
+
+
+def identity_ramps(size: int = 256) -> np.ndarray:
+    """Linear ramps that leave the video card output unchanged"""
+    ramp = np.round(np.linspace(0.0, 1.0, size) * 65535).astype(np.uint16)
+    return np.tile(ramp, (3, 1))
+
+
+def vcgt_tag(ramps: np.ndarray) -> bytes:
+    """Create vcgt tag (table type, 3 channels, 16-bit entries)"""
+    ramps = np.asarray(ramps, dtype=np.uint16)
+    channels, entries = ramps.shape
+    
+    tag = bytearray()
+    
+    # Type signature
+    tag.extend(b'vcgt')
+    tag.extend(b'\x00' * 4)  # Reserved
+    
+    # Table type, channel count, entry count, entry size in bytes
+    tag.extend(struct.pack('>IHHH', 0, channels, entries, 2))
+    tag.extend(ramps.astype('>u2').tobytes())
+    
+    # Pad to 4-byte boundary
+    while len(tag) % 4:
+        tag.extend(b'\x00')
+        
+    return tag
+
+
+def save_cal(filename: str, ramps: np.ndarray, description: str = "NEONpulseTechshop calibration"):
+    """Export ramps as an ArgyllCMS .cal file (dispwin -I loads it)"""
+    ramps = np.asarray(ramps, dtype=np.float64) / 65535.0
+    entries = ramps.shape[-1]
+    index = np.linspace(0.0, 1.0, entries)
+    
+    with open(filename, 'w') as f:
+        f.write("CAL    \n\n")
+        f.write(f'DESCRIPTOR "{description}"\n')
+        f.write('ORIGINATOR "NEONpulseTechshop"\n')
+        f.write(f'CREATED "{datetime.datetime.now().ctime()}"\n')
+        # Non-standard CGATS keywords have to be declared before use
+        f.write('KEYWORD "DEVICE_CLASS"\n')
+        f.write('DEVICE_CLASS "DISPLAY"\n')
+        f.write('KEYWORD "COLOR_REP"\n')
+        f.write('COLOR_REP "RGB"\n\n')
+        f.write("NUMBER_OF_FIELDS 4\n")
+        f.write("BEGIN_DATA_FORMAT\nRGB_I RGB_R RGB_G RGB_B\nEND_DATA_FORMAT\n\n")
+        f.write(f"NUMBER_OF_SETS {entries}\n")
+        f.write("BEGIN_DATA\n")
+        np.savetxt(f, np.column_stack([index, ramps.T]), fmt='%.6f')
+        f.write("END_DATA\n")
+
+
+def save_raw(filename: str, ramps: np.ndarray):
+    """Export ramps as raw little-endian uint16, red then green then blue"""
+    np.asarray(ramps, dtype='<u2').tofile(filename)
+
+
+def load_raw(filename: str, size: Optional[int] = None) -> np.ndarray:
+    """Load ramps written by save_raw"""
+    data = np.fromfile(filename, dtype='<u2')
+    return data.reshape(3, size or len(data) // 3)
\ No newline at end of file
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Video Wall
+Coordinator and per-panel agent processes sharing one frame clock
+"""
+
+import sys
+import time
+import argparse
+import multiprocessing
+import numpy as np
+import pygame
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Listener, wait
+from typing import Dict, List, Optional, Tuple
+
+import monitor_patterns
+from render_workers import frame_surface
+from wall_layout import CanvasKernel, WallLayout
+
+DEFAULT_ADDRESS = ('127.0.0.1', 5858)
+DEFAULT_AUTHKEY = b'neonpulse'
+
+# Patterns an agent can show on its panel
+WALL_PATTERNS = {
+    'alignment_grid': monitor_patterns.alignment_grid,
+    'color_matching': monitor_patterns.color_matching,
+    'gamma_ramp': monitor_patterns.gamma_ramp,
+    'uniformity_field': monitor_patterns.uniformity_field,
+    'bezel': monitor_patterns.bezel_compensation,
+    'span': monitor_patterns.span_desktop,
+    'sync_bar': monitor_patterns.sync_bar
+}
+
+# Drawn on the wall canvas - each agent renders only the part behind its panel
+CANVAS_PATTERNS = {'bezel', 'span', 'sync_bar'}
+
+# Canvas patterns that mark every panel's edges
+EDGE_PATTERNS = {'bezel', 'span'}
+
+# Driven by the frame clock rather than redrawn from fixed parameters
+ANIMATED_PATTERNS = {'sync_bar'}
+
+
+@dataclass
+class WallStats:
+    """Present timestamps of every agent, on the coordinator's clock"""
+    fps: float
+    scheduled: np.ndarray  # (frames,) target present times
+    presented: np.ndarray  # (frames, agents), NaN where no report arrived
+    agents: List[str] = field(default_factory=list)
+    
+    @property
+    def sync_error(self) -> np.ndarray:
+        """Spread between the first and last panel to present each frame (s)"""
+        return np.nanmax(self.presented, axis=1) - np.nanmin(self.presented, axis=1)
+        
+    @property
+    def late_frames(self) -> int:
+        """Frames where some panel presented a whole frame after its slot"""
+        lateness = np.nanmax(self.presented, axis=1) - self.scheduled
+        return int((lateness > 1.0 / self.fps).sum())
+        
+    @property
+    def missing_reports(self) -> int:
+        return int(np.isnan(self.presented).sum())
+        
+    def summary(self) -> Dict:
+        error = self.sync_error * 1000.0
+        return {
+            'frames': len(self.scheduled),
+            'agents': self.agents,
+            'sync_error_mean_ms': float(np.nanmean(error)),
+            'sync_error_p95_ms': float(np.nanpercentile(error, 95)),
+            'sync_error_max_ms': float(np.nanmax(error)),
+            'late_frames': self.late_frames,
+            'missing_reports': self.missing_reports
+        }
+
+
+class WallCoordinator:
+    """Hands out panels, broadcasts the frame clock and collects present times"""
+    
+    def __init__(self, layout: WallLayout, address=DEFAULT_ADDRESS,
+                 authkey: bytes = DEFAULT_AUTHKEY, fps: float = 60.0, lead: float = 0.05):
+        self.layout = layout
+        self.fps = fps
+        # How far ahead of its present time a frame is announced
+        self.lead = lead
+        
+        self.listener = Listener(address, authkey=authkey)
+        self.address = self.listener.address
+        self.agents = []  # (name, connection)
+        
+    def accept_agents(self):
+        """Wait for one agent per panel; each gets the next panel and syncs its clock"""
+        while len(self.agents) < len(self.layout.panels):
+            conn = self.listener.accept()
+            hello = conn.recv()
+            index = len(self.agents)
+            conn.send({'index': index, 'layout': self.layout.to_dict()})
+                       
+            # Answer clock probes until the agent has its offset
+            while True:
+                request = conn.recv()
+                if request.get('cmd') == 'clock':
+                    conn.send({'time': time.monotonic()})
+                elif request.get('cmd') == 'ready':
+                    break
+                    
+            name = hello.get('name') or self.layout.panels[index].name
+            self.agents.append((name, conn))
+            print(f"{name}: canvas {self.layout.viewports[index]}, clock offset "
+                  f"{request['offset'] * 1000:.3f} ms (rtt {request['rtt'] * 1000:.3f} ms)")
+                  
+    def run(self, pattern: str, frames: int, params: Optional[Dict] = None) -> WallStats:
+        """Show a pattern for a number of frames, returns every panel's present times"""
+        if pattern not in WALL_PATTERNS:
+            raise ValueError(f"Unknown pattern '{pattern}'")
+            
+        interval = 1.0 / self.fps
+        conns = [conn for _, conn in self.agents]
+        index = {conn: i for i, conn in enumerate(conns)}
+        scheduled = np.zeros(frames)
+        presented = np.full((frames, len(conns)), np.nan)
+        
+        start = time.monotonic() + self.lead
+        for frame in range(frames):
+            present_at = start + frame * interval
+            scheduled[frame] = present_at
+            frame_params = dict(params or {})
+            if pattern in ANIMATED_PATTERNS:
+                frame_params['time_ms'] = frame * interval * 1000.0
+                
+            # Announce no earlier than the lead so agents never queue frames
+            delay = present_at - self.lead - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            message = {'cmd': 'frame', 'frame': frame, 'pattern': pattern,
+                       'params': frame_params, 'present_at': present_at}
+            for conn in conns:
+                conn.send(message)
+                
+            # Every panel reports once it has presented; a silent one is dropped
+            pending = set(conns)
+            deadline = present_at + max(4 * interval, 0.5)
+            while pending:
+                ready = wait(list(pending), timeout=max(deadline - time.monotonic(), 0.0))
+                if not ready:
+                    break
+                for conn in ready:
+                    report = conn.recv()
+                    presented[report['frame'], index[conn]] = report['time']
+                    if report['frame'] == frame:
+                        pending.discard(conn)
+                        
+        return WallStats(self.fps, scheduled, presented, [name for name, _ in self.agents])
+        
+    def close(self):
+        for _, conn in self.agents:
+            try:
+                conn.send({'cmd': 'stop'})
+            except OSError:
+                pass
+            conn.close()
+        self.agents = []
+        self.listener.close()
+
+
+class WallAgent:
+    """One panel: renders its part of the wall and presents it on the coordinator's clock"""
+    
+    def __init__(self, address=DEFAULT_ADDRESS, authkey: bytes = DEFAULT_AUTHKEY,
+                 name: Optional[str] = None, display: bool = True, fullscreen: bool = False):
+        self.address = address
+        self.authkey = authkey
+        self.name = name
+        self.display = display
+        self.fullscreen = fullscreen
+        
+        self.conn = None
+        self.layout = None
+        self.index = None
+        self.offset = 0.0  # coordinator clock minus local clock
+        self.screen = None
+        self._cached = (None, None)  # (pattern key, surface)
+        
+    def sync_clock(self, samples: int = 8) -> Tuple[float, float]:
+        """Offset to the coordinator's clock from the fastest of several probes"""
+        best = None
+        for _ in range(samples):
+            sent = time.monotonic()
+            self.conn.send({'cmd': 'clock'})
+            remote = self.conn.recv()['time']
+            received = time.monotonic()
+            rtt = received - sent
+            if best is None or rtt < best[1]:
+                best = (remote - (sent + received) / 2.0, rtt)
+        self.offset = best[0]
+        return best
+        
+    def connect(self):
+        self.conn = Client(self.address, authkey=self.authkey)
+        self.conn.send({'cmd': 'hello', 'name': self.name})
+        assignment = self.conn.recv()
+        # Every agent builds the same mapping from the same layout
+        self.layout = WallLayout.from_dict(assignment['layout'])
+        self.index = assignment['index']
+        self.name = self.name or self.layout.panels[self.index].name
+        
+        offset, rtt = self.sync_clock()
+        self.conn.send({'cmd': 'ready', 'offset': offset, 'rtt': rtt})
+        
+        size = self.layout.panels[self.index].resolution
+        if self.display:
+            pygame.display.init()
+            flags = pygame.FULLSCREEN if self.fullscreen else 0
+            self.screen = pygame.display.set_mode(size, flags)
+            pygame.display.set_caption(f"NEONpulseTechshop Video Wall - {self.name}")
+        else:
+            self.screen = pygame.Surface(size)
+            
+    def render(self, pattern: str, params: Dict) -> pygame.Surface:
+        """This panel's frame of the pattern; static patterns are rendered once"""
+        key = (pattern, tuple(sorted(params.items())))
+        if self._cached[0] != key:
+            kwargs = dict(params)
+            kernel = WALL_PATTERNS[pattern]
+            if pattern in CANVAS_PATTERNS:
+                # Only the canvas behind this panel, through its mapping
+                kernel = CanvasKernel(kernel, self.layout, self.index)
+                if pattern in EDGE_PATTERNS:
+                    kwargs['viewports'] = self.layout.viewports
+                    
+            width, height = self.layout.panels[self.index].resolution
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            kernel(frame, **kwargs)
+            self._cached = (key, frame_surface(frame).copy())
+        return self._cached[1]
+        
+    def run(self):
+        """Present frames as they are announced until the coordinator stops"""
+        while True:
+            try:
+                message = self.conn.recv()
+            except EOFError:
+                break
+            if message.get('cmd') != 'frame':
+                break
+                
+            surface = self.render(message['pattern'], message['params'])
+            self.screen.blit(surface, (0, 0))
+            
+            # Hold the frame until its slot on the shared clock
+            delay = message['present_at'] - self.offset - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            if self.display:
+                pygame.event.pump()
+                pygame.display.flip()
+            presented = time.monotonic() + self.offset
+            
+            self.conn.send({'cmd': 'presented', 'frame': message['frame'], 'time': presented})
+            
+        self.close()
+        
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if self.display:
+            pygame.display.quit()
+
+
+def run_agent(address=DEFAULT_ADDRESS, authkey: bytes = DEFAULT_AUTHKEY,
+              name: Optional[str] = None, display: bool = True, fullscreen: bool = False):
+    """Agent process entry point"""
+    agent = WallAgent(address, authkey, name, display, fullscreen)
+    agent.connect()
+    agent.run()
+
+
+def run_local_wall(layout: WallLayout, pattern: str = 'sync_bar', frames: int = 120,
+                   fps: float = 60.0, display: bool = False) -> WallStats:
+    """Whole wall on this machine - one agent process per panel"""
+    coordinator = WallCoordinator(layout, ('127.0.0.1', 0), fps=fps)
+    processes = [multiprocessing.Process(target=run_agent,
+                                         args=(coordinator.address, DEFAULT_AUTHKEY, None, display),
+                                         daemon=True)
+                 for _ in layout.panels]
+    for process in processes:
+        process.start()
+        
+    try:
+        coordinator.accept_agents()
+        return coordinator.run(pattern, frames)
+    finally:
+        coordinator.close()
+        for process in processes:
+            process.join(5.0)
+
+
+def print_stats(stats: WallStats):
+    summary = stats.summary()
+    print(f"{summary['frames']} frames on {len(summary['agents'])} panels")
+    print(f"  Sync error: mean {summary['sync_error_mean_ms']:.3f} ms, "
+          f"p95 {summary['sync_error_p95_ms']:.3f} ms, max {summary['sync_error_max_ms']:.3f} ms")
+    print(f"  Late frames: {summary['late_frames']}, missing reports: {summary['missing_reports']}")
+
+
+def main():
+    """Run a coordinator, an agent, or a whole wall locally"""
+    parser = argparse.ArgumentParser(description="NEONpulseTechshop video wall")
+    parser.add_argument('role', choices=['coordinator', 'agent', 'local'])
+    parser.add_argument('--host', default=DEFAULT_ADDRESS[0])
+    parser.add_argument('--port', type=int, default=DEFAULT_ADDRESS[1])
+    parser.add_argument('--rows', type=int, default=1)
+    parser.add_argument('--cols', type=int, default=2)
+    parser.add_argument('--panel', default='1920x1080', help="Panel resolution, WIDTHxHEIGHT")
+    parser.add_argument('--layout', help="Wall layout JSON, instead of a rows x cols grid")
+    parser.add_argument('--pattern', default='sync_bar', choices=sorted(WALL_PATTERNS))
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--fps', type=float, default=60.0)
+    parser.add_argument('--name', help="Agent name shown by the coordinator")
+    parser.add_argument('--windowed', action='store_true', help="Agent in a window, not fullscreen")
+    parser.add_argument('--headless', action='store_true', help="Agents render without a display")
+    args = parser.parse_args()
+    
+    if args.role == 'agent':
+        run_agent((args.host, args.port), name=args.name, display=not args.headless,
+                  fullscreen=not args.windowed)
+        return
+        
+    if args.layout:
+        layout = WallLayout.load(args.layout)
+    else:
+        panel = tuple(int(v) for v in args.panel.lower().split('x'))
+        layout = WallLayout.grid(args.rows, args.cols, panel)
+        
+    if args.role == 'local':
+        stats = run_local_wall(layout, args.pattern, args.frames, args.fps,
+                               display=not args.headless)
+        print_stats(stats)
+        return
+        
+    coordinator = WallCoordinator(layout, (args.host, args.port), fps=args.fps)
+    print(f"Waiting for {len(layout.panels)} agents on {args.host}:{args.port}")
+    try:
+        coordinator.accept_agents()
+        print_stats(coordinator.run(args.pattern, args.frames))
+    except KeyboardInterrupt:
+        sys.exit(0)
+    finally:
+        coordinator.close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
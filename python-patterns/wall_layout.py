@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+NEONpulseTechshop Wall Layout
+Physical panel geometry and the virtual canvas spanning patterns are drawn on
+"""
+
+import json
+import math
+import numpy as np
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROTATIONS = (0, 90, 180, 270)
+
+
+@dataclass
+class PanelLayout:
+    """One panel as mounted on the wall, in millimetres"""
+    name: str
+    resolution: Tuple[int, int]  # pixels the display receives
+    size_mm: Tuple[float, float]  # active area, same orientation as resolution
+    position_mm: Tuple[float, float] = (0.0, 0.0)  # outer top-left corner on the wall
+    bezel_mm: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)  # left, top, right, bottom as mounted
+    rotation: int = 0  # degrees clockwise the panel is turned
+    display: Optional[int] = None  # display index showing this panel
+    
+    @property
+    def mounted_size_mm(self) -> Tuple[float, float]:
+        """Active area as it hangs on the wall"""
+        width, height = self.size_mm
+        return (height, width) if self.rotation in (90, 270) else (width, height)
+        
+    @property
+    def active_origin_mm(self) -> Tuple[float, float]:
+        return self.position_mm[0] + self.bezel_mm[0], self.position_mm[1] + self.bezel_mm[1]
+        
+    @property
+    def outer_size_mm(self) -> Tuple[float, float]:
+        width, height = self.mounted_size_mm
+        left, top, right, bottom = self.bezel_mm
+        return left + width + right, top + height + bottom
+        
+    @property
+    def pixels_per_mm(self) -> float:
+        return max(self.resolution[0] / self.size_mm[0], self.resolution[1] / self.size_mm[1])
+        
+    @classmethod
+    def from_dict(cls, data: Dict, index: int = 0) -> 'PanelLayout':
+        bezel = data.get('bezel_mm', 0.0)
+        if isinstance(bezel, (int, float)):
+            bezel = (bezel,) * 4
+        rotation = int(data.get('rotation', 0)) % 360
+        if rotation not in ROTATIONS:
+            raise ValueError(f"Panel rotation must be one of {ROTATIONS}, got {rotation}")
+        return cls(name=data.get('name', f"Panel {index + 1}"),
+                   resolution=tuple(int(v) for v in data['resolution']),
+                   size_mm=tuple(float(v) for v in data['size_mm']),
+                   position_mm=tuple(float(v) for v in data.get('position_mm', (0.0, 0.0))),
+                   bezel_mm=tuple(float(v) for v in bezel),
+                   rotation=rotation,
+                   display=data.get('display'))
+                   
+    def to_dict(self) -> Dict:
+        return {'name': self.name, 'resolution': list(self.resolution),
+                'size_mm': list(self.size_mm), 'position_mm': list(self.position_mm),
+                'bezel_mm': list(self.bezel_mm), 'rotation': self.rotation,
+                'display': self.display}
+
+
+@dataclass
+class PanelMapping:
+    """Canvas pixel behind every panel pixel, as one index vector per axis"""
+    viewport: Tuple[int, int, int, int]  # canvas rect covering the active area
+    rows: np.ndarray  # canvas rows, relative to the viewport
+    cols: np.ndarray  # canvas columns, relative to the viewport
+    transpose: bool  # canvas rows follow panel columns (turned 90 or 270)
+    
+    def __post_init__(self):
+        # Panel pixels are canvas pixels one to one - a plain slice will do
+        self.identity = (not self.transpose and
+                         np.array_equal(self.rows, np.arange(len(self.rows))) and
+                         np.array_equal(self.cols, np.arange(len(self.cols))))
+                         
+    def frame(self, tile: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Panel frame from the canvas pixels inside the viewport"""
+        if self.identity:
+            pixels = tile[:len(self.rows), :len(self.cols)]
+        else:
+            pixels = tile[np.ix_(self.rows, self.cols)]
+            if self.transpose:
+                pixels = pixels.transpose(1, 0, 2)
+        if out is None:
+            return np.ascontiguousarray(pixels)
+        out[:] = pixels
+        return out
+
+
+class CanvasKernel:
+    """A canvas pattern kernel that renders one panel: its viewport only, then its mapping"""
+    
+    def __init__(self, kernel: Callable, layout: 'WallLayout', index: int):
+        self.kernel = kernel
+        self.layout = layout
+        self.index = index
+        
+    def __call__(self, out: np.ndarray, **params):
+        mapping = self.layout.mappings[self.index]
+        x, y, width, height = mapping.viewport
+        params.update(origin=(x, y), desktop=self.layout.canvas_size)
+        
+        # Panels that show canvas pixels one to one are drawn in place
+        if mapping.identity and out.shape[:2] == (height, width):
+            self.kernel(out, **params)
+            return
+        tile = np.empty((height, width, 3), dtype=np.uint8)
+        self.kernel(tile, **params)
+        mapping.frame(tile, out)
+        
+    # Jobs for the same panel of the same layout share a cache entry
+    def __eq__(self, other):
+        return (isinstance(other, CanvasKernel) and self.kernel == other.kernel and
+                self.layout is other.layout and self.index == other.index)
+                
+    def __hash__(self):
+        return hash((self.kernel, id(self.layout), self.index))
+
+
+def _axis(count: int, start_mm: float, length_mm: float, scale: float, offset: int,
+          extent: int, reverse: bool) -> np.ndarray:
+    """Canvas index under the centre of each of count pixels along one axis"""
+    centers = (np.arange(count) + 0.5) / count
+    if reverse:
+        centers = centers[::-1]
+    index = np.floor((start_mm + centers * length_mm) * scale).astype(np.intp) - offset
+    return np.clip(index, 0, extent - 1)
+
+
+@dataclass
+class WallLayout:
+    """Panels on one physical canvas; bezels hide the canvas pixels behind them"""
+    panels: List[PanelLayout]
+    pixels_per_mm: Optional[float] = None  # canvas resolution, finest panel by default
+    name: str = "Video wall"
+    canvas_size: Tuple[int, int] = field(init=False)
+    viewports: Tuple[Tuple[int, int, int, int], ...] = field(init=False)
+    mappings: List[PanelMapping] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        if not self.panels:
+            raise ValueError("A wall layout needs at least one panel")
+        self.scale = self.pixels_per_mm or max(panel.pixels_per_mm for panel in self.panels)
+        
+        # Canvas covers every panel including its bezels, at one scale throughout
+        left = min(panel.position_mm[0] for panel in self.panels)
+        top = min(panel.position_mm[1] for panel in self.panels)
+        right = max(panel.position_mm[0] + panel.outer_size_mm[0] for panel in self.panels)
+        bottom = max(panel.position_mm[1] + panel.outer_size_mm[1] for panel in self.panels)
+        self.origin_mm = (left, top)
+        self.canvas_size = (math.ceil((right - left) * self.scale - 1e-6),
+                            math.ceil((bottom - top) * self.scale - 1e-6))
+                            
+        # Built once; every frame after this is a gather through the vectors
+        self.mappings = [self._mapping(panel) for panel in self.panels]
+        self.viewports = tuple(mapping.viewport for mapping in self.mappings)
+        
+    def _mapping(self, panel: PanelLayout) -> PanelMapping:
+        x_mm = panel.active_origin_mm[0] - self.origin_mm[0]
+        y_mm = panel.active_origin_mm[1] - self.origin_mm[1]
+        width_mm, height_mm = panel.mounted_size_mm
+        
+        x0 = max(math.floor(x_mm * self.scale + 1e-6), 0)
+        y0 = max(math.floor(y_mm * self.scale + 1e-6), 0)
+        x1 = min(math.ceil((x_mm + width_mm) * self.scale - 1e-6), self.canvas_size[0])
+        y1 = min(math.ceil((y_mm + height_mm) * self.scale - 1e-6), self.canvas_size[1])
+        viewport = (x0, y0, x1 - x0, y1 - y0)
+        
+        # Which panel axis runs along each canvas axis, and in which direction
+        width, height = panel.resolution
+        across, down, transpose, flip_x, flip_y = {
+            0: (width, height, False, False, False),
+            90: (height, width, True, True, False),
+            180: (width, height, False, True, True),
+            270: (height, width, True, False, True)
+        }[panel.rotation]
+        cols = _axis(across, x_mm, width_mm, self.scale, x0, viewport[2], flip_x)
+        rows = _axis(down, y_mm, height_mm, self.scale, y0, viewport[3], flip_y)
+        return PanelMapping(viewport, rows, cols, transpose)
+        
+    def panel_kernels(self, kernel: Callable) -> List[CanvasKernel]:
+        """One kernel per panel; the canvas as a whole is never allocated"""
+        return [CanvasKernel(kernel, self, index) for index in range(len(self.panels))]
+        
+    def for_displays(self, monitors) -> 'WallLayout':
+        """Layout of the panels on these monitors, in monitor order at their real resolutions"""
+        by_display = {panel.display: panel for panel in self.panels if panel.display is not None}
+        panels = []
+        for i, monitor in enumerate(monitors):
+            panel = by_display.get(monitor.index)
+            if panel is None and not by_display and i < len(self.panels):
+                panel = self.panels[i]  # no display indices given, take panels in order
+            if panel is None:
+                raise ValueError(f"Layout '{self.name}' has no panel for {monitor.name}")
+            panels.append(replace(panel, resolution=tuple(monitor.resolution),
+                                  display=monitor.index))
+        return WallLayout(panels, self.pixels_per_mm, self.name)
+        
+    @classmethod
+    def from_monitors(cls, monitors) -> 'WallLayout':
+        """Pixel positions only, one millimetre per pixel and no bezels"""
+        return cls([PanelLayout(monitor.name, tuple(monitor.resolution),
+                                tuple(float(v) for v in monitor.resolution),
+                                tuple(float(v) for v in monitor.position),
+                                display=monitor.index)
+                    for monitor in monitors], pixels_per_mm=1.0, name="Desktop")
+                    
+    @classmethod
+    def grid(cls, rows: int, cols: int, resolution: Tuple[int, int],
+             size_mm: Optional[Tuple[float, float]] = None, bezel_mm: float = 0.0) -> 'WallLayout':
+        """rows x cols identical panels, row-major"""
+        size_mm = size_mm or tuple(float(v) for v in resolution)
+        pitch_x, pitch_y = size_mm[0] + 2 * bezel_mm, size_mm[1] + 2 * bezel_mm
+        return cls([PanelLayout(f"Panel {row * cols + col + 1}", tuple(resolution), size_mm,
+                                (col * pitch_x, row * pitch_y), (bezel_mm,) * 4)
+                    for row in range(rows) for col in range(cols)],
+                   name=f"{rows}x{cols} wall")
+                   
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'WallLayout':
+        return cls([PanelLayout.from_dict(panel, i) for i, panel in enumerate(data['panels'])],
+                   data.get('pixels_per_mm'), data.get('name', "Video wall"))
+                   
+    def to_dict(self) -> Dict:
+        return {'name': self.name, 'pixels_per_mm': self.pixels_per_mm,
+                'panels': [panel.to_dict() for panel in self.panels]}
+                
+    @classmethod
+    def load(cls, filename: str) -> 'WallLayout':
+        with open(filename) as f:
+            return cls.from_dict(json.load(f))
+            
+    def save(self, filename: str):
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
\ No newline at end of file